@@ -1,3 +1,6 @@
+from contextlib import contextmanager
+import threading
+import time
 import pyodbc
 import os
 from dotenv import load_dotenv
@@ -14,14 +17,37 @@ class DatabaseConnector:
     """
     A class for setting up a connection to a SQL Server database.
 
+    Connections are borrowed from a connection pool that is shared by every DatabaseConnector, so a query doesn't
+    pay for a new login when an idle connection is open. Idle connections are checked with a "SELECT 1" before they
+    are used again if they were idle for more than LIVENESS_CHECK_AFTER seconds. Connections idle for more than
+    IDLE_TIMEOUT seconds are closed the next time a connection is borrowed or returned. close_pool closes every idle
+    connection and is called when the app closes.
+
      Attributes:
         - connection (pyodbc.connect): Connection for a Database
      Methods:
         - connection_string(): Returns the connection string for SQL Server.
-        - connect(): Connects to the SQL Server database.
-        - close_conn(): Closes the connection to the SQL Server database if it's open.
+        - connect(): Borrows a connection to the SQL Server database from the connection pool.
+        - close_conn(): Returns the connection to the connection pool if it's open.
+        - pooled_connection(): Context manager that borrows a connection from the connection pool.
+        - configure_pool(): Sets the size and idle timeout of the connection pool.
+        - close_pool(): Closes every idle connection in the connection pool.
     """
 
+    # Largest number of idle connections kept in the connection pool. Connections returned to a full pool are closed.
+    POOL_SIZE = 4
+
+    # Number of seconds an idle connection is kept open. Expired connections are closed when a connection is borrowed
+    # or returned.
+    IDLE_TIMEOUT = 300
+
+    # Number of seconds a connection can be idle before it's checked with a "SELECT 1" when borrowed.
+    LIVENESS_CHECK_AFTER = 30
+
+    # Idle connections in the connection pool. Every item is a tuple of the connection and the time it was returned.
+    _pool = []
+    _pool_lock = threading.Lock()
+
     def __init__(self):
         """Initialize a new DatabaseConnector instance."""
         self.connection = None
@@ -36,16 +62,170 @@ class DatabaseConnector:
         return f'Driver={{SQL Server}};Server={SERVER_NAME};Database={DATABASE_NAME};UID={UID};PWD={PWD};Trusted_Connection=no'
 
     def connect(self) -> None:
-        """Connect to SQL Server.
+        """Borrow a connection to SQL Server from the connection pool.
 
         Raises:
-            pyodbc.Error: If the connection fails.
+            pyodbc.Error: If a new connection is needed and the connection fails.
         """
-        self.connection = pyodbc.connect(self.connection_string)
+        self.connection = self._acquire()
 
     def close_conn(self) -> None:
-        """Close Connection to SQL Server if its open"""
+        """Return the connection to the connection pool if its open"""
         if self.connection:
-            self.connection.close()
+            self._release(self.connection)
+            self.connection = None
+
+    @contextmanager
+    def pooled_connection(self):
+        """Borrow a connection from the connection pool for the length of a with block.
+
+        The connection is returned to the connection pool when the block ends. Uncommitted changes are rolled back. A
+        connection that raised a pyodbc.Error is closed instead, since it might be broken.
+
+        Yields:
+            pyodbc.Connection: The borrowed connection.
+
+        Raises:
+            pyodbc.Error: If a new connection is needed and the connection fails.
+        """
+        connection = self._acquire()
+        try:
+            yield connection
+        except pyodbc.Error:
+            DatabaseConnector._close_quietly(connection)
+            raise
+        except BaseException:
+            self._release(connection)
+            raise
+        else:
+            self._release(connection)
+
+    @classmethod
+    def configure_pool(cls, pool_size: int = None, idle_timeout: int = None) -> None:
+        """Set the size and idle timeout of the connection pool.
+
+        Args:
+            pool_size: Largest number of idle connections kept. (Default: None [Unchanged])
+            idle_timeout: Number of seconds an idle connection is kept open. (Default: None [Unchanged])
+
+        Raises:
+            ValueError: If pool_size or idle_timeout is less than 0.
+        """
+        for name, value in (("pool_size", pool_size), ("idle_timeout", idle_timeout)):
+            if value is not None and value < 0:
+                raise ValueError(f"{name} can't be less than 0.")
+
+        with cls._pool_lock:
+            if pool_size is not None:
+                cls.POOL_SIZE = pool_size
+            if idle_timeout is not None:
+                cls.IDLE_TIMEOUT = idle_timeout
+
+            # Close the connections that no longer fit in the connection pool.
+            while len(cls._pool) > cls.POOL_SIZE:
+                cls._close_quietly(cls._pool.pop(0)[0])
+
+    @classmethod
+    def close_pool(cls) -> None:
+        """Close every idle connection in the connection pool."""
+        with cls._pool_lock:
+            idle_connections = [connection for connection, _ in cls._pool]
+            cls._pool.clear()
+
+        for connection in idle_connections:
+            cls._close_quietly(connection)
+
+    def _acquire(self) -> pyodbc.Connection:
+        """Get a live connection from the connection pool, or open a new one if there is none.
+
+        Returns:
+            pyodbc.Connection: The connection.
 
+        Raises:
+            pyodbc.Error: If a new connection is needed and the connection fails.
+        """
+        DatabaseConnector._close_expired()
+
+        while True:
+            with DatabaseConnector._pool_lock:
+                if not DatabaseConnector._pool:
+                    break
+                # The most recently returned connection is the most likely to still be alive.
+                connection, returned_time = DatabaseConnector._pool.pop()
+
+            idle_seconds = time.monotonic() - returned_time
+            if idle_seconds > DatabaseConnector.IDLE_TIMEOUT:
+                DatabaseConnector._close_quietly(connection)
+                continue
+
+            if idle_seconds <= DatabaseConnector.LIVENESS_CHECK_AFTER or DatabaseConnector._is_alive(connection):
+                return connection
+
+            DatabaseConnector._close_quietly(connection)
+
+        return pyodbc.connect(self.connection_string)
+
+    @classmethod
+    def _release(cls, connection: pyodbc.Connection) -> None:
+        """Return a connection to the connection pool. The connection is closed if the pool is full or if the
+        connection is broken.
+
+        Args:
+            connection: The borrowed connection.
+        """
+        try:
+            connection.rollback()
+        except pyodbc.Error:
+            cls._close_quietly(connection)
+            return
+
+        cls._close_expired()
+
+        with cls._pool_lock:
+            if len(cls._pool) < cls.POOL_SIZE:
+                cls._pool.append((connection, time.monotonic()))
+                return
 
+        cls._close_quietly(connection)
+
+    @classmethod
+    def _close_expired(cls) -> None:
+        """Close the idle connections that were returned more than IDLE_TIMEOUT seconds ago."""
+        expired_time = time.monotonic() - cls.IDLE_TIMEOUT
+        with cls._pool_lock:
+            expired_connections = [connection for connection, returned_time in cls._pool
+                                   if returned_time < expired_time]
+            cls._pool[:] = [(connection, returned_time) for connection, returned_time in cls._pool
+                            if returned_time >= expired_time]
+
+        for connection in expired_connections:
+            cls._close_quietly(connection)
+
+    @staticmethod
+    def _is_alive(connection: pyodbc.Connection) -> bool:
+        """Check if a connection can still run a query.
+
+        Args:
+            connection: The connection to check.
+
+        Returns:
+            bool: True if the connection is alive.
+        """
+        try:
+            connection.cursor().execute("SELECT 1").fetchone()
+        except pyodbc.Error:
+            return False
+
+        return True
+
+    @staticmethod
+    def _close_quietly(connection: pyodbc.Connection) -> None:
+        """Close a connection and ignore the error if it's already broken.
+
+        Args:
+            connection: The connection to close.
+        """
+        try:
+            connection.close()
+        except pyodbc.Error:
+            pass
@@ -1,4 +1,9 @@
-from Database_Connector import DatabaseConnector
+import json
+import os
+import threading
+import time
+from settings_store import SettingsStore
+from sqlite_settings_store import SqliteSettingsStore
 from utils import type_check
 
 
@@ -7,30 +12,91 @@ class SettingsData:
     A class for updating and reading all Setting Values to and from the Database.
 
      Attributes:
-        - connector -  An instance of the DatabaseConnector class that is used to connect to and interact
-            with a database
+        - store - The SettingsStore that holds the setting values. Every SettingsData with the same store name shares
+            1 store. (See VALID_STORES)
+
+     The setting values are kept in a store. "sqlserver" reads the SQL Server database, "sqlite" reads a local SQLite
+     file and "replica" reads a local SQLite file that is synced from the SQL Server database in the background. Set
+     SETTINGS_STORE to pick the store.
+
+     Every table holds 1 row for every named settings profile (Ex. a station pair or a keyword), indexed by the
+     ProfileName column. Every method reads and writes the DEFAULT_PROFILE unless a profile name is passed in.
+
+     Setting values are cached in memory and in a local cache file that several clients can share. A cached profile
+     is used without asking the store for CACHE_TTL seconds after it was last checked. After that, the version of the
+     profile is compared with the cached version and the profile is only read again if it changed. update_database
+     writes the new values through to the cache.
 
      Methods:
         - get_bot_sla_data: Returns the SLA/Bot Report Setting values that were retrieved from the database.
         - get_home_delivery_data: Returns the Home Delivery Setting values that were retrieved from the database.
         - get_setting_data: Gets all the data from a table in the database and stores it in a dictionary.
+        - get_settings_groups: Gets the data of a profile in several tables from 1 connection in 1 batch.
         - update_database: Updates the current SLA/Bot Setting Values and/or the current Home
           Delivery Setting values to the database.
+        - get_profile_names: Gets the names of every settings profile of a table.
+        - clear_cache: Clears the cached setting values.
+        - get_store: Gets the shared SettingsStore of a store name.
     """
 
     BOT_SLA_REPORT_TABLE_NAME = "BotReportSettings"
     HOME_REPORT_TABLE_NAME = "HomeReportSettings"
 
-    def __init__(self):
+    # Setting Columns constant which contains the table name and the columns that are read from that table. Add a
+    # table here to make it a setting group.
+    SETTING_COLUMNS = {
+        BOT_SLA_REPORT_TABLE_NAME: ["DayAmount", "NumOfMonths", "NumOfDays", "FromAirport", "ToAirport"],
+        HOME_REPORT_TABLE_NAME: ["Keyword", "NumOfMonths", "NumOfDays", "FromAirport", "ToAirport"],
+    }
+
+    # Profile used when no profile name is passed in. (The row every table had before there were profiles)
+    DEFAULT_PROFILE = "Default"
+
+    # Valid Stores constant which contains the store name and the method that creates that store.
+    VALID_STORES = {
+        "sqlserver": "_create_sql_server_store",
+        "sqlite": "_create_sqlite_store",
+        "replica": "_create_replica_store",
+    }
+
+    # Store used when no store name is passed in.
+    DEFAULT_STORE = os.getenv("SETTINGS_STORE", "sqlserver")
+
+    # Local SQLite file used by the "sqlite" store.
+    SQLITE_FILE = os.getenv("SETTINGS_SQLITE_FILE", "Settings.sqlite3")
+
+    # Local SQLite file used by the "replica" store. It is kept apart from SQLITE_FILE, so switching between the
+    # stores never mixes the replicated profiles with the local profiles.
+    REPLICA_FILE = os.getenv("SETTINGS_REPLICA_FILE", "Settings Replica.sqlite3")
+
+    # Stores already created in this session. The keys are the store names and the values are the stores.
+    _stores = {}
+    _stores_lock = threading.Lock()
+
+    # Number of seconds cached setting values are used without checking the version of the table.
+    CACHE_TTL = 60
+
+    # Local cache file shared by every client that points to the same file. (Set SETTINGS_CACHE_FILE to share it)
+    CACHE_FILE = os.getenv("SETTINGS_CACHE_FILE", "Settings Cache.json")
+
+    # Cached setting values. The keys are the table name and profile name (Ex. 'BotReportSettings/Default') and the
+    # values are dictionaries of the profile version, the time the version was last checked and the setting values.
+    _settings_cache = {}
+    _cache_lock = threading.Lock()
+
+    def __init__(self, store_name: str = None):
         """
          Initializes a SettingsData Object.
 
-         Creates a new instance of the DatabaseConnector class and assigns it to the `connector` attribute
+         Gets the shared SettingsStore of the store name and assigns it to the `store` attribute
+         :param store_name: Name of the store. (Valid Stores: 'sqlserver', 'sqlite' or 'replica')
+            (Default: None [SettingsData.DEFAULT_STORE])
+         :raise KeyError: Will raise error if the store name is not valid.
         """
 
-        self.connector = DatabaseConnector()
+        self.store = SettingsData.get_store(store_name)
 
-    def get_bot_sla_data(self) -> dict:
+    def get_bot_sla_data(self, profile_name: str = None) -> dict:
         """
         Gets all the values from the Bot/SLA table in the database.
 
@@ -38,11 +104,12 @@ class SettingsData:
         stored setting values for the SLA/Bot Settings. It returns it as a dictionary where the keys are the
         column names and the values are the values for that column.
 
+        :param profile_name: Name of the settings profile. (Default: None [SettingsData.DEFAULT_PROFILE])
         :return: Returns a dictionary of values for the SLA/Bot settings.
         """
-        return self.get_setting_data(self.BOT_SLA_REPORT_TABLE_NAME)
+        return self.get_setting_data(self.BOT_SLA_REPORT_TABLE_NAME, profile_name=profile_name)
 
-    def get_home_delivery_data(self) -> dict:
+    def get_home_delivery_data(self, profile_name: str = None) -> dict:
         """
        Gets all the values from the Home Delivery table in the database.
 
@@ -50,11 +117,12 @@ class SettingsData:
        stored setting values for the Home Delivery Settings. It returns it as a dictionary where the keys are the
        column names and the values are the values for that column.
 
+       :param profile_name: Name of the settings profile. (Default: None [SettingsData.DEFAULT_PROFILE])
        :return: Returns a dictionary of values for the SLA/Bot settings.
        """
-        return self.get_setting_data(self.HOME_REPORT_TABLE_NAME)
+        return self.get_setting_data(self.HOME_REPORT_TABLE_NAME, profile_name=profile_name)
 
-    def get_setting_data(self, table_name: str) -> dict:
+    def get_setting_data(self, table_name: str, profile_name: str = None) -> dict:
         """
         Gets all the specified table data and returns the table data as a dictionary
 
@@ -66,41 +134,90 @@ class SettingsData:
 
         :param table_name: The name of the table to retrieve data from. Valid values are
         "BotReportSettings and HomeReportSettings
+        :param profile_name: Name of the settings profile. (Default: None [SettingsData.DEFAULT_PROFILE])
         :return Returns a dictionary of values for the specified table.
         :raise TypeError: Will raise an error if the table name is not of type string or will raise ValueError if
                 you try to update a table that is not in the Database. Valid table names
                 (BotReportSettings or HomeReportSettings)
+        :raise KeyError: Will raise error if the table has no row for the profile.
         """
-        type_check(arg=table_name, arg_name="table_name", expected_type=str)
-
-        valid_tables = [self.HOME_REPORT_TABLE_NAME, self.BOT_SLA_REPORT_TABLE_NAME]
+        return self.get_settings_groups(table_names=[table_name], profile_name=profile_name)[table_name]
 
-        if table_name not in valid_tables:
-            raise ValueError(f"{table_name} is an invalid table name. Please only update the 2 "
-                             f"tables provided {self.BOT_SLA_REPORT_TABLE_NAME} or {self.HOME_REPORT_TABLE_NAME}")
-
-        self.connector.connect()
-        cursor = self.connector.connection.cursor()
-
-        cursor.execute(f"SELECT * FROM {table_name}")
-        row = cursor.fetchone()
-
-        column_names = [column_name[0] for column_name in cursor.description]
-        settings_data = {column_names[i]: row[i] for i in range(len(column_names))}
-
-        self.connector.close_conn()
-
-        return settings_data
-
-    def update_database(self, table_name: str, **kwargs) -> None:
+    def get_settings_groups(self, table_names: list = None, profile_name: str = None) -> dict:
+        """
+        Gets the data of a settings profile in several setting tables from 1 connection.
+
+        Cached profiles that were checked less than CACHE_TTL seconds ago are not read. The versions of the profile in
+        every other table are read from the store, along with the tables that changed. (The SQL Server store reads the
+        versions in 1 query and the tables in 1 batch with a result set for every table. The row of the profile is
+        found through the ProfileName index.) Only the columns in SETTING_COLUMNS are read.
+
+        :param table_names: The names of the tables to retrieve data from. (Default: None [Every table in
+            SETTING_COLUMNS])
+        :param profile_name: Name of the settings profile. (Default: None [SettingsData.DEFAULT_PROFILE])
+        :return: Returns a dictionary where the keys are the table names and the values are dictionaries of values
+            for that table. Every value is None if the table has no row for the default profile.
+        :raise TypeError: Will raise an error if a table name or the profile name is not of type string or will raise
+                ValueError if a table is not in the Database. Valid table names (BotReportSettings or
+                HomeReportSettings)
+        :raise KeyError: Will raise error if a table has no row for the profile. (Other than the default profile)
+        """
+        table_names = table_names if table_names is not None else list(self.SETTING_COLUMNS.keys())
+        profile_name = profile_name if profile_name is not None else SettingsData.DEFAULT_PROFILE
+        type_check(arg=profile_name, arg_name="profile_name", expected_type=str)
+
+        for table_name in table_names:
+            type_check(arg=table_name, arg_name="table_name", expected_type=str)
+
+            if table_name not in self.SETTING_COLUMNS.keys():
+                raise ValueError(f"{table_name} is an invalid table name. Please only use the tables provided "
+                                 f"{' or '.join(self.SETTING_COLUMNS.keys())}")
+
+        settings_groups = {}
+        stale_tables = {}
+        for table_name in table_names:
+            cached_table = SettingsData._get_cached_table(SettingsData._get_cache_key(table_name, profile_name))
+            if cached_table is not None and time.time() - cached_table["checked"] <= SettingsData.CACHE_TTL:
+                settings_groups[table_name] = dict(cached_table["values"])
+            else:
+                stale_tables[table_name] = cached_table
+
+        if not stale_tables:
+            return settings_groups
+
+        versions, fetched_tables = self.store.read_tables(
+            {table_name: cached_table["version"] if cached_table is not None else None
+             for table_name, cached_table in stale_tables.items()}, profile_name)
+
+        for table_name, cached_table in stale_tables.items():
+            if table_name not in fetched_tables:
+                settings_data = cached_table["values"]
+            elif fetched_tables[table_name] is not None:
+                settings_data = fetched_tables[table_name]
+            elif profile_name == SettingsData.DEFAULT_PROFILE:
+                settings_data = dict.fromkeys(self.SETTING_COLUMNS[table_name])
+            else:
+                raise KeyError(f"{profile_name} is not a settings profile of {table_name}. Valid profiles are "
+                               f"{' or '.join(self.store.read_profile_names(table_name))}")
+
+            SettingsData._store_cached_table(SettingsData._get_cache_key(table_name, profile_name),
+                                             versions[table_name], settings_data)
+
+            # A copy is returned, since callers update the dictionary.
+            settings_groups[table_name] = dict(settings_data)
+
+        return settings_groups
+
+    def update_database(self, table_name: str, profile_name: str = None, **kwargs) -> None:
         """
         This will update the setting values for the specified table in the database.
         This method will take a table_name as an argument and update the kwarg values in the setting window
         to the specified table in the database. The method will also ensure the proper types are inputted for
-        the **kwargs, or it will raise an exception.
+        the **kwargs, or it will raise an exception. A profile that doesn't exist yet is added to the table.
 
         Args:
             - table_name: The database table name that you want to update.
+            - profile_name: Name of the settings profile. (Default: None [SettingsData.DEFAULT_PROFILE])
             - **kwargs: Additional keyword arguments that can be passed to the function (required).
 
         Keyword Args:
@@ -113,6 +230,9 @@ class SettingsData:
 
         :raise ValueError: Will raise error if the table is not in the Database.
         """
+        profile_name = profile_name if profile_name is not None else SettingsData.DEFAULT_PROFILE
+        type_check(arg=profile_name, arg_name="profile_name", expected_type=str)
+
         day_amount = kwargs.get("DayAmount")
         num_of_months = kwargs.get("NumOfMonths")
         num_of_days = kwargs.get("NumOfDays")
@@ -136,19 +256,164 @@ class SettingsData:
         valid_table_names = [self.HOME_REPORT_TABLE_NAME, self.BOT_SLA_REPORT_TABLE_NAME]
 
         if table_name in valid_table_names:
-            self.connector.connect()
-            cursor = self.connector.connection.cursor()
-
             if table_name == self.BOT_SLA_REPORT_TABLE_NAME:
-                cursor.execute(f"UPDATE {table_name} SET DayAmount = ?, NumOfMonths = ?, "
-                               f"NumOfDays = ?, FromAirport = ?, ToAirport = ?;",
-                               (day_amount, num_of_months, num_of_days, from_airport, to_airport))
-            elif table_name == self.HOME_REPORT_TABLE_NAME:
-                cursor.execute(f"UPDATE {table_name} SET Keyword = ?, NumOfMonths = ?, "
-                               f"NumOfDays = ?, FromAirport = ?, ToAirport = ?;",
-                               (keywords, num_of_months, num_of_days, from_airport, to_airport))
-            self.connector.connection.commit()
-            self.connector.close_conn()
+                updated_values = {"DayAmount": day_amount, "NumOfMonths": num_of_months,
+                                  "NumOfDays": num_of_days, "FromAirport": from_airport, "ToAirport": to_airport}
+            else:
+                updated_values = {"Keyword": keywords, "NumOfMonths": num_of_months, "NumOfDays": num_of_days,
+                                  "FromAirport": from_airport, "ToAirport": to_airport}
+
+            version = self.store.write_table(table_name, updated_values, profile_name)
+
+            # Write the new values through to the cache. A profile that was never read is read on the next get.
+            cache_key = SettingsData._get_cache_key(table_name, profile_name)
+            cached_table = SettingsData._get_cached_table(cache_key)
+            if cached_table is not None:
+                SettingsData._store_cached_table(cache_key, version, {**cached_table["values"], **updated_values})
         else:
             raise ValueError(f"{table_name} is an invalid table name. Please only update the 2 "
                              f"tables provided {self.BOT_SLA_REPORT_TABLE_NAME} or {self.HOME_REPORT_TABLE_NAME}")
+
+    def get_profile_names(self, table_name: str) -> list:
+        """
+        Gets the names of every settings profile of a table. The names are always read from the store.
+        :param table_name: The name of the table. Valid values are BotReportSettings and HomeReportSettings
+        :return: Returns a sorted list of the profile names.
+        :raise ValueError: Will raise error if the table is not in the Database.
+        """
+        if table_name not in self.SETTING_COLUMNS.keys():
+            raise ValueError(f"{table_name} is an invalid table name. Please only use the tables provided "
+                             f"{' or '.join(self.SETTING_COLUMNS.keys())}")
+
+        return self.store.read_profile_names(table_name)
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """
+        Clears the cached setting values in memory and in the local cache file.
+        """
+        with cls._cache_lock:
+            cls._settings_cache.clear()
+            if os.path.exists(cls.CACHE_FILE):
+                os.remove(cls.CACHE_FILE)
+
+    @classmethod
+    def get_store(cls, store_name: str = None) -> SettingsStore:
+        """
+        Gets the shared SettingsStore of a store name. The store is created the first time it is needed. The
+        "replica" store starts syncing in the background when it is created.
+        :param store_name: Name of the store. (Valid Stores: 'sqlserver', 'sqlite' or 'replica')
+            (Default: None [SettingsData.DEFAULT_STORE])
+        :return: Returns the SettingsStore.
+        :raise KeyError: Will raise error if the store name is not valid.
+        """
+        store_name = store_name if store_name is not None else cls.DEFAULT_STORE
+        if store_name not in cls.VALID_STORES.keys():
+            raise KeyError(f"{store_name} is not a valid settings store. Valid stores are "
+                           f"{' or '.join(cls.VALID_STORES.keys())}")
+
+        with cls._stores_lock:
+            if store_name not in cls._stores:
+                cls._stores[store_name] = getattr(cls, cls.VALID_STORES[store_name])()
+
+            return cls._stores[store_name]
+
+    @classmethod
+    def _create_sql_server_store(cls) -> SettingsStore:
+        """
+        Creates the SQL Server store.
+        :return: Returns the SqlServerSettingsStore.
+        """
+        # Imported here, so the SQLite store can be used without pyodbc.
+        from sql_server_settings_store import SqlServerSettingsStore
+        return SqlServerSettingsStore(cls.SETTING_COLUMNS)
+
+    @classmethod
+    def _create_sqlite_store(cls) -> SqliteSettingsStore:
+        """
+        Creates the local SQLite store.
+        :return: Returns the SqliteSettingsStore.
+        """
+        return SqliteSettingsStore(cls.SETTING_COLUMNS, file_path=cls.SQLITE_FILE)
+
+    @classmethod
+    def _create_replica_store(cls) -> SqliteSettingsStore:
+        """
+        Creates the local SQLite replica of the SQL Server store and starts syncing it in the background.
+        :return: Returns the SqliteSettingsStore.
+        """
+        # Imported here, so the SQLite store can be used without pyodbc.
+        from sql_server_settings_store import SqlServerSettingsStore
+        replica_store = SqliteSettingsStore(cls.SETTING_COLUMNS, file_path=cls.REPLICA_FILE,
+                                            source=SqlServerSettingsStore(cls.SETTING_COLUMNS))
+        replica_store.start_sync()
+        return replica_store
+
+    @staticmethod
+    def _get_cache_key(table_name: str, profile_name: str) -> str:
+        """
+        Gets the cache key of a profile in a table.
+        :param table_name: The name of the table.
+        :param profile_name: Name of the profile.
+        :return: Returns the cache key. (Ex. 'BotReportSettings/Default')
+        """
+        return f"{table_name}/{profile_name}"
+
+    @classmethod
+    def _get_cached_table(cls, cache_key: str):
+        """
+        Gets the cached values of a profile. The local cache file is used if it was checked more recently than the
+        values in memory (Ex. by another client).
+        :param cache_key: The cache key of the profile. (See _get_cache_key)
+        :return: Returns a dictionary of the profile version, the time it was checked and the setting values. Returns
+            None if the profile is not cached.
+        """
+        with cls._cache_lock:
+            cached_table = cls._settings_cache.get(cache_key)
+            if cached_table is not None and time.time() - cached_table["checked"] <= cls.CACHE_TTL:
+                return cached_table
+
+            file_table = cls._read_cache_file().get(cache_key)
+
+            if file_table is not None and (cached_table is None or file_table["checked"] > cached_table["checked"]):
+                cached_table = cls._settings_cache[cache_key] = file_table
+
+            return cached_table
+
+    @classmethod
+    def _store_cached_table(cls, cache_key: str, version: str, values: dict) -> None:
+        """
+        Stores the values of a profile in memory and in the local cache file.
+        :param cache_key: The cache key of the profile. (See _get_cache_key)
+        :param version: Version of the profile.
+        :param values: The setting values of the profile.
+        """
+        with cls._cache_lock:
+            cls._settings_cache[cache_key] = {"version": version, "checked": time.time(), "values": dict(values)}
+
+            file_cache = cls._read_cache_file()
+            file_cache[cache_key] = cls._settings_cache[cache_key]
+
+            # Write to a temporary file first, so another client never reads a half written cache file.
+            temp_path = f"{cls.CACHE_FILE}.{os.getpid()}.tmp"
+            try:
+                with open(temp_path, "w", encoding="utf-8") as cache_file:
+                    json.dump(file_cache, cache_file)
+                os.replace(temp_path, cls.CACHE_FILE)
+            except OSError:
+                # The cache file is optional. The values are still cached in memory.
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+
+    @classmethod
+    def _read_cache_file(cls) -> dict:
+        """
+        Reads the local cache file.
+        :return: Returns the cached tables of the local cache file. Returns an empty dictionary if there is no
+            readable cache file.
+        """
+        try:
+            with open(cls.CACHE_FILE, "r", encoding="utf-8") as cache_file:
+                return json.load(cache_file)
+        except (OSError, ValueError):
+            return {}
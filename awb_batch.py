@@ -0,0 +1,125 @@
+import pandas as pd
+
+
+class AWBBatch:
+    """
+    A compact batch of AWB's stored by column.
+
+    Every column is stored as its own list instead of storing a dictionary for every AWB. The batch is created from
+    the Search AWB table, filled in with the flight information while the AWB's are searched and turned into a
+    Dataframe once for the Home Delivery Report.
+
+      Attributes:
+        - awb_numbers (list): AWB numbers without the "632-" prefix.
+        - consignees (list): Consignee names.
+        - communities (list): Destination communities.
+        - pieces (list): Number of pieces.
+        - flight_statuses (list): Flight status of every AWB. (None until the AWB is searched)
+        - flight_numbers (list): Flight number of every AWB. (None until the AWB is searched)
+        - flight_dates (list): Flight date of every AWB. (None until the AWB is searched)
+      Methods:
+        - from_search_table: Creates a batch from the Search AWB table.
+        - set_status: Set the flight information of an AWB.
+        - select: Creates a new batch of the AWB's at specific positions.
+        - to_dataframe: Creates a Dataframe of the batch.
+    """
+
+    __slots__ = ("awb_numbers", "consignees", "communities", "pieces", "flight_statuses", "flight_numbers",
+                 "flight_dates")
+
+    # Column Names constant which contains the attribute name and the Dataframe column name of every column.
+    COLUMN_NAMES = {
+        "awb_numbers": "AWB No.",
+        "consignees": "Consignee",
+        "communities": "Community",
+        "pieces": "No. of Pieces",
+        "flight_numbers": "Flight Number",
+        "flight_dates": "Flight Date",
+        "flight_statuses": "Flight Status",
+    }
+
+    # Status Names constant which contains the header text in the AWB status table and the attribute it is stored in.
+    STATUS_NAMES = {
+        "Flight Status": "flight_statuses",
+        "Flight Number": "flight_numbers",
+        "Flight Date": "flight_dates",
+    }
+
+    def __init__(self, awb_numbers: list, consignees: list, communities: list, pieces: list):
+        """
+        Initializes an AWBBatch Object.
+
+        The flight information of every AWB is set to None.
+        :param awb_numbers: AWB numbers.
+        :param consignees: Consignee names.
+        :param communities: Destination communities.
+        :param pieces: Number of pieces.
+        :raise ValueError: Will raise error if the lists are not all the same length.
+        """
+        if not len(awb_numbers) == len(consignees) == len(communities) == len(pieces):
+            raise ValueError("Every column in an AWB batch must be the same length.")
+
+        self.awb_numbers = awb_numbers
+        self.consignees = consignees
+        self.communities = communities
+        self.pieces = pieces
+        self.flight_statuses = [None] * len(awb_numbers)
+        self.flight_numbers = [None] * len(awb_numbers)
+        self.flight_dates = [None] * len(awb_numbers)
+
+    def __len__(self) -> int:
+        """
+        Get the number of AWB's in the batch.
+        :return: Returns the number of AWB's.
+        """
+        return len(self.awb_numbers)
+
+    @classmethod
+    def from_search_table(cls, dataframe: pd.DataFrame) -> "AWBBatch":
+        """
+        Creates a batch from the Search AWB table.
+
+        The "632-" prefix is removed from every AWB number and every consignee name is title cased. Both are done on
+        the whole column at once.
+        :param dataframe: The Search AWB table Dataframe.
+        :return: Returns the AWB batch.
+        """
+        return cls(awb_numbers=dataframe["Consignment #"].str.replace("632-", "").tolist(),
+                   consignees=dataframe["Consignee Name"].str.title().tolist(),
+                   communities=dataframe["To"].tolist(),
+                   pieces=dataframe["Pieces"].tolist())
+
+    def set_status(self, position: int, status: dict) -> None:
+        """
+        Set the flight information of an AWB.
+        :param position: Position of the AWB in the batch.
+        :param status: Dictionary of flight information. Valid keys are 'Flight Status', 'Flight Number' and
+            'Flight Date'. Any other key is ignored.
+        """
+        for status_name, attribute_name in AWBBatch.STATUS_NAMES.items():
+            if status_name in status:
+                getattr(self, attribute_name)[position] = status[status_name]
+
+    def select(self, positions: list) -> "AWBBatch":
+        """
+        Creates a new batch of the AWB's at specific positions.
+        :param positions: List of positions to keep. The new batch keeps the same order.
+        :return: Returns the new AWB batch.
+        """
+        batch = AWBBatch(awb_numbers=[self.awb_numbers[i] for i in positions],
+                         consignees=[self.consignees[i] for i in positions],
+                         communities=[self.communities[i] for i in positions],
+                         pieces=[self.pieces[i] for i in positions])
+        batch.flight_statuses = [self.flight_statuses[i] for i in positions]
+        batch.flight_numbers = [self.flight_numbers[i] for i in positions]
+        batch.flight_dates = [self.flight_dates[i] for i in positions]
+
+        return batch
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        Creates a Dataframe of the batch. Every list becomes a column.
+        :return: Returns the Dataframe.
+        """
+        return pd.DataFrame({column_name: getattr(self, attribute_name)
+                             for attribute_name, column_name in AWBBatch.COLUMN_NAMES.items()})
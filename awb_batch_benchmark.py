@@ -0,0 +1,136 @@
+import argparse
+import tracemalloc
+import pandas as pd
+from awb_batch import AWBBatch
+
+
+class AWBBatchBenchmark:
+    """
+    Compares the memory of the list of dictionaries that used to carry the Home Delivery AWB's with the AWBBatch.
+
+    A Search AWB table is built with made up AWB's. Both ways are run the same way the Home Delivery Report runs
+    them. The AWB information is extracted from the table and every other AWB gets flight information as a Home
+    Delivery AWB. The other AWB's are dropped. The memory is measured with tracemalloc.
+
+      Attributes:
+        - row_count (int): Number of AWB's in the Search AWB table.
+      Methods:
+        - run: Measure the memory of both ways.
+        - create_search_table: Creates a Search AWB table of made up AWB's.
+        - create_awb_list: Creates the Home Delivery AWB's as a list of dictionaries.
+        - create_awb_batch: Creates the Home Delivery AWB's as an AWBBatch.
+        - measure_memory: Measure the memory used by a method.
+    """
+
+    # Number of AWB's in the Search AWB table when no row count is passed in.
+    ROW_COUNT = 10000
+
+    # Communities given to the made up AWB's.
+    COMMUNITIES = ["YTH", "YXY", "YRT", "YST", "YBK"]
+
+    # Flight information given to every Home Delivery AWB.
+    FLIGHT_STATUS = {"Flight Status": "Departed", "Flight Number": "KW123", "Flight Date": "25-Mar-2023"}
+
+    def __init__(self, row_count: int = None):
+        """
+        Initializes an AWBBatchBenchmark Object.
+
+        :param row_count: Number of AWB's in the Search AWB table. (Default: None [AWBBatchBenchmark.ROW_COUNT])
+        """
+        self.row_count = row_count if row_count is not None else AWBBatchBenchmark.ROW_COUNT
+
+    def run(self) -> dict:
+        """
+        Measure the memory of both ways on the same Search AWB table.
+        :return: Returns a dictionary where the keys are the names of the ways and the values are tuples of the peak
+            and the kept memory in bytes.
+        """
+        search_df = self.create_search_table()
+        return {
+            "List of dictionaries": AWBBatchBenchmark.measure_memory(AWBBatchBenchmark.create_awb_list, search_df),
+            "AWBBatch": AWBBatchBenchmark.measure_memory(AWBBatchBenchmark.create_awb_batch, search_df),
+        }
+
+    def create_search_table(self) -> pd.DataFrame:
+        """
+        Creates a Search AWB table of made up AWB's.
+        :return: Returns the Search AWB table Dataframe.
+        """
+        return pd.DataFrame({
+            "Consignment #": [f"632-{10000000 + row}" for row in range(self.row_count)],
+            "Consignee Name": [f"consignee number {row}" for row in range(self.row_count)],
+            "To": [AWBBatchBenchmark.COMMUNITIES[row % len(AWBBatchBenchmark.COMMUNITIES)]
+                   for row in range(self.row_count)],
+            "Pieces": [row % 20 + 1 for row in range(self.row_count)],
+        })
+
+    @staticmethod
+    def create_awb_list(search_df: pd.DataFrame) -> list:
+        """
+        Creates the Home Delivery AWB's as a list of dictionaries, the way TableData.get_awb_list and
+        CargoWebpage.search_awb did before the AWBBatch.
+        :param search_df: The Search AWB table Dataframe.
+        :return: Returns the list of Home Delivery AWB dictionaries.
+        """
+        search_df = search_df.assign(**{"Consignment #": search_df["Consignment #"].str.replace("632-", "")})
+        records = search_df.to_dict(orient="records")
+
+        awb_list = [{"AWB No.": record["Consignment #"], "Consignee": record["Consignee Name"].title(),
+                     "Community": record["To"], "No. of Pieces": record["Pieces"]} for record in records]
+
+        for position in reversed(range(len(awb_list))):
+            if position % 2 == 0:
+                awb_list[position].update(AWBBatchBenchmark.FLIGHT_STATUS)
+            else:
+                awb_list.pop(position)
+
+        return awb_list
+
+    @staticmethod
+    def create_awb_batch(search_df: pd.DataFrame) -> AWBBatch:
+        """
+        Creates the Home Delivery AWB's as an AWBBatch, the way TableData.get_awb_batch and CargoWebpage.search_awb do.
+        :param search_df: The Search AWB table Dataframe.
+        :return: Returns the batch of Home Delivery AWB's.
+        """
+        awb_batch = AWBBatch.from_search_table(search_df)
+
+        home_delivery_positions = []
+        for position in range(len(awb_batch)):
+            if position % 2 == 0:
+                awb_batch.set_status(position, AWBBatchBenchmark.FLIGHT_STATUS)
+                home_delivery_positions.append(position)
+
+        return awb_batch.select(home_delivery_positions)
+
+    @staticmethod
+    def measure_memory(method: callable, search_df: pd.DataFrame) -> tuple[int, int]:
+        """
+        Measure the memory used by a method with tracemalloc.
+        :param method: The method to measure. It is called with the Search AWB table.
+        :param search_df: The Search AWB table Dataframe.
+        :return: Returns a tuple of the peak memory while the method ran and the memory kept by its result, in bytes.
+        """
+        tracemalloc.start()
+        try:
+            result = method(search_df)
+            kept_memory, peak_memory = tracemalloc.get_traced_memory()
+
+            # The result is only dropped after the memory is read, so the kept memory includes it.
+            del result
+        finally:
+            tracemalloc.stop()
+
+        return peak_memory, kept_memory
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare the memory of the AWB list of dictionaries and AWBBatch.")
+    parser.add_argument("--rows", type=int, default=AWBBatchBenchmark.ROW_COUNT,
+                        help=f"Number of AWB's in the Search AWB table. (Default: {AWBBatchBenchmark.ROW_COUNT})")
+    arguments = parser.parse_args()
+
+    benchmark_results = AWBBatchBenchmark(row_count=arguments.rows).run()
+    print(f"{arguments.rows} AWB's")
+    for way_name, (peak_bytes, kept_bytes) in benchmark_results.items():
+        print(f"{way_name}: peak {peak_bytes / 1024 / 1024:.2f} MB, kept {kept_bytes / 1024 / 1024:.2f} MB")
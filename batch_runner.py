@@ -0,0 +1,205 @@
+import argparse
+import sys
+import pandas as pd
+from selenium.common import TimeoutException, WebDriverException
+from interface import CargoInterface
+from report_renderer import ReportRenderer
+from Settings_Data import SettingsData
+from table_data import TableData
+from webpage_loader import CargoWebpage
+from webpage_data import WebpageData
+from webpage_settings import WebpageSettings
+
+
+class BatchRunner:
+    """
+    Runs a report for a list of settings profiles in 1 browser session.
+
+    The browser is started and logged in once. Every profile fills in the form with its own settings and its report
+    job is collected. Once every profile is extracted, the jobs are sent to the ReportRenderer in 1 render, so the
+    reports are designed in parallel in its process pool. The report files of every profile are labeled with the
+    profile name (Ex. 'SLA-Bot Report on March 25, 2023 - 1015AM (YTH-YXY).xlsx'). A profile that fails is reported
+    and the batch moves on to the next profile. If the failure closed the browser, a new session is started.
+
+      Attributes:
+        - report_name (str): Name of the report to run. (See VALID_REPORTS)
+        - output_formats (tuple): Formats to create for every report.
+        - track_changes (bool): Add the AWB's that changed since the previous run of the same settings.
+        - webpage (CargoWebpage): The shared browser session.
+        - webpage_data (WebpageData): URLs of the Cargo Webpage.
+      Methods:
+        - run: Run the report for every profile.
+        - start_session: Start the browser and log in to the Cargo Webpage.
+    """
+
+    # Valid Reports constant which contains the report name, the settings table of the profiles and the method that
+    # gets the report job of 1 profile.
+    VALID_REPORTS = {
+        "SLA/Bot Report": (SettingsData.BOT_SLA_REPORT_TABLE_NAME, "_run_sla_bot_profile"),
+        "Home Delivery Report": (SettingsData.HOME_REPORT_TABLE_NAME, "_run_home_delivery_profile"),
+    }
+
+    # Command line report arguments constant which contains the argument and the report name it runs.
+    REPORT_ARGUMENTS = {
+        "sla": "SLA/Bot Report",
+        "home": "Home Delivery Report",
+    }
+
+    def __init__(self, report_name: str, output_formats: tuple = ("xlsx",), track_changes: bool = False):
+        """
+        Initializes a BatchRunner Object.
+
+        :param report_name: Name of the report to run. (Valid Reports: 'SLA/Bot Report' or 'Home Delivery Report')
+        :param output_formats: Formats to create for every report. (Default: ("xlsx",))
+        :param track_changes: Add the AWB's that changed since the previous run of the same settings.
+            (Default: False)
+        :raise KeyError: Will raise error if the report name is not valid.
+        """
+        if report_name not in BatchRunner.VALID_REPORTS.keys():
+            raise KeyError(f"{report_name} is not a valid batch report. Valid reports are "
+                           f"{' or '.join(BatchRunner.VALID_REPORTS.keys())}")
+
+        self.report_name = report_name
+        self.output_formats = tuple(output_formats)
+        self.track_changes = track_changes
+        self.webpage = CargoWebpage()
+        self.webpage_data = WebpageData()
+
+    def run(self, profile_names: list = None) -> dict:
+        """
+        Run the report for every profile in 1 browser session and design every report in 1 render.
+
+        :param profile_names: Names of the settings profiles to run. (Default: None [Every profile of the report])
+        :return: Returns a dictionary where the keys are the profile names and the values are the list of the saved
+            file paths of that report, or the exception if the profile failed. If the render fails, every profile that
+            was extracted gets the render exception.
+        :raise ConnectionError: Will raise error if the script can't log in to the Cargo Webpage.
+        """
+        table_name, run_method = BatchRunner.VALID_REPORTS[self.report_name]
+        if profile_names is None:
+            profile_names = SettingsData().get_profile_names(table_name)
+
+        results = {}
+        jobs = {}
+        try:
+            # A profile that is listed twice is only run once.
+            for profile_name in dict.fromkeys(profile_names):
+                # A failed form can close the browser, so the session is started again for the next profile.
+                if not self.webpage.script_running:
+                    self.start_session()
+
+                try:
+                    jobs[profile_name] = getattr(self, run_method)(profile_name)
+                except (KeyError, ValueError, WebDriverException) as exception:
+                    results[profile_name] = exception
+        finally:
+            if self.webpage.script_running:
+                self.webpage.quit_selenium()
+
+        if jobs:
+            try:
+                file_paths = ReportRenderer().render(list(jobs.values()), output_formats=self.output_formats)
+            except (KeyError, ValueError, OSError) as exception:
+                results.update(dict.fromkeys(jobs.keys(), exception))
+            else:
+                results.update(zip(jobs.keys(), file_paths))
+
+        return {profile_name: results[profile_name] for profile_name in dict.fromkeys(profile_names)}
+
+    def start_session(self) -> None:
+        """
+        Start the browser and log in to the Cargo Webpage.
+        :raise ConnectionError: Will raise error if the homepage doesn't load or if the login fails.
+        """
+        self.webpage.start_selenium(options=WebpageSettings.headless_chrome())
+        self.webpage.load_url(self.webpage_data.get_cargo_homepage())
+
+        if not self.webpage.check_element_loaded("//input[@id='UserName']", wait_time=5):
+            raise ConnectionError("There was a problem loading the Cargo homepage.")
+
+        self.webpage.login()
+        if not self.webpage.check_login():
+            raise ConnectionError("There was a problem logging into the Cargo webpage.")
+
+    def _run_sla_bot_profile(self, profile_name: str) -> tuple[str, dict]:
+        """
+        Extract the Waybills to Ship table of a profile and get the job of its SLA/Bot Report.
+        :param profile_name: Name of the settings profile.
+        :return: Returns the ReportRenderer job of the report.
+        :raise TimeoutException: Will raise error if the Waybills to Ship page doesn't load.
+        """
+        if not self.webpage.check_waybills_to_ship_page(self.webpage_data.get_waybill_url()):
+            raise TimeoutException("There was a problem loading the waybills to ship webpage.")
+
+        html_table, day_setting = self.webpage.fill_in_waybills_form(profile_name=profile_name, quit_driver=False)
+        sla_dict, bot_df, highest_day, sla_cube, changes_df = CargoInterface.get_sla_bot_data(
+            html_table=html_table, day_setting=day_setting, settings=self.webpage.form_settings,
+            track_changes=self.track_changes)
+
+        return CargoInterface.get_sla_bot_report_job(sla_dict=sla_dict, bot_df=bot_df, highest_day=highest_day,
+                                                     day_sorter=day_setting, sla_cube=sla_cube, changes_df=changes_df,
+                                                     file_label=profile_name)
+
+    def _run_home_delivery_profile(self, profile_name: str) -> tuple[str, dict]:
+        """
+        Search the AWB's of a profile and get the job of its Home Delivery Report.
+        :param profile_name: Name of the settings profile.
+        :return: Returns the ReportRenderer job of the report.
+        :raise TimeoutException: Will raise error if the Search AWB page doesn't load or if no AWB's were found.
+        """
+        if not self.webpage.check_search_awbs_page(self.webpage_data.get_search_awb_url()):
+            raise TimeoutException("There was a problem loading the Search AWB webpage.")
+
+        html_table = self.webpage.fill_in_search_form(profile_name=profile_name)
+        shipped_awb_df, non_shipped_df, changes_df = self._get_home_delivery_data(html_table)
+
+        return CargoInterface.get_home_delivery_report_job(shipped_awb_df=shipped_awb_df,
+                                                           non_shipped_awb_df=non_shipped_df, changes_df=changes_df,
+                                                           file_label=profile_name)
+
+    def _get_home_delivery_data(self, html_table) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+        """
+        Get the Home Delivery Report Data. The browser is kept open for the next profile.
+
+        The extracted tables are saved to the report history.
+        :param html_table: The HTML Table to extract.
+        :return: Returns a tuple of shipped AWB dataframe, non-shipped awb Dataframe and Changes Dataframe (None if
+            track_changes is False).
+        """
+        home_delivery_data = TableData(table_data=html_table, report_name=self.report_name)
+        awb_batch = home_delivery_data.get_awb_batch()
+        home_delivery_data.home_delivery_awb_batch = self.webpage.search_awb(awb_batch=awb_batch, quit_driver=False)
+        home_delivery_data.create_report_data(self.report_name)
+
+        changes_df = None
+        if self.track_changes:
+            changes_df = CargoInterface.get_run_changes(report_name=self.report_name, table_data=home_delivery_data,
+                                                        settings=self.webpage.form_settings)
+
+        CargoInterface.save_run_history(report_name=self.report_name, table_data=home_delivery_data,
+                                        settings=self.webpage.form_settings)
+        shipped_awb_df, non_shipped_df = home_delivery_data.get_home_delivery_data()
+        return shipped_awb_df, non_shipped_df, changes_df
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run a report for several settings profiles in 1 browser session.")
+    parser.add_argument("report", choices=BatchRunner.REPORT_ARGUMENTS.keys(), help="Report to run.")
+    parser.add_argument("profiles", nargs="*", help="Names of the settings profiles to run. (Default: every profile)")
+    parser.add_argument("--formats", nargs="+", default=["xlsx"], choices=ReportRenderer.VALID_OUTPUT_FORMATS,
+                        help="Formats to create for every report. (Default: xlsx)")
+    parser.add_argument("--track-changes", action="store_true",
+                        help="Add the AWB's that changed since the previous run of the same settings.")
+    arguments = parser.parse_args()
+
+    batch_runner = BatchRunner(report_name=BatchRunner.REPORT_ARGUMENTS[arguments.report],
+                               output_formats=arguments.formats, track_changes=arguments.track_changes)
+    batch_results = batch_runner.run(profile_names=arguments.profiles or None)
+
+    for result_profile, result in batch_results.items():
+        if isinstance(result, Exception):
+            print(f"{result_profile}: Failed. {result}")
+        else:
+            print(f"{result_profile}: {', '.join(result)}")
+
+    sys.exit(1 if any(isinstance(result, Exception) for result in batch_results.values()) else 0)
@@ -0,0 +1,146 @@
+import pandas as pd
+from history_store import HistoryStore
+
+
+class DeltaReport:
+    """
+    A class for finding the AWB's that changed between the current run of a report and the previous run.
+
+    The previous run is loaded from the report history. Both runs are turned into a hash index where the keys are the
+    AWB numbers and the values are the compared column values, so every AWB is only looked at once. An AWB that is
+    listed more than once is keyed by the AWB and its occurrence, so every row of that AWB is compared to the row in
+    the same place of the previous run.
+
+      Attributes:
+        - report_name (str): Name of the report.
+        - history_store (HistoryStore): History store that holds the previous run.
+        - previous_run_id (str): Run id of the previous run. None if the report has never been run.
+      Methods:
+        - create_changes: Creates the Changes Dataframe of new, resolved and changed AWB's.
+        - get_previous_tables: Gets the tables of the previous run.
+        - create_awb_index: Creates a hash index of a Dataframe keyed by AWB and occurrence.
+    """
+
+    # Delta Tables constant which contains the report name and a tuple of the tables to compare, the AWB column name
+    # and the columns that are compared for every AWB.
+    DELTA_TABLES = {
+        "SLA/Bot Report": (("bot_df",), "AWB", ["Route", "Goods Desc.", "Piece Count", "Weight"]),
+        "Home Delivery Report": (("shipped_awb_df", "non_shipped_awb_df"), "AWB No.",
+                                 ["Shipped", "Community", "Flight Status", "Flight No.", "Date", "No. of Pieces"]),
+    }
+
+    CHANGE_TYPES = ["New", "Changed", "Resolved"]
+
+    def __init__(self, report_name: str, history_store: HistoryStore = None, settings: dict = None,
+                 setting_columns: list = None):
+        """
+        Initializes a DeltaReport Object.
+
+        Finds the previous run of the report. If settings are passed in, only a previous run with the same settings
+        is used.
+        :param report_name: Name of the report. Must be one of the report names defined in DeltaReport.DELTA_TABLES.
+        :param history_store: History store that holds the previous run. (Default: None [HistoryStore()])
+        :param settings: Settings that were used for the current run. (Default: None)
+        :param setting_columns: Names of the settings used to match the previous run. (Default: None [Every setting])
+        :raise KeyError: If the specified report name is not one of the valid report names defined in
+            DeltaReport.DELTA_TABLES.
+        """
+        if report_name not in DeltaReport.DELTA_TABLES.keys():
+            raise KeyError(f"{report_name} is not a valid report. Valid reports are "
+                           f"{' or '.join(DeltaReport.DELTA_TABLES.keys())}")
+
+        self.report_name = report_name
+        self.history_store = history_store if history_store is not None else HistoryStore()
+
+        settings_key = HistoryStore.get_settings_key(settings, setting_columns) if settings is not None else None
+        self.previous_run_id = self.history_store.get_latest_run_id(report_name=report_name,
+                                                                    settings_key=settings_key)
+
+    def get_previous_tables(self) -> dict:
+        """
+        Gets the tables of the previous run.
+        :return: Returns a dictionary where the keys are the table names and the values are the Dataframes. Returns an
+            empty dictionary if the report has never been run.
+        """
+        if self.previous_run_id is None:
+            return {}
+
+        table_names = DeltaReport.DELTA_TABLES[self.report_name][0]
+        return {table_name: self.history_store.load_run(table_name=table_name, run_id=self.previous_run_id)
+                for table_name in table_names}
+
+    def create_changes(self, tables: dict) -> pd.DataFrame:
+        """
+        Creates the Changes Dataframe of new, resolved and changed AWB's.
+
+        New AWB's are only in the current run, resolved AWB's are only in the previous run and changed AWB's are in
+        both runs with different values in at least 1 compared column.
+        :param tables: Dictionary of the current run where the keys are the table names and the values are the
+            Dataframes.
+        :return: Returns the Changes Dataframe with a "Change" column, the AWB column, the compared columns and a
+            "Details" column that lists every changed value.
+        """
+        _, awb_column, compare_columns = DeltaReport.DELTA_TABLES[self.report_name]
+
+        current_index = DeltaReport.create_awb_index(self._combine_tables(tables), awb_column, compare_columns)
+        previous_index = DeltaReport.create_awb_index(self._combine_tables(self.get_previous_tables()), awb_column,
+                                                      compare_columns)
+
+        changes = []
+        for (awb, occurrence), current_values in current_index.items():
+            previous_values = previous_index.get((awb, occurrence))
+            if previous_values is None:
+                changes.append(("New", awb, *current_values, ""))
+            elif previous_values != current_values:
+                details = ", ".join(f"{column}: {previous} -> {current}" for column, previous, current
+                                    in zip(compare_columns, previous_values, current_values) if previous != current)
+                changes.append(("Changed", awb, *current_values, details))
+
+        for (awb, occurrence), previous_values in previous_index.items():
+            if (awb, occurrence) not in current_index:
+                changes.append(("Resolved", awb, *previous_values, ""))
+
+        changes_df = pd.DataFrame(changes, columns=["Change", awb_column, *compare_columns, "Details"])
+        changes_df["Change"] = pd.Categorical(changes_df["Change"], categories=DeltaReport.CHANGE_TYPES, ordered=True)
+
+        return changes_df.sort_values(by=["Change", awb_column]).reset_index(drop=True)
+
+    @staticmethod
+    def create_awb_index(dataframe: pd.DataFrame, awb_column: str, compare_columns: list) -> dict:
+        """
+        Creates a hash index of a Dataframe keyed by AWB.
+
+        Every value is converted to a string, so values read back from the report history compare equal to the values
+        of the current run. Columns that are missing from the Dataframe are set to an empty string. An AWB that is
+        listed more than once keeps every row, since the rows are keyed by the AWB and its occurrence.
+        :param dataframe: Dataframe to index.
+        :param awb_column: Name of the AWB column.
+        :param compare_columns: List of columns to store for every AWB.
+        :return: Returns a dictionary where the keys are tuples of the AWB and its occurrence (0 for the first row of
+            the AWB) and the values are tuples of the compared columns.
+        """
+        if dataframe.empty:
+            return {}
+
+        index_df = dataframe.reindex(columns=[awb_column, *compare_columns]).fillna("").astype(str)
+        occurrences = index_df.groupby(awb_column, sort=False).cumcount()
+        return dict(zip(zip(index_df[awb_column], occurrences),
+                        zip(*(index_df[column] for column in compare_columns))))
+
+    def _combine_tables(self, tables: dict) -> pd.DataFrame:
+        """
+        Combine the tables of a run into 1 Dataframe.
+
+        For the Home Delivery Report a "Shipped" column is added, so an AWB that moves from the non-shipped table to
+        the shipped table shows up as changed.
+        :param tables: Dictionary where the keys are the table names and the values are the Dataframes.
+        :return: Returns the combined Dataframe.
+        """
+        if not tables:
+            return pd.DataFrame()
+
+        if self.report_name == "Home Delivery Report":
+            return pd.concat([tables["shipped_awb_df"].assign(Shipped="Yes"),
+                              tables["non_shipped_awb_df"].assign(Shipped="No")], ignore_index=True)
+
+        return tables["bot_df"]
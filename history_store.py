@@ -0,0 +1,265 @@
+from datetime import date, datetime
+import hashlib
+import json
+import os
+import pandas as pd
+
+
+class HistoryStore:
+    """
+    A class for storing the extracted tables of every report run in a local Parquet history store.
+
+    Every table is stored in its own folder and partitioned by the date of the run
+    (Ex. Report History/bot_df/run_date=2023-03-25/20230325T101500000000.parquet). Every row is stored with the run id,
+    the run time and a key of the settings that were used for that run. The settings of every run are stored in the
+    "runs" table.
+
+      Attributes:
+        - folder_path (str): Path of the history store folder.
+      Methods:
+        - save_run: Save the tables of a report run.
+        - load_table: Load a table for every run between 2 dates.
+        - load_indexed_table: Load a table for every run between 2 dates indexed by a list of columns.
+        - load_run: Load a table for one run.
+        - load_runs: Load the run information for every run between 2 dates.
+        - get_latest_run_id: Get the run id of the latest run of a report.
+        - get_settings_key: Get the key of a settings dictionary.
+    """
+
+    HISTORY_FOLDER = "Report History"
+    RUNS_TABLE_NAME = "runs"
+    COMPRESSION = "zstd"
+
+    # Valid Tables constant which contains the report name and a tuple of the table names stored for that report.
+    VALID_TABLES = {
+        "SLA/Bot Report": ("sla_frame", "bot_df"),
+        "Home Delivery Report": ("shipped_awb_df", "non_shipped_awb_df"),
+    }
+
+    def __init__(self, folder_path: str = None):
+        """
+        Initializes a HistoryStore Object.
+
+        :param folder_path: Path of the history store folder. (Default: 'Report History' folder in the current
+            directory)
+        """
+        if folder_path is None:
+            folder_path = os.path.join(os.getcwd(), HistoryStore.HISTORY_FOLDER)
+
+        self.folder_path = folder_path
+
+    def save_run(self, report_name: str, tables: dict, settings: dict = None, run_time: datetime = None,
+                 setting_columns: list = None) -> str:
+        """
+        Save the tables of a report run to the history store.
+
+        :param report_name: Name of the report that was run. Must be one of the report names defined in
+            HistoryStore.VALID_TABLES.
+        :param tables: Dictionary where the keys are the table names and the values are the Dataframes.
+        :param settings: Settings that were used for the run. (Default: None)
+        :param run_time: Time of the run. (Default: None [Current date/time])
+        :param setting_columns: Names of the settings used in the settings key. (Default: None [Every setting])
+        :return: Returns the run id of the saved run.
+        :raise KeyError: Will raise error if the report name is not valid or if a table name is not valid for
+            the report.
+        """
+        if report_name not in HistoryStore.VALID_TABLES.keys():
+            raise KeyError(f"{report_name} is not a valid report. Valid reports are "
+                           f"{' or '.join(HistoryStore.VALID_TABLES.keys())}")
+
+        for table_name in tables.keys():
+            if table_name not in HistoryStore.VALID_TABLES[report_name]:
+                raise KeyError(f"{table_name} is not a valid table for {report_name}. Valid tables are "
+                               f"{' or '.join(HistoryStore.VALID_TABLES[report_name])}")
+
+        if run_time is None:
+            run_time = datetime.now()
+
+        run_id = run_time.strftime("%Y%m%dT%H%M%S%f")
+        settings_key = HistoryStore.get_settings_key(settings, setting_columns)
+
+        for table_name, dataframe in tables.items():
+            history_df = dataframe.reset_index(drop=True)
+            history_df.insert(0, "Run ID", run_id)
+            history_df.insert(1, "Run Time", pd.Timestamp(run_time))
+            history_df.insert(2, "Settings Key", settings_key)
+            self._write_partition(table_name=table_name, dataframe=history_df, run_id=run_id, run_date=run_time.date())
+
+        run_df = pd.DataFrame([{"Run ID": run_id, "Run Time": pd.Timestamp(run_time), "Report Name": report_name,
+                                "Settings Key": settings_key,
+                                "Settings": json.dumps(settings, sort_keys=True, default=str)}])
+        self._write_partition(table_name=HistoryStore.RUNS_TABLE_NAME, dataframe=run_df, run_id=run_id,
+                              run_date=run_time.date())
+
+        return run_id
+
+    def load_table(self, table_name: str, start_date: date = None, end_date: date = None,
+                   columns: list = None) -> pd.DataFrame:
+        """
+        Load a table for every run between 2 dates.
+
+        Only the partitions between the start date and end date are read.
+        :param table_name: Name of the table to load. (Ex. 'bot_df')
+        :param start_date: First run date to load. (Default: None [No start date])
+        :param end_date: Last run date to load. (Default: None [No end date])
+        :param columns: List of columns to load. (Default: None [All columns])
+        :return: Returns the table of every run as one Dataframe. Returns an empty Dataframe if no runs are found.
+        """
+        partition_files = self._get_partition_files(table_name=table_name, start_date=start_date, end_date=end_date)
+
+        if not partition_files:
+            return pd.DataFrame(columns=columns)
+
+        return pd.concat([pd.read_parquet(file_path, columns=columns) for file_path in partition_files],
+                         ignore_index=True)
+
+    def load_indexed_table(self, table_name: str, index_columns: list, start_date: date = None,
+                           end_date: date = None, columns: list = None) -> pd.DataFrame:
+        """
+        Load a table for every run between 2 dates indexed by a list of columns.
+
+        A "Run Date" column is added from the "Run Time" column, so the table can be indexed by the run date. The index
+        is sorted, so lookups and groups on the index levels don't have to scan the whole table.
+        :param table_name: Name of the table to load. (Ex. 'bot_df')
+        :param index_columns: List of columns to index the table by. (Ex. ['AWB', 'Run Date'])
+        :param start_date: First run date to load. (Default: None [No start date])
+        :param end_date: Last run date to load. (Default: None [No end date])
+        :param columns: List of columns to load. "Run Time" is always loaded. (Default: None [All columns])
+        :return: Returns the table of every run as one indexed Dataframe.
+        """
+        if columns is not None and "Run Time" not in columns:
+            columns = ["Run Time"] + columns
+
+        history_df = self.load_table(table_name=table_name, start_date=start_date, end_date=end_date, columns=columns)
+        history_df["Run Date"] = pd.to_datetime(history_df["Run Time"]).dt.normalize()
+
+        return history_df.set_index(index_columns).sort_index()
+
+    def load_run(self, table_name: str, run_id: str) -> pd.DataFrame:
+        """
+        Load a table for one run.
+
+        The run date is taken from the run id, so only the file of that run is read.
+        :param table_name: Name of the table to load. (Ex. 'bot_df')
+        :param run_id: Run id of the run.
+        :return: Returns the table of the run. Returns an empty Dataframe if the run didn't store that table.
+        """
+        run_date = datetime.strptime(run_id[:8], "%Y%m%d").date()
+        file_path = os.path.join(self.folder_path, table_name, f"run_date={run_date.isoformat()}", f"{run_id}.parquet")
+
+        if not os.path.isfile(file_path):
+            return pd.DataFrame()
+
+        return pd.read_parquet(file_path)
+
+    def load_runs(self, report_name: str = None, start_date: date = None, end_date: date = None) -> pd.DataFrame:
+        """
+        Load the run information for every run between 2 dates.
+
+        :param report_name: Only load runs of this report. (Default: None [All reports])
+        :param start_date: First run date to load. (Default: None [No start date])
+        :param end_date: Last run date to load. (Default: None [No end date])
+        :return: Returns a Dataframe of every run sorted by the run time.
+        """
+        runs_df = self.load_table(table_name=HistoryStore.RUNS_TABLE_NAME, start_date=start_date, end_date=end_date)
+
+        if report_name is not None and not runs_df.empty:
+            runs_df = runs_df[runs_df["Report Name"] == report_name]
+
+        return runs_df.sort_values(by="Run ID").reset_index(drop=True) if not runs_df.empty else runs_df
+
+    def get_latest_run_id(self, report_name: str, settings_key: str = None):
+        """
+        Get the run id of the latest run of a report.
+
+        The partitions are checked from the newest date to the oldest date, so only the newest partition with a run
+        of the report is read.
+        :param report_name: Name of the report.
+        :param settings_key: Only use runs with this settings key. (Default: None [Runs with any settings])
+        :return: Returns the run id of the latest run. Returns None if the report has never been run.
+        """
+        for partition_path in reversed(self._get_partition_paths(table_name=HistoryStore.RUNS_TABLE_NAME)):
+            run_date = date.fromisoformat(partition_path.rsplit("=", 1)[1])
+            runs_df = self.load_runs(report_name=report_name, start_date=run_date, end_date=run_date)
+            if settings_key is not None and not runs_df.empty:
+                runs_df = runs_df[runs_df["Settings Key"] == settings_key]
+            if not runs_df.empty:
+                return runs_df["Run ID"].max()
+
+        return None
+
+    @staticmethod
+    def get_settings_key(settings: dict = None, setting_columns: list = None) -> str:
+        """
+        Get the key of a settings dictionary.
+
+        Pass in the columns of the settings table, so values that are worked out for every run (Ex. the "Date" that
+        is subtracted from the current date) are left out and a run on the next day with the same stored settings has
+        the same key.
+        :param settings: Settings dictionary. (Default: None)
+        :param setting_columns: Names of the settings used in the key. (Default: None [Every setting])
+        :return: Returns a short hash of the settings. Runs with the same settings will have the same key.
+        """
+        stored_settings = settings
+        if settings is not None and setting_columns is not None:
+            stored_settings = {key: value for key, value in settings.items() if key in setting_columns}
+
+        settings_json = json.dumps(stored_settings, sort_keys=True, default=str)
+        return hashlib.sha1(settings_json.encode("utf-8")).hexdigest()[:12]
+
+    def _write_partition(self, table_name: str, dataframe: pd.DataFrame, run_id: str, run_date: date) -> None:
+        """
+        Write a Dataframe to the partition of the run date.
+
+        :param table_name: Name of the table.
+        :param dataframe: Dataframe to write.
+        :param run_id: Run id. Used as the file name.
+        :param run_date: Date of the run. Used as the partition.
+        """
+        partition_path = os.path.join(self.folder_path, table_name, f"run_date={run_date.isoformat()}")
+        os.makedirs(partition_path, exist_ok=True)
+
+        dataframe.to_parquet(os.path.join(partition_path, f"{run_id}.parquet"), compression=HistoryStore.COMPRESSION,
+                             index=False)
+
+    def _get_partition_paths(self, table_name: str, start_date: date = None, end_date: date = None) -> list:
+        """
+        Get the partition folders of a table between 2 dates.
+
+        :param table_name: Name of the table.
+        :param start_date: First run date. (Default: None [No start date])
+        :param end_date: Last run date. (Default: None [No end date])
+        :return: Returns a list of partition folder paths sorted from oldest to newest.
+        """
+        table_path = os.path.join(self.folder_path, table_name)
+
+        if not os.path.isdir(table_path):
+            return []
+
+        partition_paths = []
+        for partition_name in sorted(os.listdir(table_path)):
+            if not partition_name.startswith("run_date="):
+                continue
+
+            run_date = date.fromisoformat(partition_name.split("=", 1)[1])
+            if start_date is not None and run_date < start_date:
+                continue
+            if end_date is not None and run_date > end_date:
+                continue
+
+            partition_paths.append(os.path.join(table_path, partition_name))
+
+        return partition_paths
+
+    def _get_partition_files(self, table_name: str, start_date: date = None, end_date: date = None) -> list:
+        """
+        Get the Parquet files of a table between 2 dates.
+
+        :param table_name: Name of the table.
+        :param start_date: First run date. (Default: None [No start date])
+        :param end_date: Last run date. (Default: None [No end date])
+        :return: Returns a list of Parquet file paths sorted from oldest to newest.
+        """
+        return [os.path.join(partition_path, file_name)
+                for partition_path in self._get_partition_paths(table_name, start_date, end_date)
+                for file_name in sorted(os.listdir(partition_path)) if file_name.endswith(".parquet")]
@@ -1,11 +1,19 @@
+from concurrent.futures import CancelledError, Future
 from typing import Union, Optional, Type
 from datetime import datetime
-import threading
+import queue
 import customtkinter as ctk
 import pandas as pd
 from selenium.common import NoSuchElementException, TimeoutException
+from Settings_Data import SettingsData
+from Database_Connector import DatabaseConnector
+from delta_report import DeltaReport
 from error_window import ErrorWindow
+from history_store import HistoryStore
+from job_scheduler import JobScheduler
+from report_cache import ReportCache
 from report_design import ReportDesign
+from report_renderer import ReportRenderer
 from table_data import TableData
 from webpage_loader import CargoWebpage
 from setting_window import SettingWindow
@@ -19,7 +27,29 @@ class CargoInterface(ctk.CTk):
     The main GUI for the Cargo Report Generator.
     """
 
-    VALID_REPORTS = ["SLA/Bot Report", "Home Delivery Report"]
+    VALID_REPORTS = ["SLA/Bot Report", "Home Delivery Report", "Trend Report"]
+
+    # Report Setting Tables constant which contains the report name and the settings table used to run that report.
+    REPORT_SETTING_TABLES = {
+        "SLA/Bot Report": SettingsData.BOT_SLA_REPORT_TABLE_NAME,
+        "Home Delivery Report": SettingsData.HOME_REPORT_TABLE_NAME,
+    }
+
+    # Number of weeks of report history used to create the Trend Report.
+    TREND_WEEKS_BACK = 8
+
+    # Number of reports that run at the same time. Reports share 1 browser, so they run 1 at a time.
+    SCRIPT_WORKERS = 1
+
+    # Output options constant which contains the option text and the output formats created for that option.
+    OUTPUT_OPTIONS = {
+        "Excel": ("xlsx",),
+        "Excel + CSV": ("xlsx", "csv"),
+        "Excel + Parquet": ("xlsx", "parquet"),
+        "Excel + HTML": ("xlsx", "html"),
+        "Excel + All Data": ("xlsx", "csv", "parquet", "html"),
+        "Data Only": ("csv", "parquet", "html"),
+    }
 
     def __init__(self):
         """
@@ -30,10 +60,13 @@ class CargoInterface(ctk.CTk):
         super().__init__()
         self.webpage = CargoWebpage()
         self.webpage_data = WebpageData()
+        self.report_cache = ReportCache()
+        self.job_scheduler = JobScheduler(max_workers=CargoInterface.SCRIPT_WORKERS)
         self.title("Cargo Script")
-        self.geometry("370x580")
+        self.geometry("370x620")
         self.resizable(False, False)
         self.iconbitmap("icon.ico")
+        self.protocol("WM_DELETE_WINDOW", self.close_app)
 
         ctk.set_appearance_mode("Dark")
         ctk.set_default_color_theme("green")
@@ -66,12 +99,12 @@ class CargoInterface(ctk.CTk):
 
         self.script_option_var = ctk.StringVar(value="SLA/Bot Report")
         self.script_selection_menu = ctk.CTkOptionMenu(master=self.selection_frame,
-                                                       values=["SLA/Bot Report", "Home Delivery Report"],
+                                                       values=self.VALID_REPORTS,
                                                        variable=self.script_option_var, anchor="center", width=150)
         self.script_selection_menu.pack(side="left")
 
         # Option Frame
-        self.option_frame = ctk.CTkFrame(master=self.main_frame, height=270, width=330)
+        self.option_frame = ctk.CTkFrame(master=self.main_frame, height=310, width=330)
         self.option_frame.pack_propagate(False)
         self.option_frame.pack(side="top", pady="20")
 
@@ -93,10 +126,25 @@ class CargoInterface(ctk.CTk):
         self.script_status_switch = ctk.CTkSwitch(master=self.switch_frame, text="Script OFF",
                                                   variable=self.script_status_var,
                                                   onvalue="on", offvalue="off", state=ctk.DISABLED,
-                                                  command=lambda: self.create_thread(
-                                                      target=self.stop_script_configuration))
+                                                  command=self.stop_script)
         self.script_status_switch.pack(side="left")
 
+        # Changes Frame
+        self.changes_frame = ctk.CTkFrame(master=self.option_frame, fg_color="transparent")
+        self.changes_frame.pack(side="top", pady=(20, 0))
+
+        # Changes Switch Widget (Adds a Changes sheet of the AWB's that changed since the previous run)
+        self.track_changes_var = ctk.StringVar(value="off")
+        self.track_changes_switch = ctk.CTkSwitch(master=self.changes_frame, text="Track Changes",
+                                                  variable=self.track_changes_var, onvalue="on", offvalue="off")
+        self.track_changes_switch.pack(side="left", padx=(0, 15))
+
+        # Output Widget (Formats created for every report)
+        self.output_option_var = ctk.StringVar(value="Excel")
+        self.output_option_menu = ctk.CTkOptionMenu(master=self.changes_frame, values=list(self.OUTPUT_OPTIONS.keys()),
+                                                    variable=self.output_option_var, anchor="center", width=150)
+        self.output_option_menu.pack(side="left")
+
         # Setting Frame
         self.setting_frame = ctk.CTkFrame(master=self.option_frame, fg_color="transparent")
         self.setting_frame.pack(side="top")
@@ -173,14 +221,100 @@ class CargoInterface(ctk.CTk):
         else:
             switch_str_var.set(value="off")
 
+    def get_output_formats(self) -> tuple:
+        """
+        Get the output formats of the selected output option.
+        :return: Returns a tuple of the output formats. (Ex. ("xlsx", "csv"))
+        """
+        return self.OUTPUT_OPTIONS[self.output_option_var.get()]
+
     def script_selection(self) -> None:
         """
         Gets the value of the Script Selection dropdown menu. This will determine which script to run.
         """
         if self.script_selection_menu.get() == "SLA/Bot Report":
-            self.create_thread(target=self.generate_sla_bot_report)
+            self.schedule_script(report_name=self.VALID_REPORTS[0], target=self.generate_sla_bot_report)
+        elif self.script_selection_menu.get() == "Home Delivery Report":
+            self.schedule_script(report_name=self.VALID_REPORTS[1], target=self.generate_home_delivery_report)
+        else:
+            self.schedule_script(report_name=self.VALID_REPORTS[2], target=self.generate_trend_report)
+
+    def schedule_script(self, report_name: str, target: callable) -> None:
+        """
+        Queue a script on the job scheduler.
+
+        A report that is already queued or running is not queued again. The result of the script is handed to the GUI
+        thread with after() once it's done.
+        :param report_name: Name of the report. Used as the job name.
+        :param target: The method that runs the script.
+        """
+        job_states = self.job_scheduler.get_states()
+        try:
+            scheduled_job = self.job_scheduler.submit(report_name, self.run_script, target)
+        except queue.Full:
+            self.insert_text("Too many reports are waiting to run. Please try again once a report is done.",
+                             color="red")
+            return
+
+        if scheduled_job.request_count > 1:
+            self.insert_text(f"{report_name} is already {scheduled_job.state.lower()}.")
+            return
+
+        if job_states:
+            self.insert_text(f"{report_name} will run once the current report is done.")
+
+        scheduled_job.future.add_done_callback(
+            lambda future: self.after(0, lambda: self.script_completed(report_name=report_name, job_future=future)))
+
+    def run_script(self, target: callable) -> None:
+        """
+        Run a script on a job scheduler worker. The browser is closed and the widgets are reset if the script is
+        cancelled or fails, so the next script starts clean.
+        :param target: The method that runs the script.
+        :raise CancelledError: Will raise error if the script was cancelled.
+        """
+        try:
+            target()
+        except Exception:
+            self.stop_script_configuration()
+            raise
+
+    def stop_script(self) -> None:
+        """
+        Stop the running script when the script switch is turned off.
+
+        The running script is cancelled and stops at its next check (Ex. before the next AWB is searched). If no script
+        is running, the browser is closed on the job scheduler.
+        """
+        if self.job_scheduler.cancel_all():
+            self.insert_text("Stopping Script.")
         else:
-            self.create_thread(target=self.generate_home_delivery_report)
+            self.job_scheduler.submit("Stop Script", self.stop_script_configuration)
+
+    def script_completed(self, report_name: str, job_future: Future) -> None:
+        """
+        Display the result of a script that was cancelled or failed. Nothing is displayed if the script worked, since
+        the script displays its own progress.
+        :param report_name: Name of the report.
+        :param job_future: The finished Future of the script.
+        """
+        if job_future.cancelled() or isinstance(job_future.exception(), CancelledError):
+            self.insert_text(f"{report_name} was cancelled.", color="red")
+        elif job_future.exception() is not None:
+            self.open_new_window(window=self.error_window, window_class=ErrorWindow,
+                                 theme=self.appearance_option.get(), size="300x200", title="Script Error",
+                                 error_message=f"There was a problem running the {report_name}.\n"
+                                               f"{job_future.exception()}")
+            self.insert_text(f"{report_name} could not be created. Please try again.", color="red")
+
+    def close_app(self) -> None:
+        """
+        Close the app when the window is closed. Every script is cancelled and the idle database connections are
+        closed before the window is destroyed.
+        """
+        self.job_scheduler.shutdown()
+        DatabaseConnector.close_pool()
+        self.destroy()
 
     def open_new_window(self, window: Optional[Union[SettingWindow, ErrorWindow]],
                         window_class: Union[Type[SettingWindow], Type[ErrorWindow]], theme: str, size: str, title: str,
@@ -241,7 +375,7 @@ class CargoInterface(ctk.CTk):
             self.textbox.pack_forget()
             self.script_frame.configure(height=65)
             self.script_frame.pack_propagate(False)
-            self.geometry("370x400")
+            self.geometry("370x440")
 
         else:
             self.load_script_btn.pack_forget()
@@ -253,7 +387,7 @@ class CargoInterface(ctk.CTk):
             self.load_script_btn.pack()
             self.load_script_btn.pack(side="left", padx="19", pady="15", anchor="center")
             self.script_selection_menu.pack(side="left")
-            self.geometry("370x580")
+            self.geometry("370x620")
 
     def display_error(self, title: str, message: str) -> None:
         """
@@ -311,15 +445,6 @@ class CargoInterface(ctk.CTk):
                                                               "in the settings window is an invalid airport."
                                                               "Please try re-running the script.")
 
-    @staticmethod
-    def create_thread(target: callable) -> None:
-        """
-        Creates a thread.
-        :param target: The method you want to start a thread on.
-        """
-        thread = threading.Thread(target=target)
-        thread.start()
-
     @staticmethod
     def set_button_state(button_state: bool, button: ctk.CTkButton) -> None:
         """
@@ -380,6 +505,7 @@ class CargoInterface(ctk.CTk):
         self.start_script()
         if self.script_loaded_properly():
             self.insert_text("Login Successful.")
+            JobScheduler.raise_if_cancelled()
             if self.webpage.check_waybills_to_ship_page(self.webpage_data.get_waybill_url()):
                 try:
                     html_table, day_setting = self.webpage.fill_in_waybills_form()
@@ -389,17 +515,93 @@ class CargoInterface(ctk.CTk):
                 except NoSuchElementException as exception:
                     self.form_error(exception)
                 else:
-                    sla_dict, bot_df, highest_day = CargoInterface.get_sla_bot_data(html_table=html_table,
-                                                                                    day_setting=day_setting)
-                    self.insert_text("Designing SLA/Bot Report.")
-                    self.create_sla_bot_report(sla_dict=sla_dict, bot_df=bot_df, day_sorter=day_setting,
-                                               highest_day=highest_day)
-
+                    JobScheduler.raise_if_cancelled()
+                    track_changes = self.track_changes_var.get() == "on"
+                    output_formats = self.get_output_formats()
+
+                    # The same date/time is used in the file names of the report and the cache manifest.
+                    date_time = ReportDesign.get_date_time()
+
+                    # The Changes sheet depends on the previous run, so a run that tracks changes is never cached.
+                    data_key = report_key = None
+                    sla_bot_values = None
+                    if not track_changes:
+                        data_key = ReportCache.get_key(report_name=CargoInterface.VALID_REPORTS[0],
+                                                       table_html=html_table, settings=self.webpage.form_settings)
+                        report_key = ReportCache.get_key(report_name=CargoInterface.VALID_REPORTS[0],
+                                                         table_html=html_table, settings=self.webpage.form_settings,
+                                                         output_formats=output_formats)
+
+                        if self.report_cache.restore(report_key, date_time) is not None:
+                            self.stop_script_configuration()
+                            self.insert_text("Waybills to Ship Data has not changed. Copied the last SLA/Bot Report.")
+                            self.insert_text(f"SLA/Bot Report created at {CargoInterface.get_created_time()}.")
+                            return
+
+                        sla_bot_values = self.report_cache.get_table_data(data_key)
+
+                    if sla_bot_values is None:
+                        sla_bot_values = CargoInterface.get_sla_bot_data(
+                            html_table=html_table, day_setting=day_setting, settings=self.webpage.form_settings,
+                            track_changes=track_changes)
+                        if data_key is not None:
+                            self.report_cache.put_table_data(data_key, sla_bot_values)
+
+                    # The browser is no longer needed, so it is closed while the report is designed.
                     self.stop_script_configuration()
-                    self.insert_text(f"SLA/Bot Report created at {CargoInterface.get_created_time()}.")
+
+                    sla_dict, bot_df, highest_day, sla_cube, changes_df = sla_bot_values
+                    self.insert_text("Designing SLA/Bot Report.")
+                    report_future = self.create_sla_bot_report(sla_dict=sla_dict, bot_df=bot_df,
+                                                               day_sorter=day_setting, highest_day=highest_day,
+                                                               sla_cube=sla_cube, changes_df=changes_df,
+                                                               output_formats=output_formats, date_time=date_time)
+                    if report_key is not None:
+                        report_future.add_done_callback(lambda future: self.cache_report(report_key, date_time, future))
+
+                    self.watch_report(report_name=CargoInterface.VALID_REPORTS[0], report_future=report_future)
             else:
                 self.load_error(name_of_webpage="waybills to ship")
 
+    def watch_report(self, report_name: str, report_future: Future) -> None:
+        """
+        Report the result of a report that is designed in the background to the GUI once it is done.
+
+        The future finishes on a render thread, so the result is handed to the GUI thread with after().
+        :param report_name: Name of the report.
+        :param report_future: Future of the list of the saved file paths of the report.
+        """
+        report_future.add_done_callback(
+            lambda future: self.after(0, lambda: self.report_completed(report_name=report_name, report_future=future)))
+
+    def report_completed(self, report_name: str, report_future: Future) -> None:
+        """
+        Display the result of a report that was designed in the background.
+
+        The script is not stopped on an error, since the next report could already be running.
+        :param report_name: Name of the report.
+        :param report_future: The finished Future of the list of the saved file paths of the report.
+        """
+        exception = report_future.exception()
+        if exception is not None:
+            self.open_new_window(window=self.error_window, window_class=ErrorWindow,
+                                 theme=self.appearance_option.get(), size="300x200", title="Report Error",
+                                 error_message=f"There was a problem designing the {report_name}.\n{exception}")
+            self.insert_text(f"{report_name} could not be created. Please try again.", color="red")
+        else:
+            self.insert_text(f"{report_name} created at {CargoInterface.get_created_time()}.")
+
+    def cache_report(self, report_key: str, date_time: str, report_future: Future) -> None:
+        """
+        Add the files of a report that was designed in the background to the report cache. Nothing is cached if the
+        report could not be created.
+        :param report_key: Cache key of the report run.
+        :param date_time: Date/time in the file names of the report.
+        :param report_future: The finished Future of the list of the saved file paths of the report.
+        """
+        if report_future.exception() is None:
+            self.report_cache.put(report_key, report_future.result()[0], date_time)
+
     @staticmethod
     def get_created_time() -> str:
         """
@@ -417,6 +619,7 @@ class CargoInterface(ctk.CTk):
         self.start_script()
         if self.script_loaded_properly():
             self.insert_text("Login Successful.")
+            JobScheduler.raise_if_cancelled()
             if self.webpage.check_search_awbs_page(self.webpage_data.get_search_awb_url()):
                 try:
                     self.insert_text("Obtaining list of AWB's.")
@@ -424,79 +627,254 @@ class CargoInterface(ctk.CTk):
                 except TimeoutException as exception:
                     self.form_error(exception)
                 else:
+                    JobScheduler.raise_if_cancelled()
                     self.insert_text("Extracting Home Delivery AWB's. Please wait..")
-                    shipped_awb_df, non_shipped_df = self.get_home_delivery_data(html_table=html_table)
-                    self.insert_text("Designing Home Delivery Report.")
-                    self.create_home_delivery_report(shipped_awb_df=shipped_awb_df, non_shipped_awb_df=non_shipped_df)
-
+                    shipped_awb_df, non_shipped_df, changes_df = self.get_home_delivery_data(
+                        html_table=html_table, track_changes=self.track_changes_var.get() == "on")
+                    # The browser is no longer needed, so it is closed while the report is designed.
                     self.stop_script_configuration()
-                    self.insert_text(f"Home Delivery Report created at {CargoInterface.get_created_time()}.")
+
+                    self.insert_text("Designing Home Delivery Report.")
+                    report_future = self.create_home_delivery_report(shipped_awb_df=shipped_awb_df,
+                                                                     non_shipped_awb_df=non_shipped_df,
+                                                                     changes_df=changes_df,
+                                                                     output_formats=self.get_output_formats())
+                    self.watch_report(report_name=CargoInterface.VALID_REPORTS[1], report_future=report_future)
             else:
                 self.load_error(name_of_webpage="Search AWB")
 
+    def generate_trend_report(self) -> None:
+        """
+        Creates the Trend Report from the report history. The Cargo webpage is not loaded.
+        """
+        self.clear_text()
+        self.set_button_state(button_state=False, button=self.load_script_btn)
+        self.insert_text("Loading Report History.")
+        sla_trend_df, home_delivery_trend_df = CargoInterface.get_trend_data(weeks_back=self.TREND_WEEKS_BACK)
+        JobScheduler.raise_if_cancelled()
+        self.insert_text("Designing Trend Report.")
+        report_future = CargoInterface.create_trend_report(sla_trend_df=sla_trend_df,
+                                                           home_delivery_trend_df=home_delivery_trend_df,
+                                                           weeks_back=self.TREND_WEEKS_BACK,
+                                                           output_formats=self.get_output_formats())
+
+        self.set_button_state(button_state=True, button=self.load_script_btn)
+        self.watch_report(report_name=CargoInterface.VALID_REPORTS[2], report_future=report_future)
+
+    @classmethod
+    def get_trend_data(cls, weeks_back: int) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Get the Trend Report Data.
+
+        :param weeks_back: Number of weeks of report history to use.
+        :return: Returns a tuple of SLA Trend Dataframe and Home Delivery Trend Dataframe.
+        """
+        trend_data = TableData(table_data=None, report_name=cls.VALID_REPORTS[2])
+        trend_data.history_store = HistoryStore()
+        trend_data.weeks_back = weeks_back
+        trend_data.create_report_data(cls.VALID_REPORTS[2])
+        sla_trend_df, home_delivery_trend_df = trend_data.get_trend_data()
+        return sla_trend_df, home_delivery_trend_df
+
+    @classmethod
+    def create_trend_report(cls, sla_trend_df: pd.DataFrame, home_delivery_trend_df: pd.DataFrame,
+                            weeks_back: int, output_formats: tuple = ("xlsx",)) -> Future:
+        """
+        Creates the Trend Report.
+
+        :param sla_trend_df: The SLA Trend Dataframe.
+        :param home_delivery_trend_df: The Home Delivery Trend Dataframe.
+        :param weeks_back: Number of weeks of report history used.
+        :param output_formats: Formats to create. (Default: ("xlsx",))
+        :return: Returns a Future of the list of the saved file paths of every job. The report is designed in the
+            background.
+        """
+        report_renderer = ReportRenderer()
+        return report_renderer.submit([(cls.VALID_REPORTS[2], {"sla_trend_df": sla_trend_df,
+                                                               "home_delivery_trend_df": home_delivery_trend_df,
+                                                               "weeks_back": weeks_back})],
+                                      output_formats=output_formats)
+
     @classmethod
-    def get_sla_bot_data(cls, html_table, day_setting) -> tuple[dict, pd.DataFrame, int]:
+    def save_run_history(cls, report_name: str, table_data: TableData, settings: dict = None) -> str:
+        """
+        Save the extracted tables of a report run to the report history.
+        :param report_name: Name of the report that was run.
+        :param table_data: TableData Object that holds the extracted tables.
+        :param settings: Setting values that were used for the run. (Default: None)
+        :return: Returns the run id of the saved run.
+        """
+        history_store = HistoryStore()
+        return history_store.save_run(report_name=report_name, tables=table_data.get_history_tables(report_name),
+                                      settings=settings, setting_columns=cls.get_setting_columns(report_name))
+
+    @classmethod
+    def get_run_changes(cls, report_name: str, table_data: TableData, settings: dict = None) -> pd.DataFrame:
+        """
+        Get the AWB's that changed since the previous run with the same settings.
+
+        Must be called before the current run is saved to the report history.
+        :param report_name: Name of the report that was run.
+        :param table_data: TableData Object that holds the extracted tables.
+        :param settings: Setting values that were used for the run. (Default: None)
+        :return: Returns the Changes Dataframe.
+        """
+        delta_report = DeltaReport(report_name=report_name, settings=settings,
+                                   setting_columns=cls.get_setting_columns(report_name))
+        return delta_report.create_changes(table_data.get_history_tables(report_name))
+
+    @classmethod
+    def get_setting_columns(cls, report_name: str) -> list:
+        """
+        Get the columns of the settings table of a report. Only these settings are used to match the runs of a report
+        in the report history.
+        :param report_name: Name of the report.
+        :return: Returns the list of setting columns.
+        """
+        return SettingsData.SETTING_COLUMNS[cls.REPORT_SETTING_TABLES[report_name]]
+
+    @classmethod
+    def get_sla_bot_data(cls, html_table, day_setting, settings: dict = None,
+                         track_changes: bool = False) -> tuple[dict, pd.DataFrame, int, pd.DataFrame, pd.DataFrame]:
         """
         Get the SLA/Bot Report Data.
 
         Method is responsible for creating the TableData Object for extracting the necessary data to create
-        the SLA/Bot Report.
+        the SLA/Bot Report. The extracted tables are saved to the report history.
         :param html_table: The HTML Table to extract.
         :param day_setting: The value for "DayAmount" in the Database.
-        :return: Returns a tuple of data for SLA Data, Bot Dataframe and Highest Day value.
+        :param settings: Setting values that were used to fill in the form. (Default: None)
+        :param track_changes: Get the AWB's that changed since the previous run. (Default: False)
+        :return: Returns a tuple of data for SLA Data, Bot Dataframe, Highest Day value, SLA Cube and Changes
+            Dataframe (None if track_changes is False).
         """
         sla_bot_data = TableData(table_data=html_table, report_name=cls.VALID_REPORTS[0])
         sla_bot_data.day_sorter = day_setting
         sla_bot_data.create_report_data(cls.VALID_REPORTS[0])
-        sla_data, bot_df, highest_day = sla_bot_data.get_sla_bot_data()
-        return sla_data, bot_df, highest_day
+
+        changes_df = None
+        if track_changes:
+            changes_df = cls.get_run_changes(report_name=cls.VALID_REPORTS[0], table_data=sla_bot_data,
+                                             settings=settings)
+
+        cls.save_run_history(report_name=cls.VALID_REPORTS[0], table_data=sla_bot_data, settings=settings)
+        sla_data, bot_df, highest_day, sla_cube = sla_bot_data.get_sla_bot_data()
+        return sla_data, bot_df, highest_day, sla_cube, changes_df
 
     @classmethod
-    def create_sla_bot_report(cls, sla_dict: dict, bot_df: pd.DataFrame, highest_day, day_sorter) -> None:
+    def create_sla_bot_report(cls, sla_dict: dict, bot_df: pd.DataFrame, highest_day, day_sorter,
+                              sla_cube: pd.DataFrame, changes_df: pd.DataFrame = None,
+                              output_formats: tuple = ("xlsx",), file_label: str = None,
+                              date_time: str = None) -> Future:
         """
         Creates the SLA/Bot Report.
 
-        Method is responsible for creating the ReportDesign Object for designing the SLA/Bot Report Data.
+        Method is responsible for sending the SLA/Bot Report Data to the ReportRenderer to be designed.
         :param sla_dict: SLA Dictionary.
         :param bot_df: Bot Report Dataframe
         :param highest_day: The highest day value.
         :param day_sorter: The Day Sorter value (pulled from Database)
+        :param sla_cube: SLA Cube Dataframe.
+        :param changes_df: Changes Dataframe. (Default: None [No Changes sheet])
+        :param output_formats: Formats to create. (Default: ("xlsx",))
+        :param file_label: Label added to the end of the file names. (Default: None [No label])
+        :param date_time: Date/time in the file names. (Default: None [Time the report is designed])
+        :return: Returns a Future of the list of the saved file paths of every job. The report is designed in the
+            background.
+        """
+        report_renderer = ReportRenderer()
+        return report_renderer.submit([cls.get_sla_bot_report_job(sla_dict=sla_dict, bot_df=bot_df,
+                                                                  highest_day=highest_day, day_sorter=day_sorter,
+                                                                  sla_cube=sla_cube, changes_df=changes_df,
+                                                                  file_label=file_label, date_time=date_time)],
+                                      output_formats=output_formats)
+
+    @classmethod
+    def get_sla_bot_report_job(cls, sla_dict: dict, bot_df: pd.DataFrame, highest_day, day_sorter,
+                               sla_cube: pd.DataFrame, changes_df: pd.DataFrame = None,
+                               file_label: str = None, date_time: str = None) -> tuple[str, dict]:
         """
-        report_design = ReportDesign(report_name=cls.VALID_REPORTS[0])
-        report_design.sla_data = sla_dict
-        report_design.bot_df = bot_df
-        report_design.day_sorter = day_sorter * -1
-        report_design.highest_day = highest_day
-        report_design.create_report(report_name=cls.VALID_REPORTS[0])
+        Gets the ReportRenderer job of the SLA/Bot Report.
 
-    def get_home_delivery_data(self, html_table) -> tuple[pd.DataFrame, pd.DataFrame]:
+        :param sla_dict: SLA Dictionary.
+        :param bot_df: Bot Report Dataframe
+        :param highest_day: The highest day value.
+        :param day_sorter: The Day Sorter value (pulled from Database)
+        :param sla_cube: SLA Cube Dataframe.
+        :param changes_df: Changes Dataframe. (Default: None [No Changes sheet])
+        :param file_label: Label added to the end of the file names. (Default: None [No label])
+        :param date_time: Date/time in the file names. (Default: None [Time the report is designed])
+        :return: Returns a tuple of the report name and a dictionary of the ReportDesign instance attributes.
+        """
+        return cls.VALID_REPORTS[0], {"sla_data": sla_dict, "sla_cube": sla_cube, "changes_df": changes_df,
+                                      "bot_df": bot_df, "day_sorter": day_sorter * -1, "highest_day": highest_day,
+                                      "file_label": file_label, "date_time": date_time}
+
+    def get_home_delivery_data(self, html_table,
+                               track_changes: bool = False) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
         """
         Get the Home Delivery Report Data.
 
+        The extracted tables are saved to the report history.
         :param html_table: The HTML Table to extract.
-        :return: Returns a tuple of shipped AWB dataframe and non-shipped awb Dataframe.
+        :param track_changes: Get the AWB's that changed since the previous run. (Default: False)
+        :return: Returns a tuple of shipped AWB dataframe, non-shipped awb Dataframe and Changes Dataframe (None if
+            track_changes is False).
         """
         home_delivery_data = TableData(table_data=html_table, report_name=self.VALID_REPORTS[1])
-        awb_list = home_delivery_data.get_awb_list()
-        home_delivery_awbs = self.webpage.search_awb(awb_list=awb_list)
+        awb_batch = home_delivery_data.get_awb_batch()
+        home_delivery_awbs = self.webpage.search_awb(awb_batch=awb_batch,
+                                                     cancel_event=JobScheduler.get_cancel_event())
 
-        home_delivery_data.home_delivery_awb_list = home_delivery_awbs
+        home_delivery_data.home_delivery_awb_batch = home_delivery_awbs
         home_delivery_data.create_report_data(self.VALID_REPORTS[1])
+
+        changes_df = None
+        if track_changes:
+            changes_df = self.get_run_changes(report_name=self.VALID_REPORTS[1], table_data=home_delivery_data,
+                                              settings=self.webpage.form_settings)
+
+        self.save_run_history(report_name=self.VALID_REPORTS[1], table_data=home_delivery_data,
+                              settings=self.webpage.form_settings)
         shipped_awb_df, non_shipped_df = home_delivery_data.get_home_delivery_data()
-        return shipped_awb_df, non_shipped_df
+        return shipped_awb_df, non_shipped_df, changes_df
 
     @classmethod
-    def create_home_delivery_report(cls, shipped_awb_df: pd.DataFrame, non_shipped_awb_df: pd.DataFrame) -> None:
+    def create_home_delivery_report(cls, shipped_awb_df: pd.DataFrame, non_shipped_awb_df: pd.DataFrame,
+                                    changes_df: pd.DataFrame = None, output_formats: tuple = ("xlsx",),
+                                    file_label: str = None) -> Future:
         """
         Creates the Home Delivery Report.
 
         :param shipped_awb_df: The shipped AWB Dataframe.
         :param non_shipped_awb_df: The non-shipped AWB dataframe.
+        :param changes_df: Changes Dataframe. (Default: None [No Changes sheet])
+        :param output_formats: Formats to create. (Default: ("xlsx",))
+        :param file_label: Label added to the end of the file names. (Default: None [No label])
+        :return: Returns a Future of the list of the saved file paths of every job. The report is designed in the
+            background.
+        """
+        report_renderer = ReportRenderer()
+        return report_renderer.submit([cls.get_home_delivery_report_job(shipped_awb_df=shipped_awb_df,
+                                                                        non_shipped_awb_df=non_shipped_awb_df,
+                                                                        changes_df=changes_df,
+                                                                        file_label=file_label)],
+                                      output_formats=output_formats)
+
+    @classmethod
+    def get_home_delivery_report_job(cls, shipped_awb_df: pd.DataFrame, non_shipped_awb_df: pd.DataFrame,
+                                     changes_df: pd.DataFrame = None, file_label: str = None) -> tuple[str, dict]:
+        """
+        Gets the ReportRenderer job of the Home Delivery Report.
+
+        :param shipped_awb_df: The shipped AWB Dataframe.
+        :param non_shipped_awb_df: The non-shipped AWB dataframe.
+        :param changes_df: Changes Dataframe. (Default: None [No Changes sheet])
+        :param file_label: Label added to the end of the file names. (Default: None [No label])
+        :return: Returns a tuple of the report name and a dictionary of the ReportDesign instance attributes.
         """
-        report_design = ReportDesign(report_name=cls.VALID_REPORTS[1])
-        report_design.shipped_awb_df = shipped_awb_df
-        report_design.non_shipped_awb_df = non_shipped_awb_df
-        report_design.create_report(report_name=cls.VALID_REPORTS[1])
+        return cls.VALID_REPORTS[1], {"shipped_awb_df": shipped_awb_df, "non_shipped_awb_df": non_shipped_awb_df,
+                                      "changes_df": changes_df, "file_label": file_label}
 
     def script_loaded_properly(self) -> bool:
         """
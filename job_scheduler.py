@@ -0,0 +1,203 @@
+from concurrent.futures import CancelledError
+import queue
+import threading
+from scheduled_job import ScheduledJob
+from utils import type_check
+
+
+class JobScheduler:
+    """
+    Runs jobs on a bounded pool of worker threads.
+
+    Jobs wait in a bounded queue and run in the order they were submitted, at most max_workers at a time. A job that
+    is submitted while a job with the same name is queued or running is merged into that job, so clicking a button
+    twice doesn't run the same work twice. Every job keeps its own state and cancel event. The target of a running job
+    can get its cancel event with get_cancel_event, or call raise_if_cancelled between steps.
+
+      Attributes:
+        - max_workers (int): Largest number of jobs that run at the same time.
+        - max_queued_jobs (int): Largest number of jobs waiting in the queue.
+      Methods:
+        - submit: Queue a job, or get the queued or running job with the same name.
+        - cancel: Cancel the job with a name.
+        - cancel_all: Cancel every queued and running job.
+        - get_states: Get the states of the queued and running jobs.
+        - shutdown: Cancel every job and stop the workers.
+        - get_cancel_event: Get the cancel event of the job running on the current thread.
+        - raise_if_cancelled: Raise CancelledError if the job running on the current thread was cancelled.
+    """
+
+    # Number of jobs that run at the same time when no max_workers is passed in.
+    MAX_WORKERS = 2
+
+    # Number of jobs that can wait in the queue when no max_queued_jobs is passed in.
+    MAX_QUEUED_JOBS = 4
+
+    # Job running on the current worker thread.
+    _current = threading.local()
+
+    def __init__(self, max_workers: int = None, max_queued_jobs: int = None):
+        """
+        Initializes a JobScheduler Object. The workers are started when the first job is submitted.
+
+        :param max_workers: Largest number of jobs that run at the same time. (Default: None
+            [JobScheduler.MAX_WORKERS])
+        :param max_queued_jobs: Largest number of jobs waiting in the queue. (Default: None
+            [JobScheduler.MAX_QUEUED_JOBS])
+        :raise ValueError: Will raise error if max_workers or max_queued_jobs is less than 1.
+        """
+        self.max_workers = max_workers if max_workers is not None else JobScheduler.MAX_WORKERS
+        self.max_queued_jobs = max_queued_jobs if max_queued_jobs is not None else JobScheduler.MAX_QUEUED_JOBS
+
+        for name, value in (("max_workers", self.max_workers), ("max_queued_jobs", self.max_queued_jobs)):
+            type_check(arg=value, arg_name=name, expected_type=int)
+            if value < 1:
+                raise ValueError(f"{name} can't be less than 1.")
+
+        self._queue = queue.Queue(maxsize=self.max_queued_jobs)
+        self._jobs = {}
+        self._workers = []
+        self._lock = threading.Lock()
+
+    def submit(self, name: str, target: callable, *args, **kwargs) -> ScheduledJob:
+        """
+        Queue a job. If a job with the same name is queued or running, that job is returned instead.
+        :param name: Name of the job.
+        :param target: The method the job runs.
+        :param args: Positional arguments passed to the target.
+        :param kwargs: Keyword arguments passed to the target.
+        :return: Returns the ScheduledJob.
+        :raise queue.Full: Will raise error if the queue is full.
+        """
+        with self._lock:
+            active_job = self._jobs.get(name)
+            if active_job is not None and active_job.is_active():
+                active_job.request_count += 1
+                return active_job
+
+            scheduled_job = ScheduledJob(name=name, target=target, args=args, kwargs=kwargs)
+            self._queue.put_nowait(scheduled_job)
+            self._jobs[name] = scheduled_job
+
+            if len(self._workers) < self.max_workers:
+                worker = threading.Thread(target=self._worker_loop, name=f"job-worker-{len(self._workers)}",
+                                          daemon=True)
+                self._workers.append(worker)
+                worker.start()
+
+        return scheduled_job
+
+    def cancel(self, name: str) -> bool:
+        """
+        Cancel the job with a name. A queued job is cancelled straight away. A running job has its cancel event set
+        and stops once its target checks the event.
+        :param name: Name of the job.
+        :return: Returns True if a queued or running job was cancelled, otherwise False.
+        """
+        with self._lock:
+            scheduled_job = self._jobs.get(name)
+            if scheduled_job is None or not scheduled_job.is_active():
+                return False
+
+            scheduled_job.cancel_event.set()
+            if scheduled_job.state == ScheduledJob.QUEUED:
+                scheduled_job.state = ScheduledJob.CANCELLED
+                del self._jobs[name]
+            else:
+                return True
+
+        # Done callbacks run outside the lock, so they can submit new jobs.
+        scheduled_job.future.cancel()
+        return True
+
+    def cancel_all(self) -> bool:
+        """
+        Cancel every queued and running job.
+        :return: Returns True if a job was cancelled, otherwise False.
+        """
+        with self._lock:
+            job_names = list(self._jobs.keys())
+
+        cancelled = [self.cancel(job_name) for job_name in job_names]
+        return any(cancelled)
+
+    def get_states(self) -> dict:
+        """
+        Get the states of the queued and running jobs that were not cancelled.
+        :return: Returns a dictionary where the keys are the job names and the values are the states of those jobs.
+        """
+        with self._lock:
+            return {name: scheduled_job.state for name, scheduled_job in self._jobs.items()
+                    if scheduled_job.is_active()}
+
+    def shutdown(self) -> None:
+        """
+        Cancel every job and stop the workers once their running jobs stop. The scheduler can't be used after.
+        """
+        self.cancel_all()
+        with self._lock:
+            workers = list(self._workers)
+
+        # Every worker stops when it takes a None from the queue.
+        for _ in workers:
+            self._queue.put(None)
+
+    @classmethod
+    def get_cancel_event(cls):
+        """
+        Get the cancel event of the job running on the current thread.
+        :return: Returns the threading.Event of the job. Returns None if no job is running on the current thread.
+        """
+        scheduled_job = getattr(cls._current, "job", None)
+        return scheduled_job.cancel_event if scheduled_job is not None else None
+
+    @classmethod
+    def raise_if_cancelled(cls) -> None:
+        """
+        Raise CancelledError if the job running on the current thread was cancelled. Nothing happens if no job is
+        running on the current thread.
+        :raise CancelledError: Will raise error if the job was cancelled.
+        """
+        cancel_event = cls.get_cancel_event()
+        if cancel_event is not None and cancel_event.is_set():
+            raise CancelledError(f"{cls._current.job.name} was cancelled.")
+
+    def _worker_loop(self) -> None:
+        """
+        Run queued jobs until a None is taken from the queue. A job that raises CancelledError is Cancelled and a job
+        that raises any other exception is Failed. The exception is set on the future of the job.
+        """
+        while True:
+            scheduled_job = self._queue.get()
+            if scheduled_job is None:
+                return
+
+            with self._lock:
+                if scheduled_job.state == ScheduledJob.CANCELLED:
+                    continue
+                scheduled_job.state = ScheduledJob.RUNNING
+
+            scheduled_job.future.set_running_or_notify_cancel()
+            JobScheduler._current.job = scheduled_job
+            result = exception = None
+            try:
+                result = scheduled_job.target(*scheduled_job.args, **scheduled_job.kwargs)
+            except CancelledError as cancelled_error:
+                exception, state = cancelled_error, ScheduledJob.CANCELLED
+            except Exception as job_error:
+                exception, state = job_error, ScheduledJob.FAILED
+            else:
+                state = ScheduledJob.DONE
+            finally:
+                JobScheduler._current.job = None
+
+            # The job is removed before its future is done, so a done callback can submit the same job again.
+            with self._lock:
+                scheduled_job.state = state
+                if self._jobs.get(scheduled_job.name) is scheduled_job:
+                    del self._jobs[scheduled_job.name]
+
+            if exception is not None:
+                scheduled_job.future.set_exception(exception)
+            else:
+                scheduled_job.future.set_result(result)
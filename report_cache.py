@@ -0,0 +1,183 @@
+from collections import OrderedDict
+from datetime import date
+import hashlib
+import json
+import os
+import shutil
+
+
+class ReportCache:
+    """
+    A content-addressed cache of parsed report data and rendered report files.
+
+    The cache key is a hash of the report name, the extracted HTML table, the settings, the current date and (for
+    rendered files) the output formats. The date is part of the key, since the "Days" column and the date header
+    change every day. Rendered files are stored in the cache folder and are evicted by least recent use once the
+    cache folder is bigger than max_bytes. Parsed report data is only kept in memory for the session.
+
+      Attributes:
+        - folder_path (str): Path of the cache folder.
+        - max_bytes (int): Largest size of the cache folder in bytes.
+        - max_entries (int): Largest number of parsed report data entries kept in memory.
+      Methods:
+        - get_key: Get the cache key of a report run.
+        - restore: Copy the cached files of a report run under a new timestamped name.
+        - put: Add the rendered files of a report run to the cache.
+        - get_table_data: Get the cached parsed report data of a report run.
+        - put_table_data: Add the parsed report data of a report run to the cache.
+    """
+
+    CACHE_FOLDER = "Report Cache"
+    MANIFEST_NAME = "manifest.json"
+    MAX_CACHE_BYTES = 200 * 1024 * 1024
+    MAX_TABLE_DATA_ENTRIES = 8
+
+    def __init__(self, folder_path: str = None, max_bytes: int = None, max_entries: int = None):
+        """
+        Initializes a ReportCache Object.
+
+        :param folder_path: Path of the cache folder. (Default: 'Report Cache' folder in the current directory)
+        :param max_bytes: Largest size of the cache folder in bytes. (Default: None [ReportCache.MAX_CACHE_BYTES])
+        :param max_entries: Largest number of parsed report data entries kept in memory.
+            (Default: None [ReportCache.MAX_TABLE_DATA_ENTRIES])
+        """
+        if folder_path is None:
+            folder_path = os.path.join(os.getcwd(), ReportCache.CACHE_FOLDER)
+
+        self.folder_path = folder_path
+        self.max_bytes = max_bytes if max_bytes is not None else ReportCache.MAX_CACHE_BYTES
+        self.max_entries = max_entries if max_entries is not None else ReportCache.MAX_TABLE_DATA_ENTRIES
+        self._table_data = OrderedDict()
+
+    @staticmethod
+    def get_key(report_name: str, table_html: str, settings: dict = None, output_formats: tuple = None) -> str:
+        """
+        Get the cache key of a report run.
+        :param report_name: Name of the report.
+        :param table_html: The extracted HTML table.
+        :param settings: Settings that were used for the run. (Default: None)
+        :param output_formats: Output formats of the rendered files. Leave out for the key of the parsed report data.
+            (Default: None)
+        :return: Returns the cache key as a hex string.
+        """
+        run_values = json.dumps({"report_name": report_name, "settings": settings, "date": date.today().isoformat(),
+                                 "output_formats": output_formats}, sort_keys=True, default=str)
+
+        key_hash = hashlib.sha256(run_values.encode("utf-8"))
+        key_hash.update(table_html.encode("utf-8"))
+        return key_hash.hexdigest()
+
+    def restore(self, cache_key: str, date_time: str):
+        """
+        Copy the cached files of a report run under a new timestamped name.
+
+        The files are hard-linked into the report folders when possible and copied otherwise. The date/time in the
+        cached file names is replaced with the new date/time.
+        :param cache_key: Cache key of the report run.
+        :param date_time: New date/time for the file names. (Ex. 'March 25, 2023 - 1015AM')
+        :return: Returns a list of the new file paths. Returns None if the report run is not cached.
+        """
+        entry_path = os.path.join(self.folder_path, cache_key)
+        manifest_path = os.path.join(entry_path, ReportCache.MANIFEST_NAME)
+
+        if not os.path.isfile(manifest_path):
+            return None
+
+        with open(manifest_path, "r", encoding="utf-8") as manifest_file:
+            manifest = json.load(manifest_file)
+
+        file_paths = []
+        for folder_path, file_name in manifest["files"]:
+            os.makedirs(folder_path, exist_ok=True)
+            new_path = os.path.join(folder_path, file_name.replace(manifest["date_time"], date_time))
+            if os.path.exists(new_path):
+                os.remove(new_path)
+
+            try:
+                os.link(os.path.join(entry_path, file_name), new_path)
+            except OSError:
+                shutil.copy2(os.path.join(entry_path, file_name), new_path)
+            file_paths.append(new_path)
+
+        # Mark the entry as recently used.
+        os.utime(entry_path)
+
+        return file_paths
+
+    def put(self, cache_key: str, file_paths: list, date_time: str) -> bool:
+        """
+        Add the rendered files of a report run to the cache. Least recently used entries are evicted after.
+
+        The files are not cached if the date/time is not part of every file name (Ex. the minute changed while the
+        report was rendered), since they could not be given a new name when restored.
+        :param cache_key: Cache key of the report run.
+        :param file_paths: List of the rendered file paths.
+        :param date_time: Date/time in the file names. (Ex. 'March 25, 2023 - 1015AM')
+        :return: Returns True if the files were cached.
+        """
+        if not file_paths or any(date_time not in os.path.basename(file_path) for file_path in file_paths):
+            return False
+
+        entry_path = os.path.join(self.folder_path, cache_key)
+        os.makedirs(entry_path, exist_ok=True)
+
+        for file_path in file_paths:
+            shutil.copy2(file_path, os.path.join(entry_path, os.path.basename(file_path)))
+
+        manifest = {"date_time": date_time,
+                    "files": [[os.path.dirname(file_path), os.path.basename(file_path)] for file_path in file_paths]}
+        with open(os.path.join(entry_path, ReportCache.MANIFEST_NAME), "w", encoding="utf-8") as manifest_file:
+            json.dump(manifest, manifest_file)
+
+        self._evict(keep_key=cache_key)
+        return True
+
+    def get_table_data(self, cache_key: str):
+        """
+        Get the cached parsed report data of a report run.
+        :param cache_key: Cache key of the report run. (Without output formats)
+        :return: Returns the parsed report data. Returns None if the report run is not cached.
+        """
+        if cache_key not in self._table_data:
+            return None
+
+        self._table_data.move_to_end(cache_key)
+        return self._table_data[cache_key]
+
+    def put_table_data(self, cache_key: str, table_data) -> None:
+        """
+        Add the parsed report data of a report run to the cache. The least recently used entry is evicted once there
+        are more than max_entries entries.
+        :param cache_key: Cache key of the report run. (Without output formats)
+        :param table_data: Parsed report data. (Ex. The tuple returned by CargoInterface.get_sla_bot_data)
+        """
+        self._table_data[cache_key] = table_data
+        self._table_data.move_to_end(cache_key)
+
+        while len(self._table_data) > self.max_entries:
+            self._table_data.popitem(last=False)
+
+    def _evict(self, keep_key: str = None) -> None:
+        """
+        Remove the least recently used entries until the cache folder is no bigger than max_bytes.
+        :param keep_key: Cache key of an entry that is never removed. (Default: None)
+        """
+        entries = []
+        for cache_key in os.listdir(self.folder_path):
+            entry_path = os.path.join(self.folder_path, cache_key)
+            if not os.path.isdir(entry_path):
+                continue
+
+            entry_size = sum(os.path.getsize(os.path.join(entry_path, file_name))
+                             for file_name in os.listdir(entry_path))
+            entries.append((os.path.getmtime(entry_path), cache_key, entry_path, entry_size))
+
+        total_size = sum(entry[3] for entry in entries)
+        for _, cache_key, entry_path, entry_size in sorted(entries):
+            if total_size <= self.max_bytes:
+                break
+            if cache_key == keep_key:
+                continue
+
+            shutil.rmtree(entry_path, ignore_errors=True)
+            total_size -= entry_size
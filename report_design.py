@@ -1,12 +1,18 @@
 from datetime import date, datetime
+from io import BytesIO
+import math
 import os
-from openpyxl.styles import PatternFill, Border, Side, Alignment, Font
+import tempfile
 from openpyxl.drawing.image import Image
-from openpyxl import load_workbook
-from openpyxl import Workbook
+from openpyxl.formatting.rule import FormulaRule
+from openpyxl.utils import get_column_letter
+from openpyxl.utils.cell import column_index_from_string, range_boundaries
+from openpyxl.worksheet.worksheet import Worksheet
+from openpyxl import Workbook, load_workbook
 import pandas as pd
-import tempfile
-import shutil
+from PIL import Image as PILImage
+from report_styles import ReportStyles
+from sheet_streamer import SheetStreamer
 from utils import type_check
 
 
@@ -16,21 +22,46 @@ class ReportDesign:
 
       Attributes:
         - sla_data (dict): SLA Data Dictionary
+        - sla_cube (Dataframe): SLA Cube of Weight, Pieces and AWB Count by Destination, Route, Day Bucket and SLA State
         - bot_df (Dataframe): Bot Data Frame
         - day_sorter (int): Day value that was used to filter the "Days" column.
         - highest_day (int): Highest value in the "Day" Column
         - shipped_awb_df (Dataframe): Shipped AWB Dataframe
         - non_shipped_df (Dataframe): Non-Shipped AWB Dataframe
+        - sla_trend_df (Dataframe): Average days AWB's stay past SLA by destination and week
+        - home_delivery_trend_df (Dataframe): Average days Home Delivery AWB's take to be allocated by community and
+            week
+        - weeks_back (int): Number of weeks of report history used in the Trend Report
+        - changes_df (Dataframe): New, resolved and changed AWB's since the previous run. (None to leave out the
+            Changes sheet)
+        - streaming (bool): Render the report in streaming mode. (None to use streaming mode only when a table has
+            more rows than ReportDesign.STREAMING_ROW_THRESHOLD)
+        - file_label (str): Label added to the end of the report file names, so reports created at the same time
+            don't overwrite each other. (Ex. 'YTH') (None for no label)
+        - date_time (str): Date and time in the report file names. (None to use the time the report is saved)
+        - file_path (str): Path of the saved report workbook. (None until the report is saved)
+        - report_bytes (bytes): The report workbook as bytes. Only set when create_report is asked to return the
+            bytes instead of saving the report.
+        - header_coordinates (dict): Header index of every sheet. The keys are the sheet names and the values are
+            dictionaries of the header text and the list of cell coordinates with that text.
       Methods:
         - create_report: Creates SLA/Bot or Home Delivery Report
         - set_column_widths: Set column width
+        - get_auto_widths: Get column widths that fit the data of a Dataframe.
         - create_full_borders: Sets borders around a cell.
         - change_font: Change font of a cell.
         - fill_color: Change fill color of a cell.
+        - add_range_borders: Sets borders around every cell in a range.
+        - add_zebra_rows: Fill every second row in a range.
         - hide_gridlines: Hide gridlines.
         - all_cell_styles: Style all cells.
         - get_cell_coordinate: Get cell coordinates based on text.
+        - get_sla_pivot: Get a pivot table from the SLA Cube.
         - get_date_time: Get datetime now
+        - get_template: Get the template workbook of a report.
+        - write_file: Write a file atomically.
+        - get_image: Get an image from the image cache.
+        - use_streaming: Check if the report should be rendered in streaming mode.
         - create_folder: Create a folder in current directory.
         - invalid_name: Checks if a file, folder or sheet name contains invalid characters.
     """
@@ -38,9 +69,60 @@ class ReportDesign:
     # Valid Report constant which contains the report name and a tuple of the method name to be called along with the
     # instance attributes to be created at runtime.
     VALID_REPORT_DESIGN = {
-        "SLA/Bot Report": ("_create_bot_sla_report", ("sla_data", "bot_df", "day_sorter", "highest_day")),
-        "Home Delivery Report": ("_create_home_delivery_report", ("shipped_awb_df", "non_shipped_awb_df"))
+        "SLA/Bot Report": ("_create_bot_sla_report", ("sla_data", "bot_df", "day_sorter", "highest_day",
+                                                      "sla_cube", "changes_df")),
+        "Home Delivery Report": ("_create_home_delivery_report", ("shipped_awb_df", "non_shipped_awb_df",
+                                                                  "changes_df")),
+        "Trend Report": ("_create_trend_report", ("sla_trend_df", "home_delivery_trend_df", "weeks_back"))
+    }
+
+    # Valid Templates constant which contains the report name and the method that designs the static parts of that
+    # report (logo, reference header, title headers, column widths and gridlines). Increase TEMPLATE_VERSION whenever
+    # a template method or the logo changes, so the saved templates are built again.
+    VALID_TEMPLATES = {
+        "SLA/Bot Report": "_sla_bot_template_design",
+        "Home Delivery Report": "_home_delivery_template_design",
     }
+    TEMPLATE_VERSION = 1
+    TEMPLATE_FOLDER = "Report Templates"
+
+    # Template workbooks already read in this session. The keys are the report names and the values are the bytes of
+    # the template workbook.
+    _template_cache = {}
+
+    LOGO_FILE = "logo.png"
+    # Largest size (width, height) in pixels the logo is displayed at. A bigger logo is downscaled to fit. (None to
+    # display the logo at its original size)
+    LOGO_MAX_SIZE = None
+
+    # Images already read in this session. The keys are a tuple of the image path and the max size and the values
+    # are the encoded PNG bytes.
+    _image_cache = {}
+
+    # Reports with a table longer than this number of rows are rendered in streaming mode. Streaming mode writes the
+    # rows to a write-only workbook in chunks, so memory use doesn't grow with the number of rows.
+    STREAMING_ROW_THRESHOLD = 50000
+
+    # A column is as wide as its longest value (or header) plus AUTO_WIDTH_PADDING, but never wider than
+    # MAX_COLUMN_WIDTH. The custom column widths of a report are the minimum widths.
+    AUTO_WIDTH_PADDING = 2
+    MAX_COLUMN_WIDTH = 60
+
+    # Fill color of every change type in the "Change" column of the Changes sheet.
+    CHANGE_COLORS = {"New": "00ff00", "Changed": "ffff00", "Resolved": "b7b7b7"}
+
+    # Column of an SLA pivot table that holds the rows without a "Recvd Date".
+    NO_DAY_BUCKET = "No Recvd Date"
+
+    # Pivot tables displayed on the SLA Breakdown sheet. Each tuple contains the title of the pivot table, the SLA
+    # State to filter by (None for all states), the level of the SLA Cube to use as the columns and the value to
+    # display.
+    SLA_BREAKDOWN_PIVOTS = [
+        ("Past SLA Weight by Days", "Past SLA", "Day Bucket", "Weight"),
+        ("Past SLA Pieces by Days", "Past SLA", "Day Bucket", "Pieces"),
+        ("AWB Count by SLA State", None, "SLA State", "AWB Count"),
+        ("Weight by SLA State", None, "SLA State", "Weight"),
+    ]
 
     def __init__(self, report_name: str):
         """
@@ -58,9 +140,15 @@ class ReportDesign:
         :raise KeyError: If the specified report name is not one of the valid report names defined in
             ReportDesign.VALID_REPORT_DESIGN.
         """
-        self.temp_file = None
         self.workbook = None
         self.sheet = None
+        self.header_coordinates = {}
+        self.streaming = None
+        self.file_label = None
+        self.date_time = None
+        self.file_path = None
+        self.report_bytes = None
+        self._return_bytes = False
 
         if report_name not in ReportDesign.VALID_REPORT_DESIGN.keys():
             raise KeyError(f"{report_name} is not a valid report. Valid reports are "
@@ -74,7 +162,7 @@ class ReportDesign:
         for var in instance_variables:
             setattr(self, var, None)
 
-    def create_report(self, report_name: str) -> None:
+    def create_report(self, report_name: str, return_bytes: bool = False):
         """
         Creates a report based on the specific name.
 
@@ -82,6 +170,9 @@ class ReportDesign:
         _create_home_delivery_report will be executed.
 
         :param report_name:  The name of the report to create.
+        :param return_bytes: Return the report workbook as bytes instead of saving the report files to the report
+            folder. (Default: False)
+        :return: Returns the report workbook as bytes if return_bytes is True. Otherwise, returns None.
         :raise KeyError: If the specified report name is not one of the valid report names defined in
             ReportDesign.VALID_REPORT_DESIGN.
         """
@@ -93,26 +184,67 @@ class ReportDesign:
         name_of_report = ReportDesign.VALID_REPORT_DESIGN[report_name][0]
 
         # Store the method object in report_method and then call that method based on the report_name passed in.
+        self._return_bytes = return_bytes
         report_method = getattr(self, name_of_report)
         report_method()
 
+        return self.report_bytes if return_bytes else None
+
     def set_column_widths(self, column_widths: dict) -> None:
         """
         Set column width from a dictionary of columns.
 
-        :param column_widths: Pass in a dictionary where the Keys are the columns (Ex. A, B) and the values are
-            the width you want to set that column to (Ex. 50). (Ex. column_custom_width = {"A": 100, "B": 50}
+        :param column_widths: Pass in a dictionary where the Keys are the columns (Ex. A, B, AA) and the values are
+            the width you want to set that column to (Ex. 50). (Ex. column_custom_width = {"A": 100, "AB": 50}
 
-        :raise ValueError: Will raise an error if the dictionary key is not a letter or if the length of the key is
-            greater than 1. Also, will raise a KeyError if the width value in the dictionary is not an int.
+        :raise ValueError: Will raise an error if the dictionary key is not the name of an Excel column (A to XFD).
+            Also, will raise a TypeError if the width value in the dictionary is not an int.
         """
         for column_name, width in column_widths.items():
             type_check(arg=width, arg_name="width", expected_type=int)
-            if not column_name.isalpha() or len(column_name) != 1:
+            try:
+                column_index_from_string(column_name)
+            except ValueError:
                 raise ValueError(f"Please ensure when passing column_custom_width that the Keys are"
-                                 f" the name of the column. (Ex. 'A' or 'B' or 'C'")
-            else:
-                self.sheet.column_dimensions[column_name].width = width
+                                 f" the name of the column. (Ex. 'A' or 'B' or 'AA'") from None
+
+            self.sheet.column_dimensions[column_name].width = width
+
+    @classmethod
+    def get_auto_widths(cls, dataframe: pd.DataFrame, start_col: int, min_widths: dict = None,
+                        max_width: int = None, index: bool = False, header_size: int = 11) -> dict:
+        """
+        Get column widths that fit the data of a Dataframe.
+
+        The widths are computed from the Dataframe before it is written, with 1 vectorized string length per column,
+        so the cells of the sheet never have to be read.
+        :param dataframe: Dataframe written to the sheet.
+        :param start_col: Column position of the first Dataframe column (or the index if index is True).
+        :param min_widths: Dictionary of column letters and minimum widths. Columns outside of the Dataframe keep
+            their minimum width. (Default: None)
+        :param max_width: Largest width of a column. (Default: None [ReportDesign.MAX_COLUMN_WIDTH])
+        :param index: The index is written in the first column. (Default: False)
+        :param header_size: Font size of the header. A bigger header needs a wider column. (Default: 11)
+        :return: Returns a dictionary of column letters and widths.
+        """
+        min_widths = min_widths if min_widths is not None else {}
+        max_width = max_width if max_width is not None else cls.MAX_COLUMN_WIDTH
+
+        columns = [(header, dataframe.iloc[:, position]) for position, header in enumerate(dataframe.columns)]
+        if index:
+            columns.insert(0, (dataframe.index.name, dataframe.index.to_series()))
+
+        column_widths = dict(min_widths)
+        for column_number, (header, values) in enumerate(columns, start=start_col):
+            value_width = values.dropna().astype(str).str.len().max()
+            value_width = 0 if pd.isna(value_width) else int(value_width)
+            header_width = math.ceil(len(str(header if header is not None else "")) * header_size / 11)
+
+            column_name = get_column_letter(column_number)
+            width = min(max(value_width, header_width) + cls.AUTO_WIDTH_PADDING, max_width)
+            column_widths[column_name] = max(width, min_widths.get(column_name, 0))
+
+        return column_widths
 
     def create_full_borders(self, cell_coordinate: str, border_type: str = "thin") -> None:
         """
@@ -120,8 +252,7 @@ class ReportDesign:
         :param cell_coordinate: Coordinate of the cell.
         :param border_type: Set the type of border. (Default: "thin")
         """
-        self.sheet[cell_coordinate].border = Border(left=Side(border_type), right=Side(border_type),
-                                                    top=Side(border_type), bottom=Side(border_type))
+        self.sheet[cell_coordinate].border = ReportStyles.get_border(border_type)
 
     def change_font(self, cell_coordinate: str, font_name: str = "Calibri", size: int = 11, bold: bool = False,
                     italics: bool = False, hex_color: str = "ffffff") -> None:
@@ -135,7 +266,8 @@ class ReportDesign:
         :param hex_color: Color you want the font to be. Make sure its in hex value without '#'.
             (Default = 'ffffff' [White Color])
         """
-        self.sheet[cell_coordinate].font = Font(name=font_name, size=size, bold=bold, color=hex_color, italic=italics)
+        self.sheet[cell_coordinate].font = ReportStyles.get_font(font_name=font_name, size=size, bold=bold,
+                                                                 italics=italics, hex_color=hex_color)
 
     def fill_color(self, cell_coordinate: str, hex_color: str, fill_type: str = "solid") -> None:
         """
@@ -144,7 +276,31 @@ class ReportDesign:
         :param hex_color: Color you want to fill with. Make sure its in hex value without '#'. (Ex. 'ffffff')
         :param fill_type: Set a pattern or color gradient (Default: 'solid")
         """
-        self.sheet[cell_coordinate].fill = PatternFill(start_color=hex_color, end_color=hex_color, fill_type=fill_type)
+        self.sheet[cell_coordinate].fill = ReportStyles.get_fill(hex_color=hex_color, fill_type=fill_type)
+
+    def add_range_borders(self, cell_range: str, border_type: str = "thin") -> None:
+        """
+        Create a full border around every cell in a range.
+
+        The borders are added as 1 conditional formatting rule over the range, so the cells don't have to be styled
+        one by one.
+        :param cell_range: Range of cells. (Ex. 'B9:C20')
+        :param border_type: Set the type of border. (Default: "thin")
+        """
+        self.sheet.conditional_formatting.add(cell_range, FormulaRule(formula=["TRUE"],
+                                                                      border=ReportStyles.get_border(border_type)))
+
+    def add_zebra_rows(self, cell_range: str, hex_color: str = "e8f0fe") -> None:
+        """
+        Fill every second row in a range. (Every even row number)
+
+        The fill is added as 1 conditional formatting rule over the range, so the rows don't have to be filled one
+        by one.
+        :param cell_range: Range of cells. (Ex. 'B9:C20')
+        :param hex_color: Color you want to fill with. Make sure its in hex value without '#'. (Default: 'e8f0fe')
+        """
+        self.sheet.conditional_formatting.add(cell_range, FormulaRule(formula=["MOD(ROW(),2)=0"],
+                                                                      fill=ReportStyles.get_fill(hex_color)))
 
     def hide_gridlines(self, hide_gridlines: bool = True) -> None:
         """
@@ -161,32 +317,76 @@ class ReportDesign:
 
     def all_cell_styles(self, horizontal_alignment: str = "center") -> None:
         """
-        Changes all cells in a workbook.
+        Changes the default style of every used column in a sheet.
 
+        Cells inserted with _insert_data_to_excel are already aligned when they are written. The column default is
+        used by every other cell in the column, so the cells don't have to be looped through.
         :param horizontal_alignment: Set horizontal alignment for all cells. (Default: "center")
         """
-        for row in self.sheet.iter_rows():
-            for cell in row:
-                cell.alignment = Alignment(horizontal=horizontal_alignment)
+        alignment = ReportStyles.get_alignment(horizontal=horizontal_alignment)
+        for column in range(1, self.sheet.max_column + 1):
+            self.sheet.column_dimensions[get_column_letter(column)].alignment = alignment
 
     def get_cell_coordinate(self, cell_text: list) -> dict:
         """
-        Get the cell coordinates based on text in a cell.
+        Get the cell coordinates based on text in a header cell of the current sheet.
 
-        The method will loop through the Excel document and find the text that matches the text in the list. It will
-        store the key as the cell coordinate and the value will be the text inside that cell.
+        The coordinates are looked up in the header index that is filled in while the headers are written, so the
+        sheet doesn't have to be scanned. It will store the key as the cell coordinate and the value will be the text
+        inside that cell.
         :param cell_text: List of words to find where they are located in the Excel Document.
         :return: Returns the coordinates and values of the found text.
         """
-        coordinate_dict = {cell.coordinate: cell.value for row in self.sheet.iter_rows() for cell in row
-                           if cell.value in cell_text}
+        sheet_headers = self.header_coordinates.get(self.sheet.title, {})
+        coordinate_dict = {coordinate: text for text in dict.fromkeys(cell_text)
+                           for coordinate in sheet_headers.get(text, [])}
 
         return coordinate_dict
 
+    def get_sla_pivot(self, columns: str, values: str, sla_state: str = None,
+                      rows: str = "Destination") -> pd.DataFrame:
+        """
+        Get a pivot table from the SLA Cube.
+
+        The SLA Cube is already aggregated, so the pivot table only has to reshape it. The routes of a destination are
+        rolled up into the destination when the rows are the destinations. Rows without a "Recvd Date" are in the
+        NO_DAY_BUCKET column when the columns are the day buckets.
+        :param columns: Level of the SLA Cube to use as the columns. (Valid Levels: 'Day Bucket' or 'SLA State')
+        :param values: Value to display. (Valid Values: 'Weight', 'Pieces' or 'AWB Count')
+        :param sla_state: Only use rows in this SLA State. (Ex. 'Past SLA') (Default: None)
+        :param rows: Level of the SLA Cube to use as the rows. (Valid Levels: 'Destination' or 'Route')
+            (Default: 'Destination')
+        :return: Returns the pivot table as a Dataframe.
+        :raise ValueError: Will raise error if rows or columns is not a valid level or values is not a valid value.
+        """
+        valid_rows = ["Destination", "Route"]
+        if rows not in valid_rows:
+            raise ValueError(f"{rows} is not a valid row. Valid rows are {' or '.join(valid_rows)}")
+        valid_columns = ["Day Bucket", "SLA State"]
+        if columns not in valid_columns:
+            raise ValueError(f"{columns} is not a valid column. Valid columns are {' or '.join(valid_columns)}")
+        if values not in self.sla_cube.columns:
+            raise ValueError(f"{values} is not a valid value. Valid values are {', '.join(self.sla_cube.columns)}")
+
+        sla_cube = self.sla_cube
+        if sla_state is not None:
+            sla_cube = sla_cube[sla_cube.index.get_level_values("SLA State") == sla_state]
+
+        pivot_df = sla_cube.groupby(level=[rows, columns], observed=True, dropna=False)[values].sum()
+        pivot_df = pivot_df.unstack(columns, fill_value=0)
+        pivot_df.columns = [str(column) if not pd.isna(column) else ReportDesign.NO_DAY_BUCKET
+                            for column in pivot_df.columns]
+        pivot_df["Total"] = pivot_df.sum(axis=1)
+
+        return pivot_df.sort_values(by="Total", ascending=False)
+
     def _insert_data_to_excel(self, dataframe: pd.DataFrame, start_col: int = 1, start_row: int = 1,
                              index: bool = True, header: bool = True, sheet_name: str = "Sheet") -> None:
         """
-        Insert a Dataframe into a temporary Excel File.
+        Insert a Dataframe into a sheet of the workbook.
+
+        The values are written straight into the workbook held in memory and centered. If the sheet doesn't exist it
+        is created. Column names and row names are written in bold with a thin border.
         :param dataframe: Dataframe to insert.
         :param start_col: Column position to start inserting Dataframe (Default: 1).
         :param start_row: Row position to start inserting Dataframe (Default: 1)
@@ -196,10 +396,66 @@ class ReportDesign:
         :raise KeyError: Will raise error if sheet contains any invalid characters.
         """
         self.invalid_name(sheet_name=sheet_name)
+        sheet = self._get_sheet(sheet_name)
+
+        row = start_row
+        if header:
+            header_values = ([dataframe.index.name] if index else []) + list(dataframe.columns)
+            self._insert_row(sheet=sheet, row=row, start_col=start_col, values=header_values, bold_cells=True)
+            row += 1
+
+        for values in dataframe.itertuples(index=index, name=None):
+            self._insert_row(sheet=sheet, row=row, start_col=start_col, values=values)
+            if index:
+                self._header_cell_style(sheet.cell(row=row, column=start_col))
+            row += 1
+
+    def _insert_row(self, sheet: Worksheet, row: int, start_col: int, values, bold_cells: bool = False) -> None:
+        """
+        Insert a row of centered values into a sheet. Empty values (None or NaN) are skipped.
+        :param sheet: Sheet to insert the values into.
+        :param row: Row number.
+        :param start_col: Column position of the first value.
+        :param values: Values to insert.
+        :param bold_cells: Write the values in bold with a thin border. (Default: False)
+        """
+        for column, value in enumerate(values, start=start_col):
+            if value is None or (not isinstance(value, str) and pd.isna(value)):
+                continue
+
+            cell = sheet.cell(row=row, column=column, value=value)
+            cell.alignment = ReportStyles.get_alignment(horizontal="center")
+            if bold_cells:
+                self._header_cell_style(cell)
+                self._index_header_cell(cell)
+
+    def _index_header_cell(self, cell) -> None:
+        """
+        Add a header cell to the header index used by get_cell_coordinate.
+        :param cell: Header cell to add.
+        """
+        sheet_headers = self.header_coordinates.setdefault(cell.parent.title, {})
+        sheet_headers.setdefault(cell.value, []).append(cell.coordinate)
+
+    @staticmethod
+    def _header_cell_style(cell) -> None:
+        """
+        Write a cell in bold with a thin border. (The same style pandas uses for column and row names)
+        :param cell: Cell to style.
+        """
+        cell.font = ReportStyles.get_font(bold=True, hex_color="000000")
+        cell.border = ReportStyles.get_border()
 
-        with pd.ExcelWriter(self.temp_file, mode="a", engine="openpyxl", if_sheet_exists="overlay") as writer:
-            dataframe.to_excel(writer, startrow=start_row - 1, startcol=start_col - 1, header=header, index=index,
-                               sheet_name=sheet_name)
+    def _get_sheet(self, sheet_name: str) -> Worksheet:
+        """
+        Get a sheet of the workbook. If the sheet doesn't exist it is created.
+        :param sheet_name: Name of the sheet.
+        :return: Returns the sheet.
+        """
+        if sheet_name not in self.workbook.sheetnames:
+            return self.workbook.create_sheet(sheet_name)
+
+        return self.workbook[sheet_name]
 
     @staticmethod
     def get_date_time() -> str:
@@ -242,6 +498,25 @@ class ReportDesign:
 
         return custom_column_width
 
+    @classmethod
+    def _get_changes_custom_widths(cls) -> dict:
+        """
+        Get specific column widths.
+        :return: Returns a dictionary of column names as the keys and custom width as the values.
+        """
+        custom_column_width = {
+            "B": 12,
+            "C": 18,
+            "D": 18,
+            "E": 18,
+            "F": 18,
+            "G": 18,
+            "H": 18,
+            "I": 60,
+        }
+
+        return custom_column_width
+
     @classmethod
     def _get_non_shipped_awb_custom_widths(cls) -> dict:
         """
@@ -283,68 +558,104 @@ class ReportDesign:
         table which is colored green, means that cargo will be going today).
         """
 
-        reference_data = {"E3": "Reference", "F3": "Going Today", "G3": "To Be Cleared", "H3": "On Hold"}
-        for count, (cell_cord, cell_text) in enumerate(reference_data.items()):
-            self.sheet[cell_cord].value = cell_text
-            self.create_full_borders(cell_coordinate=cell_cord)
-            if count == 0:
-                self.change_font(cell_coordinate=cell_cord, bold=True)
-            else:
-                self.change_font(cell_coordinate=cell_cord, bold=True, hex_color="000000")
+        self.sheet["E3"].value = "Reference"
+        self.sheet["E3"].style = ReportStyles.HEADER
 
-            # reference_data contains the cell coordinates as the keys. Convert it to a list to access those keys.
-            reference_data_keys = list(reference_data.keys())
-            self.fill_color(cell_coordinate=reference_data_keys[0], hex_color="4285f4")
-            self.fill_color(cell_coordinate=reference_data_keys[1], hex_color="00ff00")
-            self.fill_color(cell_coordinate=reference_data_keys[2], hex_color="ffff00")
-            self.fill_color(cell_coordinate=reference_data_keys[3], hex_color="ff0000")
+        # Reference cells with the fill color that cell uses in the Bot Report table.
+        reference_data = {"F3": ("Going Today", "00ff00"), "G3": ("To Be Cleared", "ffff00"),
+                          "H3": ("On Hold", "ff0000")}
+        for cell_cord, (cell_text, hex_color) in reference_data.items():
+            self.sheet[cell_cord].value = cell_text
+            self.sheet[cell_cord].style = ReportStyles.REFERENCE_LEGEND
+            self.fill_color(cell_coordinate=cell_cord, hex_color=hex_color)
 
     def _add_days_top_pri_header(self) -> None:
         """
         Create the top header for Days and Top Priority.
 
-        Add the Days Text and Priority Text. As well assign the value of each below there text.
-        The day sorter is the value in the SLA/Bot Report setting which is used to filter data by the number of days
-        cargo has been in the warehouse. TOP Pri, is the highest value in the "Days" column. All data
-        is obtained from the table_data class. Method also formats this small table to the appropriate colors, borders
-        and font.
+        Add the Days Text and Priority Text. The values below there text are added with _add_days_top_pri_values.
+        Method also formats this small table to the appropriate colors, borders and font.
         """
-        day_pri_values = {"E5": "DAYS", "E6": self.day_sorter, "H5": "Days TOP PRI", "H6": self.highest_day}
+        day_pri_values = {"E5": "DAYS", "E6": None, "H5": "Days TOP PRI", "H6": None}
 
         for cell_cord, cell_text in day_pri_values.items():
             self.sheet[cell_cord].value = cell_text
             self.change_font(cell_coordinate=cell_cord, bold=True)
             self.fill_color(cell_coordinate=cell_cord, hex_color="7A7A7A")
+            self.sheet[cell_cord].alignment = ReportStyles.get_alignment(horizontal="center")
 
         self.fill_color(cell_coordinate="F5", hex_color="7A7A7A")
         self.sheet.merge_cells("F5:G6")
 
-    def _add_date_header(self) -> None:
+    def _add_days_top_pri_values(self) -> None:
+        """
+        Add the Days and Top Priority values.
+
+        The day sorter is the value in the SLA/Bot Report setting which is used to filter data by the number of days
+        cargo has been in the warehouse. TOP Pri, is the highest value in the "Days" column. All data
+        is obtained from the table_data class.
         """
-        Add the current date.
+        self.sheet["E6"].value = self.day_sorter
+        self.sheet["H6"].value = self.highest_day
+
+    def _add_date_value(self) -> None:
+        """
+        Add the current date to the date header.
         """
         today = date.today()
-        formatted_date = today.strftime("%B %d, %Y")
-        self.sheet["L5"].value = formatted_date
+        self.sheet["L5"].value = today.strftime("%B %d, %Y")
+
+    def _add_date_header(self) -> None:
+        """
+        Add the date header. The current date is added with _add_date_value.
+        """
         self.change_font(cell_coordinate="L5", size=18, hex_color="000000")
-        self.sheet["L5"].alignment = Alignment(vertical="center")
+        self.sheet["L5"].alignment = ReportStyles.get_alignment(horizontal="center", vertical="center")
         self.sheet.merge_cells("L5:M6")
 
     def _add_logo(self, cell_coordinate) -> None:
         """
-        Add logo.
+        Add logo. The logo is read from the image cache.
         :param cell_coordinate: Cell where you want to place the logo.
         """
-        img = Image("logo.png")
+        img = ReportDesign.get_image(ReportDesign.LOGO_FILE, max_size=ReportDesign.LOGO_MAX_SIZE)
         self.sheet.add_image(img, cell_coordinate)
 
+    @classmethod
+    def get_image(cls, file_path: str, max_size: tuple = None) -> Image:
+        """
+        Get an image from the image cache.
+
+        The image file is only read, downscaled and encoded as a PNG once per session. The logo is added on every
+        render of the Trend Report and of the streaming reports, so it isn't read again for every workbook. Every
+        call returns a new Image, since an Image can only be placed on 1 sheet.
+        :param file_path: Path of the image file.
+        :param max_size: Largest (width, height) in pixels to display the image at. A bigger image is downscaled to
+            fit and keeps its aspect ratio. A smaller image is never upscaled. (Default: None [Original size])
+        :return: Returns the Image to add to a sheet.
+        """
+        cache_key = (os.path.abspath(file_path), max_size)
+
+        if cache_key not in cls._image_cache:
+            with PILImage.open(file_path) as image:
+                if max_size is not None:
+                    image.thumbnail(max_size)
+
+                buffer = BytesIO()
+                image.save(buffer, format="PNG", optimize=True)
+
+            cls._image_cache[cache_key] = buffer.getvalue()
+
+        return Image(BytesIO(cls._image_cache[cache_key]))
+
     def _create_sla_headers(self) -> None:
         """
         Create the SLA Table Header and designs it.
         """
         sla_header = {"Destination": "B8", "Past SLA": "C8"}
-        self.sheet["B8"].value = "Destination"
-        self.sheet["C8"].value = "Past SLA"
+        for cell_text, cell_cord in sla_header.items():
+            self.sheet[cell_cord].value = cell_text
+            self._index_header_cell(self.sheet[cell_cord])
 
         self._common_header_design(data_dict=sla_header)
 
@@ -370,19 +681,13 @@ class ReportDesign:
         :param total_weight_row_num: The row number for the Total Weight row.
         """
         # Start at row 9 and every second row, it will color those cells light blue.
-        for row in range(9, len(self.sla_data) + 9):
-            for col in ["B", "C"]:
-                sla_data_cell_cord = f"{col}{row}"
-                total_weight_cell_cord = f"{col}{total_weight_row_num}"
-                # Every second row, chance the color.
-                if row % 2 == 0:
-                    self.fill_color(hex_color="e8f0fe", cell_coordinate=sla_data_cell_cord)
-
-                self.create_full_borders(cell_coordinate=sla_data_cell_cord, border_type="thin")
-                self.create_full_borders(cell_coordinate=total_weight_cell_cord, border_type="thin")
-                self.change_font(cell_coordinate=total_weight_cell_cord, bold=True)
-                self.change_font(cell_coordinate=sla_data_cell_cord, bold=False, hex_color="000000")
-                self.fill_color(cell_coordinate=total_weight_cell_cord, hex_color='4285f4')
+        if self.sla_data:
+            sla_range = f"B9:C{len(self.sla_data) + 8}"
+            self.add_range_borders(cell_range=sla_range)
+            self.add_zebra_rows(cell_range=sla_range)
+
+        for col in ["B", "C"]:
+            self.sheet[f"{col}{total_weight_row_num}"].style = ReportStyles.TOTAL_ROW
 
     def _common_header_design(self, data_dict: dict, size: int = 11, fill_hex_color: str = '4285f4',
                               font_hex_color: str = 'ffffff', bold: bool = True, italics: bool = False) -> None:
@@ -396,6 +701,13 @@ class ReportDesign:
         :param italics: If you want the font italic (Default: False)
         """
         header_coordinates = self.get_cell_coordinate([key for key in data_dict])
+
+        # The default header design is registered as a named style, so every header cell shares it.
+        if (size, fill_hex_color, font_hex_color, bold, italics) == (11, '4285f4', 'ffffff', True, False):
+            for cell_cord in header_coordinates.keys():
+                self.sheet[cell_cord].style = ReportStyles.HEADER
+            return
+
         for cell_cord in header_coordinates.keys():
             self.fill_color(cell_coordinate=cell_cord, hex_color=fill_hex_color)
             self.change_font(cell_coordinate=cell_cord, bold=bold, italics=italics, size=size, hex_color=font_hex_color)
@@ -403,15 +715,14 @@ class ReportDesign:
 
     def _sla_table_design(self) -> None:
         """
-        Responsible for designing the SLA Table.
+        Responsible for designing the SLA Table. The SLA Table header is part of the SLA/Bot template.
         """
-        self._create_sla_headers()
         total_weight_row_num = self._add_sla_total_weight_header()
         self._sla_table_color(total_weight_row_num)
 
     def _other_design(self) -> None:
         """
-        Designs that aren't in either SLA Table or Bot Table
+        Designs that aren't in either SLA Table or Bot Table. Part of the SLA/Bot template.
         """
         self._add_color_reference_header()
         self._add_days_top_pri_header()
@@ -424,11 +735,124 @@ class ReportDesign:
         """
         self._common_header_design(data_dict=self.bot_df)
 
+        # Bot Table starts at column E with the header on row 8. The rows are not filled, since dispatchers fill Bot
+        # cells with the colors of the color reference and a conditional fill would hide them.
+        if not self.bot_df.empty:
+            bot_range = f"E9:{get_column_letter(len(self.bot_df.columns) + 4)}{len(self.bot_df) + 8}"
+            self.add_range_borders(cell_range=bot_range)
+
+    def _insert_sla_breakdown_data(self) -> list:
+        """
+        Insert every SLA Breakdown pivot table into the SLA Breakdown sheet.
+
+        The pivot tables are placed below each other with 2 empty rows between them.
+        :return: Returns a list of tuples of the title row number and the pivot table for every pivot table inserted.
+        """
+        inserted_pivots = []
+        start_row = 2
+        for title, sla_state, columns, values in ReportDesign.SLA_BREAKDOWN_PIVOTS:
+            pivot_df = self.get_sla_pivot(columns=columns, values=values, sla_state=sla_state)
+            title_df = pd.DataFrame([title])
+
+            self._insert_data_to_excel(dataframe=title_df, start_row=start_row, start_col=2, index=False,
+                                       header=False, sheet_name="SLA Breakdown")
+            self._insert_data_to_excel(dataframe=pivot_df, start_row=start_row + 1, start_col=2,
+                                       sheet_name="SLA Breakdown")
+            inserted_pivots.append((start_row, pivot_df))
+
+            # Title row + header row + data rows + 2 empty rows.
+            start_row += len(pivot_df) + 4
+
+        return inserted_pivots
+
+    def _sla_breakdown_design(self, inserted_pivots: list) -> None:
+        """
+        Designs the SLA Breakdown Sheet.
+        :param inserted_pivots: List of tuples of the title row number and the pivot table for every pivot table
+            inserted into the SLA Breakdown sheet.
+        """
+        header_text = ["Destination"]
+        for title_row, pivot_df in inserted_pivots:
+            self.change_font(cell_coordinate=f"B{title_row}", size=14, bold=True, hex_color="000000")
+            header_text += list(pivot_df.columns)
+
+        self._common_header_design(data_dict=header_text)
+
+        self.all_cell_styles()
+        self.set_column_widths(column_widths={"B": 20, "C": 13, "D": 13, "E": 13, "F": 13, "G": 13, "H": 13})
+        self.hide_gridlines()
+
+    def _insert_changes_data(self) -> None:
+        """
+        Insert the Changes Dataframe into the Changes sheet. Nothing is inserted if there is no Changes Dataframe.
+        """
+        if self.changes_df is not None:
+            self._insert_data_to_excel(dataframe=self.changes_df, start_row=2, start_col=2, index=False,
+                                       sheet_name="Changes")
+
+    def _changes_design(self) -> None:
+        """
+        Designs the Changes Sheet. The "Change" column is filled with the color of the change type.
+        """
+        if self.changes_df is None:
+            return
+
+        self.sheet = self.workbook["Changes"]
+        self.all_cell_styles()
+        self._common_header_design(data_dict=self.changes_df)
+
+        # Data starts at row 3, under the header row.
+        for row, change in enumerate(self.changes_df["Change"], start=3):
+            self.fill_color(cell_coordinate=f"B{row}", hex_color=ReportDesign.CHANGE_COLORS[change])
+
+        self.set_column_widths(column_widths=self.get_auto_widths(dataframe=self.changes_df, start_col=2,
+                                                                  min_widths=self._get_changes_custom_widths()))
+        self.hide_gridlines()
+
+    def _create_changes_file(self, folder_name: str, file_name: str) -> None:
+        """
+        Creates a JSON file of the Changes Dataframe in the report folder. Nothing is created if there is no Changes
+        Dataframe or if the report is returned as bytes.
+        :param folder_name: Name of the report folder.
+        :param file_name: Name of the JSON file.
+        """
+        if self.changes_df is None or self._return_bytes:
+            return
+
+        ReportDesign.invalid_name(folder_name=folder_name)
+        folder_path = ReportDesign.create_folder(folder_name)
+        changes_json = self.changes_df.astype({"Change": str}).to_json(orient="records", indent=2)
+        ReportDesign.write_file(os.path.join(folder_path, self._get_labeled_file_name(file_name)),
+                                changes_json.encode("utf-8"))
+
+    def _get_file_date_time(self) -> str:
+        """
+        Get the date and time used in the report file names.
+        :return: Returns date_time if it was set, otherwise the current date/time formatted in a string.
+        """
+        return self.date_time if self.date_time is not None else ReportDesign.get_date_time()
+
+    def _get_labeled_file_name(self, file_name: str) -> str:
+        """
+        Add the file label to the end of a file name. (Ex. 'SLA-Bot Report on March 25, 2023 - 1015AM (YTH).xlsx')
+        :param file_name: Name of the file.
+        :return: Returns the file name with the label. Returns the file name unchanged if there is no file label.
+        """
+        if self.file_label is None:
+            return file_name
+
+        base_name, extension = os.path.splitext(file_name)
+        return f"{base_name} ({self.file_label}){extension}"
+
     def _create_bot_sla_report(self) -> None:
         """
-        Creates the SLA/Bot Excel Report.
+        Creates the SLA/Bot Excel Report. The static parts of the report come from the SLA/Bot template.
         """
-        self._create_temp_file()
+        if self.use_streaming(self.bot_df):
+            self._create_streaming_bot_sla_report()
+            return
+
+        self._create_workbook(template_name="SLA/Bot Report")
 
         # Convert sla_data to a Dataframe.
         sla_df = pd.DataFrame(self.sla_data, index=[0]).T
@@ -436,20 +860,33 @@ class ReportDesign:
         # Insert Data
         self._insert_data_to_excel(dataframe=sla_df, start_row=9, start_col=2, header=False)
         self._insert_data_to_excel(dataframe=self.bot_df, start_row=8, start_col=5, index=False)
+        inserted_pivots = self._insert_sla_breakdown_data()
+        self._insert_changes_data()
 
         # Design the Data
-        self._open_temp_file()
+
+        # Change Sheets to SLA Breakdown
+        self.sheet = self.workbook["SLA Breakdown"]
+        self._sla_breakdown_design(inserted_pivots)
+
+        # Change Sheets to Changes
+        self._changes_design()
+
+        # Change Sheets to Bot Report
+        self.sheet = self.workbook["Sheet"]
         self._sla_table_design()
         self._bot_table_design()
-        self._other_design()
+        self._add_days_top_pri_values()
+        self._add_date_value()
         self.all_cell_styles()
-        self.set_column_widths(column_widths=self._get_sla_bot_custom_widths())
-        self.hide_gridlines()
+        self.set_column_widths(column_widths=self.get_auto_widths(dataframe=self.bot_df, start_col=5,
+                                                                  min_widths=self._get_sla_bot_custom_widths()))
 
         # Move/Save Excel File for User to view.
-        self._create_excel_file(folder_name="SLA-Bot Report",
-                                file_name=f"SLA-Bot Report on {ReportDesign.get_date_time()}.xlsx",
+        date_time = self._get_file_date_time()
+        self._create_excel_file(folder_name="SLA-Bot Report", file_name=f"SLA-Bot Report on {date_time}.xlsx",
                                 sheet_name="Bot Report")
+        self._create_changes_file(folder_name="SLA-Bot Report", file_name=f"SLA-Bot Changes on {date_time}.json")
 
     def _create_title_header(self, title_text: str) -> None:
         """
@@ -464,13 +901,21 @@ class ReportDesign:
         for row in self.sheet["B3:C5"]:
             for cell in row:
                 self.create_full_borders(cell_coordinate=cell.coordinate)
-                cell.alignment = Alignment(vertical="center", horizontal="center")
+                cell.alignment = ReportStyles.get_alignment(horizontal="center", vertical="center")
+
+    def _sla_bot_template_design(self) -> None:
+        """
+        Designs the static parts of the SLA/Bot Report. Used to build the SLA/Bot template.
+        """
+        self._create_sla_headers()
+        self._other_design()
+        self.set_column_widths(column_widths=self._get_sla_bot_custom_widths())
+        self.hide_gridlines()
 
     def _shipped_awb_design(self) -> None:
         """
-        Designs the Shipped AWB Sheet for Home Delivery Report.
+        Designs the static parts of the Shipped AWB Sheet for Home Delivery Report.
         """
-        self._common_header_design(self.shipped_awb_df, size=15)
         self.set_column_widths(column_widths=self._get_shipped_awb_custom_widths())
         self._create_title_header(title_text="Home Delivery Sent")
         self._add_logo(cell_coordinate='D1')
@@ -478,64 +923,366 @@ class ReportDesign:
 
     def _non_shipped_awb_design(self) -> None:
         """
-        Designs the Non-Shipped AWB Sheet for Home Delivery Report.
+        Designs the static parts of the Non-Shipped AWB Sheet for Home Delivery Report.
         """
-        self._common_header_design(self.non_shipped_awb_df, size=15)
         self.set_column_widths(column_widths=self._get_non_shipped_awb_custom_widths())
         self._create_title_header(title_text="Home Delivery NOT Sent")
         self._add_logo(cell_coordinate='D1')
         self.hide_gridlines()
 
+    def _home_delivery_template_design(self) -> None:
+        """
+        Designs the static parts of the Home Delivery Report. Used to build the Home Delivery template.
+        """
+        self._shipped_awb_design()
+
+        self.sheet = self.workbook.create_sheet("Non-Shipped AWB(s)")
+        self._non_shipped_awb_design()
+
     def _create_home_delivery_report(self) -> None:
         """
-        Creates the Home Delivery Excel Report.
+        Creates the Home Delivery Excel Report. The static parts of the report come from the Home Delivery template.
         """
-        self._create_temp_file()
+        if self.use_streaming(self.shipped_awb_df, self.non_shipped_awb_df):
+            self._create_streaming_home_delivery_report()
+            return
+
+        self._create_workbook(template_name="Home Delivery Report")
 
         # Insert Data
         self._insert_data_to_excel(dataframe=self.shipped_awb_df, start_row=8, start_col=2, index=False)
         self._insert_data_to_excel(dataframe=self.non_shipped_awb_df, start_row=8, start_col=2, index=False,
                                   sheet_name="Non-Shipped AWB(s)")
+        self._insert_changes_data()
 
         # Design the Data
-        self._open_temp_file()
 
         # Change Sheets to Non-Shipped AWB(s)
         self.sheet = self.workbook["Non-Shipped AWB(s)"]
         self.all_cell_styles()
-        self._non_shipped_awb_design()
+        self._common_header_design(self.non_shipped_awb_df, size=15)
+        self.set_column_widths(column_widths=self.get_auto_widths(
+            dataframe=self.non_shipped_awb_df, start_col=2, min_widths=self._get_non_shipped_awb_custom_widths(),
+            header_size=15))
+
+        # Change Sheets to Changes
+        self._changes_design()
 
         # Change Sheets to Non-Shipped AWB(s)
         self.sheet = self.workbook["Sheet"]
         self.all_cell_styles()
-        self._shipped_awb_design()
+        self._common_header_design(self.shipped_awb_df, size=15)
+        self.set_column_widths(column_widths=self.get_auto_widths(
+            dataframe=self.shipped_awb_df, start_col=2, min_widths=self._get_shipped_awb_custom_widths(),
+            header_size=15))
 
         # Move/Save Excel File for User to view.
+        date_time = self._get_file_date_time()
         self._create_excel_file(folder_name="Home Delivery Report",
-                                file_name=f"Home Delivery Report on {ReportDesign.get_date_time()}.xlsx",
-                                sheet_name="Shipped AWB(s)")
+                                file_name=f"Home Delivery Report on {date_time}.xlsx", sheet_name="Shipped AWB(s)")
+        self._create_changes_file(folder_name="Home Delivery Report",
+                                  file_name=f"Home Delivery Changes on {date_time}.json")
 
-    def _open_temp_file(self) -> None:
+    def _trend_sheet_design(self, trend_df: pd.DataFrame, title_text: str) -> None:
         """
-        Open the temporary file.
+        Designs a Trend Sheet for the Trend Report.
+        :param trend_df: Trend Dataframe displayed on the sheet.
+        :param title_text: Name of the title you want to display.
         """
-        self.workbook = load_workbook(self.temp_file)
-        self.sheet = self.workbook.active
+        self.all_cell_styles()
+        self._common_header_design(data_dict=[trend_df.index.name] + list(trend_df.columns), size=13)
+
+        # The index is in column B and the trend columns start at column C.
+        trend_widths = {get_column_letter(column_number): 22
+                        for column_number in range(3, len(trend_df.columns) + 3)}
+        self.set_column_widths(column_widths=self.get_auto_widths(dataframe=trend_df, start_col=2, index=True,
+                                                                  min_widths={"B": 25, **trend_widths},
+                                                                  header_size=13))
+
+        self._create_title_header(title_text=title_text)
+        self.sheet["B6"].value = f"Last {self.weeks_back} Weeks"
+        self.change_font(cell_coordinate="B6", italics=True, hex_color="000000")
+        self.sheet["B6"].alignment = ReportStyles.get_alignment(horizontal="center")
+        self._add_logo(cell_coordinate='D1')
+        self.hide_gridlines()
+
+    def _create_trend_report(self) -> None:
+        """
+        Creates the Trend Excel Report.
+        """
+        self._create_workbook()
+
+        # Insert Data
+        self._insert_data_to_excel(dataframe=self.sla_trend_df, start_row=8, start_col=2)
+        self._insert_data_to_excel(dataframe=self.home_delivery_trend_df, start_row=8, start_col=2,
+                                   sheet_name="Home Delivery Trend")
+
+        # Design the Data
+
+        # Change Sheets to Home Delivery Trend
+        self.sheet = self.workbook["Home Delivery Trend"]
+        self._trend_sheet_design(trend_df=self.home_delivery_trend_df, title_text="Days to Allocated")
+
+        # Change Sheets to SLA Trend
+        self.sheet = self.workbook["Sheet"]
+        self._trend_sheet_design(trend_df=self.sla_trend_df, title_text="Days Past SLA")
+
+        # Move/Save Excel File for User to view.
+        self._create_excel_file(folder_name="Trend Report",
+                                file_name=f"Trend Report on {self._get_file_date_time()}.xlsx",
+                                sheet_name="SLA Trend")
 
-    def _save_temp_file(self) -> None:
+    @classmethod
+    def get_template(cls, report_name: str) -> bytes:
         """
-        Save the temporary file
+        Get the template workbook of a report.
+
+        The template is built once and saved in the template folder with the template version in the file name. After
+        that it is read from the template folder, and only once per session.
+        :param report_name: Name of the report. Must be one of the report names defined in
+            ReportDesign.VALID_TEMPLATES.
+        :return: Returns the template workbook as bytes.
+        :raise KeyError: If the specified report name is not one of the valid report names defined in
+            ReportDesign.VALID_TEMPLATES.
         """
-        self.workbook.save(self.temp_file)
+        if report_name not in cls.VALID_TEMPLATES.keys():
+            raise KeyError(f"{report_name} does not have a template. Valid templates are "
+                           f"{' or '.join(cls.VALID_TEMPLATES.keys())}")
+
+        if report_name not in cls._template_cache:
+            file_name = f"{report_name.replace('/', '-')} Template v{cls.TEMPLATE_VERSION}.xlsx"
+            file_path = os.path.join(cls.create_folder(cls.TEMPLATE_FOLDER), file_name)
+
+            if os.path.isfile(file_path):
+                with open(file_path, "rb") as template_file:
+                    cls._template_cache[report_name] = template_file.read()
+            else:
+                template = cls(report_name)
+                template._create_workbook()
+                getattr(template, cls.VALID_TEMPLATES[report_name])()
 
-    def _create_temp_file(self) -> None:
+                buffer = BytesIO()
+                template.workbook.save(buffer)
+                cls._template_cache[report_name] = buffer.getvalue()
+                cls.write_file(file_path, cls._template_cache[report_name])
+
+        return cls._template_cache[report_name]
+
+    def use_streaming(self, *dataframes: pd.DataFrame) -> bool:
+        """
+        Check if the report should be rendered in streaming mode.
+        :param dataframes: Tables of the report.
+        :return: Returns the streaming attribute if it is set. Otherwise, returns True if any table has more rows than
+            ReportDesign.STREAMING_ROW_THRESHOLD.
         """
-        Create a temporary Excel File
+        if self.streaming is not None:
+            return self.streaming
+
+        return any(len(dataframe) > ReportDesign.STREAMING_ROW_THRESHOLD for dataframe in dataframes)
+
+    def _create_streaming_bot_sla_report(self) -> None:
         """
-        with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as temp:
-            self.temp_file = temp.name
+        Creates the SLA/Bot Excel Report in streaming mode.
+
+        The report has the same layout as _create_bot_sla_report. The rows of the Bot Table are written in chunks and
+        Bot Table rows past the Excel row limit are written to continuation sheets.
+        """
+        self._create_workbook(write_only=True)
+        sheet_streamer = SheetStreamer(self.workbook)
+
+        bot_sheets = sheet_streamer.stream_dataframe(sheet_name="Sheet", dataframe=self.bot_df, start_row=8,
+                                                     start_col=5, continuation_name="Bot Report",
+                                                     fixed_cells=self._get_streaming_bot_sla_cells,
+                                                     zebra_rows=False, borders=True,
+                                                     column_widths=self.get_auto_widths(
+                                                         dataframe=self.bot_df, start_col=5,
+                                                         min_widths=self._get_sla_bot_custom_widths()))
+        self.sheet = bot_sheets[0][0]
+        self.sheet.merged_cells.add("F5:G6")
+        self.sheet.merged_cells.add("L5:M6")
+        self._add_logo(cell_coordinate="B2")
+        if self.sla_data:
+            sla_range = f"B9:C{len(self.sla_data) + 8}"
+            self.add_range_borders(cell_range=sla_range)
+            self.add_zebra_rows(cell_range=sla_range)
+
+        self._stream_sla_breakdown(sheet_streamer)
+        self._stream_changes(sheet_streamer)
+
+        # Save Excel File for User to view.
+        date_time = self._get_file_date_time()
+        self.sheet = bot_sheets[0][0]
+        self._create_excel_file(folder_name="SLA-Bot Report", file_name=f"SLA-Bot Report on {date_time}.xlsx",
+                                sheet_name="Bot Report")
+        self._create_changes_file(folder_name="SLA-Bot Report", file_name=f"SLA-Bot Changes on {date_time}.json")
+
+    def _get_streaming_bot_sla_cells(self, sheet) -> dict:
+        """
+        Get the cells written around the Bot Table in streaming mode. (Reference header, Days and Top Priority,
+        date, SLA Table and Total Weight)
+        :param sheet: The Bot Report sheet.
+        :return: Returns a dictionary of the row numbers and dictionaries of the column numbers and cells.
+        """
+        center = ReportStyles.get_alignment(horizontal="center")
+        day_pri_styles = {"font": ReportStyles.get_font(bold=True), "fill": ReportStyles.get_fill("7A7A7A"),
+                          "alignment": center}
+        cell_data = {
+            "E3": ("Reference", {"style": ReportStyles.HEADER}),
+            "F3": ("Going Today", {"style": ReportStyles.REFERENCE_LEGEND, "fill": ReportStyles.get_fill("00ff00")}),
+            "G3": ("To Be Cleared", {"style": ReportStyles.REFERENCE_LEGEND, "fill": ReportStyles.get_fill("ffff00")}),
+            "H3": ("On Hold", {"style": ReportStyles.REFERENCE_LEGEND, "fill": ReportStyles.get_fill("ff0000")}),
+            "E5": ("DAYS", day_pri_styles),
+            "E6": (self.day_sorter, day_pri_styles),
+            "F5": (None, {"fill": ReportStyles.get_fill("7A7A7A")}),
+            "H5": ("Days TOP PRI", day_pri_styles),
+            "H6": (self.highest_day, day_pri_styles),
+            "L5": (date.today().strftime("%B %d, %Y"),
+                   {"font": ReportStyles.get_font(size=18, hex_color="000000"),
+                    "alignment": ReportStyles.get_alignment(horizontal="center", vertical="center")}),
+            "B8": ("Destination", {"style": ReportStyles.HEADER}),
+            "C8": ("Past SLA", {"style": ReportStyles.HEADER}),
+        }
+
+        for row, (destination, weight) in enumerate(self.sla_data.items(), start=9):
+            cell_data[f"B{row}"] = (destination, {"font": ReportStyles.get_font(bold=True, hex_color="000000"),
+                                                  "border": ReportStyles.get_border(), "alignment": center})
+            cell_data[f"C{row}"] = (weight, {"alignment": center})
+
+        total_weight_row_num = len(self.sla_data) + 10
+        cell_data[f"B{total_weight_row_num}"] = ("Total", {"style": ReportStyles.TOTAL_ROW})
+        cell_data[f"C{total_weight_row_num}"] = (ReportDesign._get_total_weight(self.sla_data),
+                                                 {"style": ReportStyles.TOTAL_ROW})
+
+        return SheetStreamer.create_fixed_cells(sheet, cell_data)
+
+    def _stream_sla_breakdown(self, sheet_streamer: SheetStreamer) -> None:
+        """
+        Write the SLA Breakdown sheet in streaming mode. The pivot tables are placed below each other with 2 empty
+        rows between them, the same as _insert_sla_breakdown_data.
+        :param sheet_streamer: The SheetStreamer of the workbook.
+        """
+        sheet = self.workbook.create_sheet("SLA Breakdown")
+        sheet.sheet_view.showGridLines = False
+        for column_name, width in {"B": 20, "C": 13, "D": 13, "E": 13, "F": 13, "G": 13, "H": 13}.items():
+            sheet.column_dimensions[column_name].width = width
+
+        center = ReportStyles.get_alignment(horizontal="center")
+        title_font = ReportStyles.get_font(size=14, bold=True, hex_color="000000")
+        index_styles = {"font": ReportStyles.get_font(bold=True, hex_color="000000"),
+                        "border": ReportStyles.get_border(), "alignment": center}
+
+        sheet.append([])
+        for title, sla_state, columns, values in ReportDesign.SLA_BREAKDOWN_PIVOTS:
+            pivot_df = self.get_sla_pivot(columns=columns, values=values, sla_state=sla_state)
+
+            sheet.append([None, sheet_streamer.styled_cell(sheet, value=title, font=title_font, alignment=center)])
+            sheet.append([None] + [sheet_streamer.styled_cell(sheet, value=header, style=ReportStyles.HEADER)
+                                   for header in [pivot_df.index.name] + list(pivot_df.columns)])
+            for destination, *pivot_values in pivot_df.itertuples(name=None):
+                sheet.append([None, sheet_streamer.styled_cell(sheet, value=destination, **index_styles)] +
+                             [sheet_streamer.styled_cell(sheet, value=value, alignment=center)
+                              for value in pivot_values])
+            sheet.append([])
+            sheet.append([])
+
+    def _stream_changes(self, sheet_streamer: SheetStreamer) -> None:
+        """
+        Write the Changes sheet in streaming mode. The "Change" column is filled with the color of the change type
+        with conditional formatting. Nothing is written if there is no Changes Dataframe.
+        :param sheet_streamer: The SheetStreamer of the workbook.
+        """
+        if self.changes_df is None:
+            return
+
+        changes_sheets = sheet_streamer.stream_dataframe(
+            sheet_name="Changes", dataframe=self.changes_df.astype({"Change": str}), start_row=2, start_col=2,
+            column_widths=self.get_auto_widths(dataframe=self.changes_df, start_col=2,
+                                               min_widths=self._get_changes_custom_widths()),
+            zebra_rows=False)
+
+        for sheet, data_range in changes_sheets:
+            if data_range is None:
+                continue
+
+            _, first_row, _, last_row = range_boundaries(data_range)
+            change_range = f"B{first_row}:B{last_row}"
+            for change, hex_color in ReportDesign.CHANGE_COLORS.items():
+                sheet.conditional_formatting.add(change_range,
+                                                 FormulaRule(formula=[f'$B{first_row}="{change}"'],
+                                                             fill=ReportStyles.get_fill(hex_color)))
+
+    def _create_streaming_home_delivery_report(self) -> None:
+        """
+        Creates the Home Delivery Excel Report in streaming mode.
+
+        The report has the same layout as _create_home_delivery_report. The rows of both AWB tables are written in
+        chunks and rows past the Excel row limit are written to continuation sheets.
+        """
+        self._create_workbook(write_only=True)
+        sheet_streamer = SheetStreamer(self.workbook)
+
+        awb_tables = [("Sheet", "Shipped AWB(s)", self.shipped_awb_df, "Home Delivery Sent",
+                       self.get_auto_widths(dataframe=self.shipped_awb_df, start_col=2,
+                                            min_widths=self._get_shipped_awb_custom_widths(), header_size=15)),
+                      ("Non-Shipped AWB(s)", "Non-Shipped AWB(s)", self.non_shipped_awb_df, "Home Delivery NOT Sent",
+                       self.get_auto_widths(dataframe=self.non_shipped_awb_df, start_col=2,
+                                            min_widths=self._get_non_shipped_awb_custom_widths(), header_size=15))]
+
+        first_sheets = []
+        for sheet_name, continuation_name, awb_df, title_text, column_widths in awb_tables:
+            awb_sheets = sheet_streamer.stream_dataframe(
+                sheet_name=sheet_name, dataframe=awb_df, start_row=8, start_col=2,
+                continuation_name=continuation_name, column_widths=column_widths, header_size=15, zebra_rows=False,
+                fixed_cells=lambda sheet, title=title_text: ReportDesign._get_streaming_title_cells(sheet, title))
+
+            self.sheet = awb_sheets[0][0]
+            self.sheet.merged_cells.add("B3:C5")
+            self._add_logo(cell_coordinate='D1')
+            first_sheets.append(self.sheet)
+
+        self._stream_changes(sheet_streamer)
+
+        # Save Excel File for User to view.
+        date_time = self._get_file_date_time()
+        self.sheet = first_sheets[0]
+        self._create_excel_file(folder_name="Home Delivery Report",
+                                file_name=f"Home Delivery Report on {date_time}.xlsx", sheet_name="Shipped AWB(s)")
+        self._create_changes_file(folder_name="Home Delivery Report",
+                                  file_name=f"Home Delivery Changes on {date_time}.json")
+
+    @staticmethod
+    def _get_streaming_title_cells(sheet, title_text: str) -> dict:
+        """
+        Get the cells of the title header in streaming mode. The same as _create_title_header.
+        :param sheet: The sheet of the title header.
+        :param title_text: Name of the title you want to display.
+        :return: Returns a dictionary of the row numbers and dictionaries of the column numbers and cells.
+        """
+        title_styles = {"fill": ReportStyles.get_fill("4285f4"), "border": ReportStyles.get_border(),
+                        "font": ReportStyles.get_font(size=20, bold=True, italics=True),
+                        "alignment": ReportStyles.get_alignment(horizontal="center", vertical="center")}
+
+        cell_data = {coordinate: (None, title_styles) for coordinate in ["B3", "C3", "B4", "C4", "B5", "C5"]}
+        cell_data["B3"] = (title_text, title_styles)
+
+        return SheetStreamer.create_fixed_cells(sheet, cell_data)
+
+    def _create_workbook(self, template_name: str = None, write_only: bool = False) -> None:
+        """
+        Create the workbook in memory.
+        :param template_name: Name of the report template to start from. (Default: None [Empty workbook])
+        :param write_only: Create a write-only workbook for streaming mode. The sheets are created while the rows are
+            written. (Default: False)
+        """
+        if write_only:
+            self.workbook = Workbook(write_only=True)
+        elif template_name is not None:
+            self.workbook = load_workbook(BytesIO(ReportDesign.get_template(template_name)))
+        else:
             self.workbook = Workbook()
-            self.workbook.save(self.temp_file)
+        self.sheet = self.workbook.active if not write_only else None
+        self.header_coordinates = {}
+        ReportStyles.register_named_styles(self.workbook)
 
     @staticmethod
     def create_folder(folder_name) -> str:
@@ -547,8 +1294,8 @@ class ReportDesign:
         current_director = os.getcwd()
         folder_path = os.path.join(current_director, folder_name)
 
-        if not os.path.isdir(folder_name):
-            os.mkdir(folder_path)
+        # exist_ok, since reports rendered at the same time can create the same folder.
+        os.makedirs(folder_path, exist_ok=True)
 
         return folder_path
 
@@ -584,20 +1331,50 @@ class ReportDesign:
 
     def _create_excel_file(self, folder_name: str, file_name: str, sheet_name: str = None) -> None:
         """
-        Creates a folder and moves the temporary Excel file into the folder.
+        Creates a folder and saves the workbook into the folder.
 
-        This will move the temporary file into the specific folder for the user to view/open.
+        The workbook is saved into a BytesIO buffer and then written once to the specific folder for the user to
+        view/open. If the report is returned as bytes, the bytes are stored in report_bytes and nothing is written.
         :param folder_name: Name of the folder to create. If folder is created, it will not create another one.
         :param file_name: Name of the Excel File.
         :param sheet_name: Name of the sheet. (Default: None)
         :raise KeyError: Will raise error if file name, sheet name or folder name contain invalid characters. Also, will
             raise an error if file name doesn't contain .xlsx.
         """
+        file_name = self._get_labeled_file_name(file_name)
+        ReportDesign.invalid_name(folder_name=folder_name, file_name=file_name, sheet_name=sheet_name)
+
         if sheet_name is not None:
             self.sheet.title = sheet_name
 
-        self._save_temp_file()
+        buffer = BytesIO()
+        self.workbook.save(buffer)
 
-        ReportDesign.invalid_name(folder_name=folder_name, file_name=file_name, sheet_name=sheet_name)
-        folder_path = ReportDesign.create_folder(folder_name)
-        shutil.move(self.temp_file, f"{folder_path}/{file_name}")
+        if self._return_bytes:
+            self.report_bytes = buffer.getvalue()
+        else:
+            folder_path = ReportDesign.create_folder(folder_name)
+            self.file_path = os.path.join(folder_path, file_name)
+            ReportDesign.write_file(self.file_path, buffer.getvalue())
+
+    @staticmethod
+    def write_file(file_path: str, file_bytes: bytes) -> None:
+        """
+        Write a file atomically.
+
+        The bytes are written to a ".tmp" file next to the file and then moved over the file, so the file is never
+        left half written. Every write gets its own ".tmp" file from tempfile.mkstemp, so processes and threads
+        writing the same file at the same time don't write into the same ".tmp" file.
+        :param file_path: Path of the file.
+        :param file_bytes: Contents of the file.
+        """
+        file_descriptor, temp_path = tempfile.mkstemp(suffix=".tmp", prefix=f"{os.path.basename(file_path)}.",
+                                                      dir=os.path.dirname(file_path) or None)
+        try:
+            with os.fdopen(file_descriptor, "wb") as temp_file:
+                temp_file.write(file_bytes)
+            os.replace(temp_path, file_path)
+        except OSError:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
@@ -0,0 +1,169 @@
+from datetime import datetime
+import html
+import os
+import pandas as pd
+from report_design import ReportDesign
+
+
+class ReportExporter:
+    """
+    A class for exporting the tables of a report as CSV, Parquet or HTML files.
+
+    The exporter takes the same report values as ReportDesign (Ex. {"sla_data": ..., "bot_df": ...}), so a report
+    can be exported without designing the Excel workbook. The files are saved in the same folder as the Excel report.
+
+      Attributes:
+        - report_name (str): Name of the report.
+        - report_values (dict): Dictionary of the ReportDesign instance attributes of the report.
+        - file_label (str): Label added to the end of the file names. (None for no label)
+        - date_time (str): Date and time in the file names. (None to use the time of the export)
+      Methods:
+        - export: Export the tables of the report in a format.
+        - get_tables: Get the tables of the report.
+    """
+
+    # Valid Formats constant which contains the format name and the method that exports that format.
+    VALID_FORMATS = {
+        "csv": "_export_csv",
+        "parquet": "_export_parquet",
+        "html": "_export_html",
+    }
+
+    # Report Folders constant which contains the report name and the folder the report is saved in.
+    REPORT_FOLDERS = {
+        "SLA/Bot Report": "SLA-Bot Report",
+        "Home Delivery Report": "Home Delivery Report",
+        "Trend Report": "Trend Report",
+    }
+
+    # Export Tables constant which contains the report name and a dictionary of the report values that are exported
+    # and the table name used in the file names.
+    EXPORT_TABLES = {
+        "SLA/Bot Report": {"sla_data": "SLA", "bot_df": "Bot", "sla_cube": "SLA Cube", "changes_df": "Changes"},
+        "Home Delivery Report": {"shipped_awb_df": "Shipped AWB", "non_shipped_awb_df": "Non-Shipped AWB",
+                                 "changes_df": "Changes"},
+        "Trend Report": {"sla_trend_df": "SLA Trend", "home_delivery_trend_df": "Home Delivery Trend"},
+    }
+
+    def __init__(self, report_name: str, report_values: dict, file_label: str = None, date_time: str = None):
+        """
+        Initializes a ReportExporter Object.
+
+        :param report_name: Name of the report. Must be one of the report names defined in
+            ReportExporter.EXPORT_TABLES.
+        :param report_values: Dictionary of the ReportDesign instance attributes of the report.
+        :param file_label: Label added to the end of the file names. (Default: None)
+        :param date_time: Date and time in the file names. Pass in the date and time of the Excel report, so the
+            exported files have the same name as the workbook. (Default: None [Time of the export])
+        :raise KeyError: If the specified report name is not one of the valid report names defined in
+            ReportExporter.EXPORT_TABLES.
+        """
+        if report_name not in ReportExporter.EXPORT_TABLES.keys():
+            raise KeyError(f"{report_name} is not a valid report. Valid reports are "
+                           f"{' or '.join(ReportExporter.EXPORT_TABLES.keys())}")
+
+        self.report_name = report_name
+        self.report_values = report_values
+        self.file_label = file_label
+        self.date_time = date_time
+
+    def export(self, output_format: str) -> list:
+        """
+        Export the tables of the report in a format.
+
+        CSV and Parquet create 1 file for every table. HTML creates 1 page with every table.
+        :param output_format: Format to export. (Valid Formats: 'csv', 'parquet' or 'html')
+        :return: Returns a list of the saved file paths.
+        :raise ValueError: Will raise error if the format is not valid.
+        """
+        if output_format not in ReportExporter.VALID_FORMATS.keys():
+            raise ValueError(f"{output_format} is not a valid format. Valid formats are "
+                             f"{' or '.join(ReportExporter.VALID_FORMATS.keys())}")
+
+        folder_name = ReportExporter.REPORT_FOLDERS[self.report_name]
+        folder_path = ReportDesign.create_folder(folder_name)
+        date_time = self.date_time if self.date_time is not None else ReportDesign.get_date_time()
+        base_name = f"{folder_name} on {date_time}"
+        if self.file_label is not None:
+            base_name = f"{base_name} ({self.file_label})"
+
+        export_method = getattr(self, ReportExporter.VALID_FORMATS[output_format])
+        return export_method(folder_path, base_name)
+
+    def get_tables(self) -> dict:
+        """
+        Get the tables of the report.
+
+        The SLA data dictionary is turned into a Dataframe. Named indexes (Ex. the SLA Cube levels) are turned into
+        columns. Tables that are None are left out.
+        :return: Returns a dictionary where the keys are the table names and the values are the Dataframes.
+        """
+        tables = {}
+        for value_name, table_name in ReportExporter.EXPORT_TABLES[self.report_name].items():
+            table = self.report_values.get(value_name)
+            if table is None:
+                continue
+
+            if isinstance(table, dict):
+                table = pd.DataFrame(list(table.items()), columns=["Destination", "Past SLA"])
+            elif any(name is not None for name in table.index.names):
+                table = table.reset_index()
+
+            tables[table_name] = table
+
+        return tables
+
+    def _export_csv(self, folder_path: str, base_name: str) -> list:
+        """
+        Export every table as a CSV file.
+        :param folder_path: Path of the report folder.
+        :param base_name: Start of every file name.
+        :return: Returns a list of the saved file paths.
+        """
+        file_paths = []
+        for table_name, table in self.get_tables().items():
+            file_path = os.path.join(folder_path, f"{base_name} - {table_name}.csv")
+            ReportDesign.write_file(file_path, table.to_csv(index=False).encode("utf-8"))
+            file_paths.append(file_path)
+
+        return file_paths
+
+    def _export_parquet(self, folder_path: str, base_name: str) -> list:
+        """
+        Export every table as a Parquet file.
+        :param folder_path: Path of the report folder.
+        :param base_name: Start of every file name.
+        :return: Returns a list of the saved file paths.
+        """
+        file_paths = []
+        for table_name, table in self.get_tables().items():
+            file_path = os.path.join(folder_path, f"{base_name} - {table_name}.parquet")
+            ReportDesign.write_file(file_path, table.to_parquet(index=False, compression="zstd"))
+            file_paths.append(file_path)
+
+        return file_paths
+
+    def _export_html(self, folder_path: str, base_name: str) -> list:
+        """
+        Export every table to 1 self-contained HTML page. The styles are part of the page.
+        :param folder_path: Path of the report folder.
+        :param base_name: Name of the file.
+        :return: Returns a list with the saved file path.
+        """
+        sections = "".join(f"<h2>{html.escape(table_name)}</h2>"
+                           f"{table.to_html(index=False, border=0, na_rep='', classes='report-table')}"
+                           for table_name, table in self.get_tables().items())
+
+        page = (f"<!DOCTYPE html><html><head><meta charset='utf-8'><title>{html.escape(base_name)}</title>"
+                "<style>body{font-family:Calibri,Arial,sans-serif;margin:24px;}"
+                "h1{color:#4285f4;}.report-table{border-collapse:collapse;margin-bottom:24px;}"
+                ".report-table th{background:#4285f4;color:#ffffff;}"
+                ".report-table th,.report-table td{border:1px solid #000000;padding:4px 8px;text-align:center;}"
+                ".report-table tr:nth-child(even) td{background:#e8f0fe;}</style></head>"
+                f"<body><h1>{html.escape(base_name)}</h1>"
+                f"<p>Created {datetime.now().strftime('%B %d, %Y %I:%M %p')}</p>{sections}</body></html>")
+
+        file_path = os.path.join(folder_path, f"{base_name}.html")
+        ReportDesign.write_file(file_path, page.encode("utf-8"))
+
+        return [file_path]
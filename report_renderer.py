@@ -0,0 +1,192 @@
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+import threading
+import os
+import pandas as pd
+import pyarrow as pa
+from report_design import ReportDesign
+from report_exporter import ReportExporter
+
+
+class ReportRenderer:
+    """
+    A class for rendering report workbooks in a process pool.
+
+    Every report job is a tuple of the report name and a dictionary of the ReportDesign instance attributes for that
+    report (Ex. ("SLA/Bot Report", {"sla_data": ..., "bot_df": ..., "file_label": "YTH"})). Each workbook is rendered
+    in its own process, so several reports use every core instead of 1. Dataframes are sent to the processes as Arrow
+    IPC bytes. A single job is rendered in the calling process, since starting a process costs more than it saves.
+    Besides the Excel workbook ("xlsx"), every job can be exported as CSV, Parquet and HTML files. The exports are
+    written on their own threads while the workbook is designed. submit renders the jobs on a shared background
+    executor and returns a Future straight away, so the caller can move on while the workbooks are styled and saved.
+
+      Attributes:
+        - max_workers (int): Largest number of processes used to render the jobs.
+      Methods:
+        - render: Render a list of report jobs in a list of output formats.
+        - submit: Render a list of report jobs in the background.
+        - encode_values: Encode the Dataframes of a job as Arrow IPC bytes.
+        - decode_values: Decode the Arrow IPC bytes of a job back into Dataframes.
+    """
+
+    # Marks a value of a job that was encoded as Arrow IPC bytes.
+    ARROW_MARKER = "__arrow_ipc__"
+
+    # Output formats a job can be rendered in.
+    VALID_OUTPUT_FORMATS = ["xlsx", *ReportExporter.VALID_FORMATS.keys()]
+
+    # Number of report renders that run in the background at the same time.
+    RENDER_THREADS = 2
+
+    # Background executor shared by every ReportRenderer. Created the first time a render is submitted.
+    _executor = None
+    _executor_lock = threading.Lock()
+
+    def __init__(self, max_workers: int = None):
+        """
+        Initializes a ReportRenderer Object.
+
+        :param max_workers: Largest number of processes used to render the jobs. (Default: None [Number of CPUs])
+        """
+        self.max_workers = max_workers if max_workers is not None else os.cpu_count() or 1
+
+    def render(self, jobs: list, output_formats: tuple = ("xlsx",)) -> list:
+        """
+        Render a list of report jobs.
+
+        :param jobs: List of tuples of the report name and a dictionary of the ReportDesign instance attributes.
+        :param output_formats: Formats to render every job in. Leave out "xlsx" to only export the data files.
+            (Valid Formats: 'xlsx', 'csv', 'parquet' or 'html') (Default: ("xlsx",))
+        :return: Returns a list of the saved file paths of every job, in the same order as the jobs.
+        :raise KeyError: Will raise error if a report name is not valid.
+        :raise ValueError: Will raise error if an output format is not valid.
+        """
+        ReportRenderer._check_jobs(jobs, output_formats)
+
+        if len(jobs) <= 1 or self.max_workers == 1:
+            return [ReportRenderer._render_job(report_name, report_values, output_formats)
+                    for report_name, report_values in jobs]
+
+        with ProcessPoolExecutor(max_workers=min(self.max_workers, len(jobs))) as executor:
+            futures = [executor.submit(ReportRenderer._render_job, report_name,
+                                       ReportRenderer.encode_values(report_values), output_formats)
+                       for report_name, report_values in jobs]
+            return [future.result() for future in futures]
+
+    def submit(self, jobs: list, output_formats: tuple = ("xlsx",)) -> Future:
+        """
+        Render a list of report jobs in the background. See render.
+
+        The jobs are checked before they are submitted, so a bad report name or output format raises straight away.
+        :param jobs: List of tuples of the report name and a dictionary of the ReportDesign instance attributes.
+        :param output_formats: Formats to render every job in. (Default: ("xlsx",))
+        :return: Returns a Future of the list of the saved file paths of every job.
+        :raise KeyError: Will raise error if a report name is not valid.
+        :raise ValueError: Will raise error if an output format is not valid.
+        """
+        ReportRenderer._check_jobs(jobs, output_formats)
+        return ReportRenderer._get_executor().submit(self.render, jobs, output_formats)
+
+    @classmethod
+    def _get_executor(cls) -> ThreadPoolExecutor:
+        """
+        Get the shared background executor. The executor is created the first time it is needed.
+        :return: Returns the ThreadPoolExecutor.
+        """
+        with cls._executor_lock:
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(max_workers=cls.RENDER_THREADS, thread_name_prefix="report-render")
+
+            return cls._executor
+
+    @staticmethod
+    def _check_jobs(jobs: list, output_formats: tuple) -> None:
+        """
+        Check the report names of the jobs and the output formats.
+        :param jobs: List of tuples of the report name and a dictionary of the ReportDesign instance attributes.
+        :param output_formats: Formats to render every job in.
+        :raise KeyError: Will raise error if a report name is not valid.
+        :raise ValueError: Will raise error if an output format is not valid.
+        """
+        for report_name, _ in jobs:
+            if report_name not in ReportDesign.VALID_REPORT_DESIGN.keys():
+                raise KeyError(f"{report_name} is not a valid report. Valid reports are "
+                               f"{' or '.join(ReportDesign.VALID_REPORT_DESIGN.keys())}")
+
+        for output_format in output_formats:
+            if output_format not in ReportRenderer.VALID_OUTPUT_FORMATS:
+                raise ValueError(f"{output_format} is not a valid output format. Valid output formats are "
+                                 f"{' or '.join(ReportRenderer.VALID_OUTPUT_FORMATS)}")
+
+    @staticmethod
+    def encode_values(report_values: dict) -> dict:
+        """
+        Encode the Dataframes of a job as Arrow IPC bytes. Every other value is left as is.
+        :param report_values: Dictionary of the ReportDesign instance attributes.
+        :return: Returns the dictionary with every Dataframe encoded.
+        """
+        encoded_values = {}
+        for name, value in report_values.items():
+            if isinstance(value, pd.DataFrame):
+                sink = pa.BufferOutputStream()
+                table = pa.Table.from_pandas(value)
+                with pa.ipc.new_stream(sink, table.schema) as writer:
+                    writer.write_table(table)
+                value = (ReportRenderer.ARROW_MARKER, sink.getvalue().to_pybytes())
+
+            encoded_values[name] = value
+
+        return encoded_values
+
+    @staticmethod
+    def decode_values(report_values: dict) -> dict:
+        """
+        Decode the Arrow IPC bytes of a job back into Dataframes. Every other value is left as is.
+        :param report_values: Dictionary of the ReportDesign instance attributes.
+        :return: Returns the dictionary with every Dataframe decoded.
+        """
+        decoded_values = {}
+        for name, value in report_values.items():
+            if isinstance(value, tuple) and len(value) == 2 and value[0] == ReportRenderer.ARROW_MARKER:
+                value = pa.ipc.open_stream(value[1]).read_all().to_pandas()
+
+            decoded_values[name] = value
+
+        return decoded_values
+
+    @staticmethod
+    def _render_job(report_name: str, report_values: dict, output_formats: tuple = ("xlsx",)) -> list:
+        """
+        Render 1 report job.
+
+        The data files are exported on their own threads while the Excel workbook is designed. The workbook and the
+        data files get the same date and time in their file names.
+        :param report_name: Name of the report.
+        :param report_values: Dictionary of the ReportDesign instance attributes. Dataframes can be Arrow IPC bytes.
+        :param output_formats: Formats to render the job in. (Default: ("xlsx",))
+        :return: Returns a list of the saved file paths. The Excel file is first.
+        """
+        report_values = ReportRenderer.decode_values(report_values)
+        if report_values.get("date_time") is None:
+            report_values["date_time"] = ReportDesign.get_date_time()
+
+        export_formats = [output_format for output_format in output_formats if output_format != "xlsx"]
+        report_exporter = ReportExporter(report_name=report_name, report_values=report_values,
+                                         file_label=report_values.get("file_label"),
+                                         date_time=report_values["date_time"])
+
+        file_paths = []
+        with ThreadPoolExecutor(max_workers=max(len(export_formats), 1)) as executor:
+            futures = [executor.submit(report_exporter.export, export_format) for export_format in export_formats]
+
+            if "xlsx" in output_formats:
+                report_design = ReportDesign(report_name=report_name)
+                for name, value in report_values.items():
+                    setattr(report_design, name, value)
+
+                report_design.create_report(report_name=report_name)
+                file_paths.append(report_design.file_path)
+
+            for future in futures:
+                file_paths.extend(future.result())
+
+        return file_paths
@@ -0,0 +1,100 @@
+from functools import lru_cache
+from openpyxl import Workbook
+from openpyxl.styles import PatternFill, Border, Side, Alignment, Font, NamedStyle
+
+
+class ReportStyles:
+    """
+    A registry of the styles used to design the reports.
+
+    Every style object (Border, Font, PatternFill and Alignment) is created once and shared by every cell that uses
+    it. The most common cell designs are registered on the workbook as named styles, so a cell only has to point to
+    the named style instead of getting its own font, fill and border.
+
+      Methods:
+        - register_named_styles: Register the named styles on a workbook.
+        - get_border: Get a full border.
+        - get_font: Get a font.
+        - get_fill: Get a fill.
+        - get_alignment: Get an alignment.
+    """
+
+    HEADER = "Report Header"
+    TOTAL_ROW = "Report Total Row"
+    REFERENCE_LEGEND = "Reference Legend"
+
+    # Named Styles constant which contains the named style name and a dictionary of the font, fill and border used
+    # by that named style.
+    NAMED_STYLES = {
+        HEADER: {"font": {"bold": True}, "fill": "4285f4"},
+        TOTAL_ROW: {"font": {"bold": True}, "fill": "4285f4"},
+        REFERENCE_LEGEND: {"font": {"bold": True, "hex_color": "000000"}, "fill": None},
+    }
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def get_border(border_type: str = "thin") -> Border:
+        """
+        Get a full border around a cell.
+        :param border_type: Type of border. (Default: "thin")
+        :return: Returns the shared Border object.
+        """
+        side = Side(border_type)
+        return Border(left=side, right=side, top=side, bottom=side)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def get_font(font_name: str = "Calibri", size: int = 11, bold: bool = False, italics: bool = False,
+                 hex_color: str = "ffffff") -> Font:
+        """
+        Get a font.
+        :param font_name: Name of the font (Default: 'Calibri')
+        :param size: Size of the font (Default: 11)
+        :param bold: Set bold font. (Default: False)
+        :param italics: Set italics font. (Default: False)
+        :param hex_color: Color of the font in hex value without '#'. (Default = 'ffffff' [White Color])
+        :return: Returns the shared Font object.
+        """
+        return Font(name=font_name, size=size, bold=bold, color=hex_color, italic=italics)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def get_fill(hex_color: str, fill_type: str = "solid") -> PatternFill:
+        """
+        Get a fill.
+        :param hex_color: Fill color in hex value without '#'. (Ex. 'ffffff')
+        :param fill_type: Pattern or color gradient (Default: 'solid")
+        :return: Returns the shared PatternFill object.
+        """
+        return PatternFill(start_color=hex_color, end_color=hex_color, fill_type=fill_type)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def get_alignment(horizontal: str = None, vertical: str = None) -> Alignment:
+        """
+        Get an alignment.
+        :param horizontal: Horizontal alignment. (Default: None)
+        :param vertical: Vertical alignment. (Default: None)
+        :return: Returns the shared Alignment object.
+        """
+        return Alignment(horizontal=horizontal, vertical=vertical)
+
+    @classmethod
+    def register_named_styles(cls, workbook: Workbook) -> None:
+        """
+        Register the named styles on a workbook.
+
+        Every named style has a thin full border and is centered. Named styles that are already registered on the
+        workbook are skipped.
+        :param workbook: Workbook to register the named styles on.
+        """
+        for style_name, style_values in cls.NAMED_STYLES.items():
+            if style_name in workbook.named_styles:
+                continue
+
+            named_style = NamedStyle(name=style_name, font=cls.get_font(**style_values["font"]),
+                                     border=cls.get_border(), alignment=cls.get_alignment(horizontal="center"))
+            if style_values["fill"] is not None:
+                named_style.fill = cls.get_fill(style_values["fill"])
+
+            workbook.add_named_style(named_style)
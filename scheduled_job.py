@@ -0,0 +1,57 @@
+from concurrent.futures import Future
+import threading
+
+
+class ScheduledJob:
+    """
+    A job that is queued on a JobScheduler and runs on one of its workers.
+
+    A job is cancelled cooperatively. A queued job is removed from the queue straight away. A running job only has its
+    cancel event set, and the target checks the event (Ex. between AWB searches) and raises CancelledError to stop.
+
+      Attributes:
+        - name (str): Name of the job. A job submitted with the name of a queued or running job is merged into it.
+        - target (callable): The method the job runs.
+        - args (tuple): Positional arguments passed to the target.
+        - kwargs (dict): Keyword arguments passed to the target.
+        - state (str): State of the job. (See VALID_STATES)
+        - request_count (int): Number of times the job was submitted. (More than 1 if duplicate requests were merged)
+        - cancel_event (threading.Event): Set once the job is cancelled.
+        - future (Future): Future of the result of the target.
+      Methods:
+        - is_active: Check if the job is queued or running and was not cancelled.
+    """
+
+    QUEUED = "Queued"
+    RUNNING = "Running"
+    DONE = "Done"
+    FAILED = "Failed"
+    CANCELLED = "Cancelled"
+
+    # Valid States constant which contains every state a job can be in.
+    VALID_STATES = (QUEUED, RUNNING, DONE, FAILED, CANCELLED)
+
+    def __init__(self, name: str, target: callable, args: tuple = (), kwargs: dict = None):
+        """
+        Initializes a ScheduledJob Object. The job starts in the Queued state.
+
+        :param name: Name of the job.
+        :param target: The method the job runs.
+        :param args: Positional arguments passed to the target. (Default: ())
+        :param kwargs: Keyword arguments passed to the target. (Default: None [No keyword arguments])
+        """
+        self.name = name
+        self.target = target
+        self.args = args
+        self.kwargs = kwargs if kwargs is not None else {}
+        self.state = ScheduledJob.QUEUED
+        self.request_count = 1
+        self.cancel_event = threading.Event()
+        self.future = Future()
+
+    def is_active(self) -> bool:
+        """
+        Check if the job is queued or running and was not cancelled.
+        :return: Returns True if the job is active, otherwise False.
+        """
+        return self.state in (ScheduledJob.QUEUED, ScheduledJob.RUNNING) and not self.cancel_event.is_set()
@@ -1,5 +1,6 @@
+from concurrent.futures import Future, ThreadPoolExecutor
 import customtkinter as ctk
-from tkinter import Button, Frame, messagebox, RIDGE
+from tkinter import Button, Frame, messagebox, RIDGE, TclError
 from Settings_Data import SettingsData
 from pop_up_window import PopUpWindow
 
@@ -12,6 +13,10 @@ class SettingWindow(PopUpWindow):
     Home Delivery Settings. These 2 frames include entry boxes which loads the saved settings from a database. The
     user will be able to change the text in the entry box and save the settings to the database.
 
+    The settings are loaded and saved on a background thread, so the window is drawn straight away and the GUI doesn't
+    freeze while the database answers. The entry boxes show their placeholders until the settings are loaded. Saves
+    are queued and run in order.
+
      Attributes:
          - All Widgets/Frames used to create the Setting GUI.
          - widget_list (private): List of widgets that are created.
@@ -19,6 +24,9 @@ class SettingWindow(PopUpWindow):
          - theme: The theme of the GUI.
     """
 
+    # Background thread that loads and saves the settings. 1 worker keeps the saves in order.
+    _settings_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="settings")
+
     def __init__(self, theme: str, title: str, size: str):
         """
         Initializes a SettingWindow Object.
@@ -31,10 +39,10 @@ class SettingWindow(PopUpWindow):
         super().__init__(theme, title, size)
         self.theme = theme
 
-        # Get Database Setting Data
+        # Database Setting Data is loaded in the background (Both setting groups are read in 1 batch)
         self.setting_data = SettingsData()
-        self.bot_sla_data = self.setting_data.get_bot_sla_data()
-        self.home_data = self.setting_data.get_home_delivery_data()
+        self.bot_sla_data = {}
+        self.home_data = {}
 
         # Create Frames, Button and Custom Menu Bar
         self._create_menu_bar_frame()
@@ -51,12 +59,85 @@ class SettingWindow(PopUpWindow):
             "Home Delivery Widgets": self._create_widgets(self.home_frame, self._home_widgets_data())
         }
 
+        # The previous values are stored once the settings are loaded.
+        self._previous_values = {}
+        self._set_widgets_state(state=ctk.DISABLED)
+
+        settings_future = SettingWindow._settings_executor.submit(self.setting_data.get_settings_groups)
+        self._on_gui_thread(future=settings_future, callback=self._settings_loaded)
+
+    def _on_gui_thread(self, future: Future, callback: callable) -> None:
+        """
+        Call a method on the GUI thread once a background task is done.
+
+        The future finishes on the settings thread, so the callback is handed to the GUI thread with after(). Nothing
+        is called if the setting window was closed.
+        :param future: Future of the background task.
+        :param callback: Method that takes the finished future.
+        """
+        def schedule_callback(done_future: Future) -> None:
+            try:
+                self.after(0, callback, done_future)
+            except (RuntimeError, TclError):
+                # The setting window was closed before the task was done.
+                pass
+
+        future.add_done_callback(schedule_callback)
+
+    def _settings_loaded(self, settings_future: Future) -> None:
+        """
+        Insert the settings that were loaded in the background into the entry boxes and store the previous values.
+
+        If the settings could not be loaded an error message is displayed and the entry boxes stay disabled.
+        :param settings_future: The finished Future of the settings groups.
+        """
+        if not self.winfo_exists():
+            return
+
+        exception = settings_future.exception()
+        if exception is not None:
+            messagebox.showerror(title="Settings Error", parent=self,
+                                 message=f"The settings could not be loaded. Please try again.\n{exception}")
+            return
+
+        settings_groups = settings_future.result()
+        self.bot_sla_data = settings_groups[SettingsData.BOT_SLA_REPORT_TABLE_NAME]
+        self.home_data = settings_groups[SettingsData.HOME_REPORT_TABLE_NAME]
+
+        self._set_widgets_state(state=ctk.NORMAL)
+        self._fill_widgets(widget_group="SLA/Bot Widgets", widget_data=self._sla_bot_widgets_data())
+        self._fill_widgets(widget_group="Home Delivery Widgets", widget_data=self._home_widgets_data())
+
         # Store the previous values
         self._previous_values = {
             "SLA/Bot Values": self._get_entry_box_values("SLA/Bot Widgets"),
             "Home Delivery Values": self._get_entry_box_values("Home Delivery Widgets")
         }
 
+    def _fill_widgets(self, widget_group: str, widget_data: list) -> None:
+        """
+        Replace the values of the entry boxes of a widget group.
+        :param widget_group: The widget group to fill. (Valid values: SLA/Bot Widgets or Home Delivery Widgets)
+        :param widget_data: List of widgets_data with the setting values (ex. _home_widgets_data()). The first
+            element is the label's header text.
+        """
+        for field in widget_data[1:]:
+            entry = self._widget_list[widget_group][field["label_text"]]
+            entry.delete(0, ctk.END)
+            if field["setting_key"] not in ("", None):
+                entry.insert(ctk.END, field["setting_key"])
+
+    def _set_widgets_state(self, state: str) -> None:
+        """
+        Enable or disable every entry box and the save button.
+        :param state: State of the widgets. (ctk.NORMAL or ctk.DISABLED)
+        """
+        for widget_group in self._widget_list.values():
+            for entry in widget_group.values():
+                entry.configure(state=state)
+
+        self.save_button.configure(state=state)
+
     def _on_enter(self, event) -> None:
         """
         Change the background color of the "Help" button when hovering over it.
@@ -335,7 +416,9 @@ class SettingWindow(PopUpWindow):
 
                 entry = ctk.CTkEntry(master=frame, width=100, justify="center",
                                      placeholder_text=field["entry_placeholder"])
-                entry.insert(ctk.END, field["setting_key"])
+                # Settings that are not loaded yet (or not set) are left empty, so the placeholder is displayed.
+                if field["setting_key"] not in ("", None):
+                    entry.insert(ctk.END, field["setting_key"])
                 entry.pack()
 
                 key = f"{field['label_text']}"
@@ -370,9 +453,10 @@ class SettingWindow(PopUpWindow):
                               FromAirport,
                               ToAirport,
                               Keywords
-        :return: Returns the value for the specified setting name and setting group.
+        :return: Returns the value for the specified setting name and setting group. Returns an empty string if the
+            settings are not loaded yet.
         """
-        return setting_group[setting_name]
+        return setting_group.get(setting_name, "")
 
     def _save_sla_bot_settings(self) -> None:
         """
@@ -388,10 +472,9 @@ class SettingWindow(PopUpWindow):
         from_airport = self._widget_list["SLA/Bot Widgets"]["From Airport"].get()
         to_airport = self._widget_list["SLA/Bot Widgets"]["To Airport"].get()
 
-        self.setting_data.update_database(table_name=self.setting_data.BOT_SLA_REPORT_TABLE_NAME,
-                                          DayAmount=int(day_amount), NumOfMonths=int(num_of_months),
-                                          NumOfDays=int(num_of_days), FromAirport=from_airport,
-                                          ToAirport=to_airport)
+        self._queue_save(values_name="SLA/Bot Values", table_name=self.setting_data.BOT_SLA_REPORT_TABLE_NAME,
+                         DayAmount=int(day_amount), NumOfMonths=int(num_of_months), NumOfDays=int(num_of_days),
+                         FromAirport=from_airport, ToAirport=to_airport)
 
     def _save_home_settings(self) -> None:
         """
@@ -407,9 +490,34 @@ class SettingWindow(PopUpWindow):
         from_airport = self._widget_list["Home Delivery Widgets"]["From Airport"].get()
         to_airport = self._widget_list["Home Delivery Widgets"]["To Airport"].get()
 
-        self.setting_data.update_database(table_name=self.setting_data.HOME_REPORT_TABLE_NAME, Keyword=keyword,
-                                          NumOfMonths=int(num_of_months), NumOfDays=int(num_of_days),
-                                          FromAirport=from_airport, ToAirport=to_airport)
+        self._queue_save(values_name="Home Delivery Values", table_name=self.setting_data.HOME_REPORT_TABLE_NAME,
+                         Keyword=keyword, NumOfMonths=int(num_of_months), NumOfDays=int(num_of_days),
+                         FromAirport=from_airport, ToAirport=to_airport)
+
+    def _queue_save(self, values_name: str, table_name: str, **kwargs) -> None:
+        """
+        Queue a database update on the settings thread. The entry box values are read before the save is queued.
+        :param values_name: Name of the previous values of the setting group. (SLA/Bot Values or Home Delivery Values)
+        :param table_name: The database table name that you want to update.
+        :param kwargs: Setting values passed to SettingsData.update_database.
+        """
+        save_future = SettingWindow._settings_executor.submit(self.setting_data.update_database,
+                                                              table_name=table_name, **kwargs)
+        self._on_gui_thread(future=save_future,
+                            callback=lambda future: self._settings_saved(values_name=values_name, save_future=future))
+
+    def _settings_saved(self, values_name: str, save_future: Future) -> None:
+        """
+        Display an error message if a queued save failed. The previous values of the setting group are cleared, so the
+        next click on the save button tries again.
+        :param values_name: Name of the previous values of the setting group. (SLA/Bot Values or Home Delivery Values)
+        :param save_future: The finished Future of the database update.
+        """
+        exception = save_future.exception()
+        if exception is not None and self.winfo_exists():
+            self._previous_values[values_name] = None
+            messagebox.showerror(title="Settings Error", parent=self,
+                                 message=f"The settings could not be saved. Please try again.\n{exception}")
 
     def _get_entry_box_values(self, widget_group: str) -> dict:
         """
@@ -0,0 +1,61 @@
+from abc import ABC, abstractmethod
+
+
+class SettingsStore(ABC):
+    """
+    Base class for the stores that hold the setting values.
+
+    Every settings table holds 1 row of setting values for every settings profile, indexed by the ProfileName column.
+    A store reads and writes the row of 1 profile. Every profile of a table has a version that changes whenever a
+    value in its row changes, so callers can cache the values and only read a row again when its version changed.
+    Versions are strings. Every store implements the abstract methods.
+
+      Attributes:
+        - setting_columns (dict): Dictionary where the keys are the table names and the values are the list of
+            columns of that table.
+      Methods:
+        - read_tables: Read the versions of a profile in several tables and the values of the tables that changed.
+        - write_table: Write the values of a profile in a table.
+        - read_profile_names: Read the names of every profile in a table.
+    """
+
+    # Column that holds the name of the profile of every row.
+    PROFILE_COLUMN = "ProfileName"
+
+    def __init__(self, setting_columns: dict):
+        """
+        Initializes a SettingsStore Object.
+
+        :param setting_columns: Dictionary where the keys are the table names and the values are the list of columns
+            of that table.
+        """
+        self.setting_columns = setting_columns
+
+    @abstractmethod
+    def read_tables(self, cached_versions: dict, profile_name: str) -> tuple[dict, dict]:
+        """
+        Read the versions of a profile in several tables and the values of the tables that changed.
+        :param cached_versions: Dictionary where the keys are the table names and the values are the cached versions
+            of the profile in those tables. (None if the profile is not cached)
+        :param profile_name: Name of the profile.
+        :return: Returns a tuple of a dictionary of the versions and a dictionary of the values of every table whose
+            version is not the cached version. The values are None if the table has no row for the profile.
+        """
+
+    @abstractmethod
+    def write_table(self, table_name: str, values: dict, profile_name: str) -> str:
+        """
+        Write the values of a profile in a table. The row of the profile is added if it doesn't exist.
+        :param table_name: The name of the table.
+        :param values: Dictionary of the columns and values to write.
+        :param profile_name: Name of the profile.
+        :return: Returns the new version of the profile.
+        """
+
+    @abstractmethod
+    def read_profile_names(self, table_name: str) -> list:
+        """
+        Read the names of every profile in a table.
+        :param table_name: The name of the table.
+        :return: Returns a sorted list of the profile names.
+        """
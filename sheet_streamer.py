@@ -0,0 +1,229 @@
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.formatting.rule import FormulaRule
+from openpyxl.utils import get_column_letter
+from openpyxl.utils.cell import coordinate_to_tuple
+from openpyxl.worksheet._write_only import WriteOnlyWorksheet
+import pandas as pd
+from report_styles import ReportStyles
+
+
+class SheetStreamer:
+    """
+    A class for writing Dataframes to the sheets of a write-only workbook.
+
+    Rows are read from the Dataframe in chunks and written to the sheet straight away, so only 1 row of cells is held
+    in memory at a time. The same styled cell of every column is used again for every row. If a Dataframe has more
+    rows than an Excel sheet can hold, the rest of the rows are written to continuation sheets
+    (Ex. "Bot Report (2)") with the header on the first row.
+
+      Attributes:
+        - workbook (Workbook): The write-only workbook.
+        - chunk_rows (int): Number of rows read from a Dataframe at a time.
+        - max_rows (int): Number of rows an Excel sheet can hold.
+      Methods:
+        - stream_dataframe: Write a Dataframe to a new sheet and any continuation sheets it needs.
+        - styled_cell: Create a styled cell for a write-only sheet.
+        - create_fixed_cells: Create the fixed cells written around a Dataframe.
+    """
+
+    CHUNK_ROWS = 5000
+    EXCEL_MAX_ROWS = 1048576
+
+    def __init__(self, workbook: Workbook, chunk_rows: int = None, max_rows: int = None):
+        """
+        Initializes a SheetStreamer Object.
+
+        :param workbook: The write-only workbook. (Workbook(write_only=True))
+        :param chunk_rows: Number of rows read from a Dataframe at a time. (Default: None [SheetStreamer.CHUNK_ROWS])
+        :param max_rows: Number of rows an Excel sheet can hold. (Default: None [SheetStreamer.EXCEL_MAX_ROWS])
+        :raise ValueError: Will raise error if the workbook is not a write-only workbook.
+        """
+        if not workbook.write_only:
+            raise ValueError("SheetStreamer can only write to a write-only workbook. (Workbook(write_only=True))")
+
+        self.workbook = workbook
+        self.chunk_rows = chunk_rows if chunk_rows is not None else SheetStreamer.CHUNK_ROWS
+        self.max_rows = max_rows if max_rows is not None else SheetStreamer.EXCEL_MAX_ROWS
+
+        # The header cells use the named styles, so they are registered once on the workbook.
+        ReportStyles.register_named_styles(workbook)
+
+    def stream_dataframe(self, sheet_name: str, dataframe: pd.DataFrame, start_row: int, start_col: int,
+                         continuation_name: str = None, fixed_cells=None, column_widths: dict = None,
+                         header_size: int = 11, zebra_rows: bool = True, borders: bool = None) -> list:
+        """
+        Write a Dataframe to a new sheet and any continuation sheets it needs.
+
+        The header is written on the start row and the rows below it. Every data cell is centered, and the data range
+        gets borders and zebra rows from conditional formatting (unless they are turned off). Column widths and
+        gridlines are set before any row is written, since a write-only sheet can't change them after.
+        :param sheet_name: Name of the first sheet.
+        :param dataframe: Dataframe to write. The index is not written.
+        :param start_row: Row of the header on the first sheet. Continuation sheets have the header on row 1.
+        :param start_col: Column position of the first Dataframe column.
+        :param continuation_name: Name used for the continuation sheets. (Ex. "Bot Report" for "Bot Report (2)")
+            (Default: None [sheet_name])
+        :param fixed_cells: Function that takes the first sheet and returns a dictionary of the cells written around
+            the Dataframe. See create_fixed_cells. (Default: None)
+        :param column_widths: Dictionary of column letters and widths. (Default: None)
+        :param header_size: Font size of the header. (Default: 11)
+        :param zebra_rows: Add zebra rows to the data range. (Default: True)
+        :param borders: Add borders to the data range. (Default: None [Only if zebra_rows is True])
+        :return: Returns a list of tuples of every sheet written and the range of its data rows (None if the sheet
+            has no data rows).
+        """
+        continuation_name = continuation_name if continuation_name is not None else sheet_name
+        borders = borders if borders is not None else zebra_rows
+
+        written_sheets = []
+        first_row = 0
+        part = 1
+        while True:
+            header_row = start_row if part == 1 else 1
+            part_df = dataframe.iloc[first_row:first_row + self.max_rows - header_row]
+
+            sheet = self.workbook.create_sheet(sheet_name if part == 1 else f"{continuation_name} ({part})")
+            SheetStreamer._prepare_sheet(sheet, column_widths)
+            sheet_cells = fixed_cells(sheet) if fixed_cells is not None and part == 1 else {}
+
+            self._write_rows(sheet=sheet, dataframe=part_df, header_row=header_row, start_col=start_col,
+                             fixed_cells=sheet_cells, header_size=header_size)
+
+            data_range = None
+            if not part_df.empty:
+                data_range = (f"{get_column_letter(start_col)}{header_row + 1}:"
+                              f"{get_column_letter(start_col + len(dataframe.columns) - 1)}{header_row + len(part_df)}")
+                if borders:
+                    SheetStreamer._add_borders(sheet, data_range)
+                if zebra_rows:
+                    SheetStreamer._add_zebra_rows(sheet, data_range)
+
+            written_sheets.append((sheet, data_range))
+
+            first_row += len(part_df)
+            if first_row >= len(dataframe):
+                return written_sheets
+            part += 1
+
+    @staticmethod
+    def styled_cell(sheet: WriteOnlyWorksheet, value=None, style: str = None, font=None, fill=None, border=None,
+                    alignment=None) -> WriteOnlyCell:
+        """
+        Create a styled cell for a write-only sheet.
+        :param sheet: The sheet the cell is written to.
+        :param value: Value of the cell. (Default: None)
+        :param style: Name of a named style. (Ex. ReportStyles.HEADER) (Default: None)
+        :param font: Font of the cell. (Default: None)
+        :param fill: Fill of the cell. (Default: None)
+        :param border: Border of the cell. (Default: None)
+        :param alignment: Alignment of the cell. (Default: None)
+        :return: Returns the cell.
+        """
+        cell = WriteOnlyCell(sheet, value=value)
+        if style is not None:
+            cell.style = style
+        for style_name, style_value in (("font", font), ("fill", fill), ("border", border),
+                                        ("alignment", alignment)):
+            if style_value is not None:
+                setattr(cell, style_name, style_value)
+
+        return cell
+
+    @staticmethod
+    def create_fixed_cells(sheet: WriteOnlyWorksheet, cell_data: dict) -> dict:
+        """
+        Create the fixed cells written around a Dataframe.
+        :param sheet: The sheet the cells are written to.
+        :param cell_data: Dictionary where the keys are the cell coordinates (Ex. "E3") and the values are tuples of
+            the cell value and a dictionary of the styled_cell style arguments.
+        :return: Returns a dictionary where the keys are the row numbers and the values are dictionaries of the column
+            numbers and cells.
+        """
+        fixed_cells = {}
+        for coordinate, (value, styles) in cell_data.items():
+            row, column = coordinate_to_tuple(coordinate)
+            fixed_cells.setdefault(row, {})[column] = SheetStreamer.styled_cell(sheet, value=value, **styles)
+
+        return fixed_cells
+
+    def _write_rows(self, sheet: WriteOnlyWorksheet, dataframe: pd.DataFrame, header_row: int, start_col: int,
+                    fixed_cells: dict, header_size: int) -> None:
+        """
+        Write the rows of a sheet in order. Rows without a header, data or fixed cell are left empty.
+        :param sheet: The sheet to write to.
+        :param dataframe: Dataframe to write.
+        :param header_row: Row of the header.
+        :param start_col: Column position of the first Dataframe column.
+        :param fixed_cells: Dictionary of the row numbers and dictionaries of the column numbers and cells.
+        :param header_size: Font size of the header.
+        """
+        if header_size == 11:
+            header_styles = {"style": ReportStyles.HEADER}
+        else:
+            header_styles = {"font": ReportStyles.get_font(size=header_size, bold=True),
+                             "fill": ReportStyles.get_fill("4285f4"), "border": ReportStyles.get_border(),
+                             "alignment": ReportStyles.get_alignment(horizontal="center")}
+
+        header_cells = {column: SheetStreamer.styled_cell(sheet, value=value, **header_styles)
+                        for column, value in enumerate(dataframe.columns, start=start_col)}
+        data_rows = self._iter_data_rows(sheet, dataframe)
+
+        last_row = max([header_row + len(dataframe), *fixed_cells.keys()])
+        for row in range(1, last_row + 1):
+            row_cells = dict(fixed_cells.get(row, {}))
+            if row == header_row:
+                row_cells.update(header_cells)
+            elif header_row < row <= header_row + len(dataframe):
+                row_cells.update(enumerate(next(data_rows), start=start_col))
+
+            sheet.append([row_cells.get(column) for column in range(1, max(row_cells, default=0) + 1)])
+
+    def _iter_data_rows(self, sheet: WriteOnlyWorksheet, dataframe: pd.DataFrame):
+        """
+        Iterate over the rows of a Dataframe in chunks.
+
+        Every column has 1 centered cell that gets the value of each row, since a write-only sheet writes a row as
+        soon as it is appended.
+        :param sheet: The sheet the cells are written to.
+        :param dataframe: Dataframe to iterate over.
+        :return: Yields a list of cells for every row.
+        """
+        alignment = ReportStyles.get_alignment(horizontal="center")
+        cells = [SheetStreamer.styled_cell(sheet, alignment=alignment) for _ in dataframe.columns]
+
+        for first_row in range(0, len(dataframe), self.chunk_rows):
+            for values in dataframe.iloc[first_row:first_row + self.chunk_rows].itertuples(index=False, name=None):
+                for cell, value in zip(cells, values):
+                    cell.value = None if not isinstance(value, str) and pd.isna(value) else value
+                yield cells
+
+    @staticmethod
+    def _prepare_sheet(sheet: WriteOnlyWorksheet, column_widths: dict = None) -> None:
+        """
+        Set the column widths and hide the gridlines of a sheet.
+        :param sheet: The sheet to prepare.
+        :param column_widths: Dictionary of column letters and widths. (Default: None)
+        """
+        for column_name, width in (column_widths or {}).items():
+            sheet.column_dimensions[column_name].width = width
+        sheet.sheet_view.showGridLines = False
+
+    @staticmethod
+    def _add_borders(sheet: WriteOnlyWorksheet, cell_range: str) -> None:
+        """
+        Add borders to a range with conditional formatting.
+        :param sheet: The sheet.
+        :param cell_range: Range of cells. (Ex. 'E9:H20')
+        """
+        sheet.conditional_formatting.add(cell_range, FormulaRule(formula=["TRUE"], border=ReportStyles.get_border()))
+
+    @staticmethod
+    def _add_zebra_rows(sheet: WriteOnlyWorksheet, cell_range: str) -> None:
+        """
+        Add zebra rows to a range with conditional formatting.
+        :param sheet: The sheet.
+        :param cell_range: Range of cells. (Ex. 'E9:H20')
+        """
+        sheet.conditional_formatting.add(cell_range, FormulaRule(formula=["MOD(ROW(),2)=0"],
+                                                                 fill=ReportStyles.get_fill("e8f0fe")))
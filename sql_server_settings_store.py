@@ -0,0 +1,218 @@
+import argparse
+import threading
+from Database_Connector import DatabaseConnector
+from settings_store import SettingsStore
+
+
+class SqlServerSettingsStore(SettingsStore):
+    """
+    A settings store in the SQL Server database.
+
+    The version of a profile is the SHA-256 hash of its row, so no version column is needed in the database. Every
+    settings table needs a ProfileName column with a unique index, so the row of a profile is found with an index seek.
+    The column and the index are added once with migrate_schema, by running "python sql_server_settings_store.py
+    --migrate" with a login that can alter the tables. The existing row of a table becomes the "Default" profile. The
+    first time the store is used, check_schema makes sure the tables have the column and raises an error if they don't.
+
+      Attributes:
+        - setting_columns (dict): Dictionary where the keys are the table names and the values are the list of
+            columns of that table.
+        - connector (DatabaseConnector): Connector used to borrow pooled connections to the database.
+      Methods:
+        - read_tables: Read the versions of a profile in several tables and the values of the tables that changed.
+        - write_table: Write the values of a profile in a table.
+        - read_profile_names: Read the names of every profile in a table.
+        - check_schema: Make sure every settings table has the ProfileName column.
+        - migrate_schema: Add the ProfileName column and its unique index to the tables that don't have them.
+    """
+
+    # Profile given to the row of a settings table that was created before there were profiles.
+    MIGRATED_PROFILE = "Default"
+
+    # Command that adds the ProfileName column and its unique index to the settings tables.
+    MIGRATE_COMMAND = "python sql_server_settings_store.py --migrate"
+
+    def __init__(self, setting_columns: dict):
+        """
+        Initializes a SqlServerSettingsStore Object.
+
+        :param setting_columns: Dictionary where the keys are the table names and the values are the list of columns
+            of that table.
+        """
+        super().__init__(setting_columns)
+        self.connector = DatabaseConnector()
+        self._schema_checked = False
+        self._schema_lock = threading.Lock()
+
+    def read_tables(self, cached_versions: dict, profile_name: str) -> tuple[dict, dict]:
+        """
+        Read the versions of a profile in several tables and the values of the tables that changed.
+
+        Everything is read from 1 connection. The versions are read in 1 query and the tables that changed are read
+        in 1 batch with a result set for every table.
+        :param cached_versions: Dictionary where the keys are the table names and the values are the cached versions
+            of the profile in those tables. (None if the profile is not cached)
+        :param profile_name: Name of the profile.
+        :return: Returns a tuple of a dictionary of the versions and a dictionary of the values of every table whose
+            version is not the cached version. The values are None if the table has no row for the profile.
+        """
+        self.check_schema()
+        with self.connector.pooled_connection() as connection:
+            cursor = connection.cursor()
+            versions = self._get_table_versions(cursor, list(cached_versions.keys()), profile_name)
+
+            changed_tables = [table_name for table_name, cached_version in cached_versions.items()
+                              if cached_version is None or cached_version != versions[table_name]]
+            fetched_tables = self._fetch_tables(cursor, changed_tables, profile_name) if changed_tables else {}
+
+        return versions, fetched_tables
+
+    def write_table(self, table_name: str, values: dict, profile_name: str) -> str:
+        """
+        Write the values of a profile in a table. The row of the profile is added if it doesn't exist.
+        :param table_name: The name of the table.
+        :param values: Dictionary of the columns and values to write.
+        :param profile_name: Name of the profile.
+        :return: Returns the new version of the profile.
+        """
+        self.check_schema()
+        with self.connector.pooled_connection() as connection:
+            cursor = connection.cursor()
+
+            set_columns = ", ".join(f"{column_name} = ?" for column_name in values)
+            cursor.execute(f"UPDATE {table_name} SET {set_columns} WHERE {SettingsStore.PROFILE_COLUMN} = ?;",
+                           (*values.values(), profile_name))
+
+            if cursor.rowcount == 0:
+                column_names = ", ".join((SettingsStore.PROFILE_COLUMN, *values.keys()))
+                placeholders = ", ".join("?" for _ in range(len(values) + 1))
+                cursor.execute(f"INSERT INTO {table_name} ({column_names}) VALUES ({placeholders});",
+                               (profile_name, *values.values()))
+
+            version = self._get_table_versions(cursor, [table_name], profile_name)[table_name]
+            connection.commit()
+
+        return version
+
+    def read_profile_names(self, table_name: str) -> list:
+        """
+        Read the names of every profile in a table.
+        :param table_name: The name of the table.
+        :return: Returns a sorted list of the profile names.
+        """
+        self.check_schema()
+        with self.connector.pooled_connection() as connection:
+            cursor = connection.cursor()
+            cursor.execute(f"SELECT {SettingsStore.PROFILE_COLUMN} FROM {table_name} "
+                           f"ORDER BY {SettingsStore.PROFILE_COLUMN};")
+            return [row[0] for row in cursor.fetchall()]
+
+    def check_schema(self) -> None:
+        """
+        Make sure every settings table has the ProfileName column. Nothing in the database is changed. The tables are
+        only checked the first time this is called, and the check is tried again on the next call if it fails.
+        :raise ValueError: Will raise an error if a settings table doesn't have the ProfileName column.
+        """
+        with self._schema_lock:
+            if self._schema_checked:
+                return
+
+            table_names = list(self.setting_columns.keys())
+            column_lengths = ", ".join(f"COL_LENGTH('{table_name}', '{SettingsStore.PROFILE_COLUMN}')"
+                                       for table_name in table_names)
+            with self.connector.pooled_connection() as connection:
+                cursor = connection.cursor()
+                cursor.execute(f"SELECT {column_lengths};")
+                row = cursor.fetchone()
+
+            missing_tables = [table_name for table_name, column_length in zip(table_names, row)
+                              if column_length is None]
+            if missing_tables:
+                raise ValueError(f"{', '.join(missing_tables)} doesn't have the {SettingsStore.PROFILE_COLUMN} column. "
+                                 f"Run \"{SqlServerSettingsStore.MIGRATE_COMMAND}\" once to add it.")
+
+            self._schema_checked = True
+
+    def migrate_schema(self) -> None:
+        """
+        Add the ProfileName column and its unique index to the settings tables that don't have them. The existing row
+        of a table becomes the MIGRATED_PROFILE. This is run once with MIGRATE_COMMAND, by a login that can alter the
+        tables, and can be run again safely.
+        """
+        profile_column = SettingsStore.PROFILE_COLUMN
+        with self.connector.pooled_connection() as connection:
+            cursor = connection.cursor()
+            for table_name in self.setting_columns.keys():
+                index_name = f"IX_{table_name}_{profile_column}"
+
+                # The column is added in its own batch, since a batch can't use a column it adds.
+                cursor.execute(f"IF COL_LENGTH('{table_name}', '{profile_column}') IS NULL "
+                               f"ALTER TABLE {table_name} ADD {profile_column} NVARCHAR(50) NOT NULL "
+                               f"CONSTRAINT DF_{table_name}_{profile_column} "
+                               f"DEFAULT '{SqlServerSettingsStore.MIGRATED_PROFILE}' WITH VALUES;")
+                cursor.execute(f"IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = '{index_name}' "
+                               f"AND object_id = OBJECT_ID('{table_name}')) "
+                               f"CREATE UNIQUE INDEX {index_name} ON {table_name} ({profile_column});")
+            connection.commit()
+
+        with self._schema_lock:
+            self._schema_checked = True
+
+    def _get_table_versions(self, cursor, table_names: list, profile_name: str) -> dict:
+        """
+        Gets the versions of a profile in several tables in 1 query. The version of a profile changes whenever a value
+        in its row changes.
+
+        The row is turned into JSON (null values included, so a value that moves to another column still changes the
+        JSON) and hashed with HASHBYTES SHA2_256. Only the columns in setting_columns are hashed.
+        :param cursor: Cursor of a database connection.
+        :param table_names: The names of the tables.
+        :param profile_name: Name of the profile.
+        :return: Returns a dictionary where the keys are the table names and the values are the hex SHA-256 hash of the
+            row of the profile in that table. (None if the table has no row for the profile)
+        """
+        version_columns = ", ".join(f"CONVERT(CHAR(64), HASHBYTES('SHA2_256', "
+                                    f"(SELECT {', '.join(self.setting_columns[table_name])} FROM {table_name} "
+                                    f"WHERE {SettingsStore.PROFILE_COLUMN} = ? FOR JSON PATH, INCLUDE_NULL_VALUES)), 2)"
+                                    for table_name in table_names)
+        cursor.execute(f"SELECT {version_columns}", [profile_name] * len(table_names))
+        return dict(zip(table_names, cursor.fetchone()))
+
+    def _fetch_tables(self, cursor, table_names: list, profile_name: str) -> dict:
+        """
+        Reads the row of a profile in several tables in 1 batch. Every table is its own result set.
+        :param cursor: Cursor of a database connection.
+        :param table_names: The names of the tables.
+        :param profile_name: Name of the profile.
+        :return: Returns a dictionary where the keys are the table names and the values are dictionaries of values
+            for that table. (None if the table has no row for the profile)
+        """
+        cursor.execute(" ".join(f"SELECT TOP 1 {', '.join(self.setting_columns[table_name])} FROM {table_name} "
+                                f"WHERE {SettingsStore.PROFILE_COLUMN} = ?;"
+                                for table_name in table_names),
+                       [profile_name] * len(table_names))
+
+        fetched_tables = {}
+        for position, table_name in enumerate(table_names):
+            if position > 0:
+                cursor.nextset()
+            row = cursor.fetchone()
+            fetched_tables[table_name] = dict(zip(self.setting_columns[table_name], row)) if row is not None else None
+
+        return fetched_tables
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Manage the settings tables in the SQL Server database.")
+    parser.add_argument("--migrate", action="store_true",
+                        help="Add the ProfileName column and its unique index to the settings tables that don't have "
+                             "them. Run once by a login that can alter the tables.")
+    arguments = parser.parse_args()
+
+    if not arguments.migrate:
+        parser.error("Nothing to do. Pass --migrate to migrate the settings tables.")
+
+    # Imported here, since only the migration needs the settings tables.
+    from Settings_Data import SettingsData
+    SqlServerSettingsStore(SettingsData.SETTING_COLUMNS).migrate_schema()
+    print(f"Migrated {', '.join(SettingsData.SETTING_COLUMNS)}.")
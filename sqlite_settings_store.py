@@ -0,0 +1,295 @@
+from contextlib import closing
+import hashlib
+import json
+import sqlite3
+import threading
+from settings_store import SettingsStore
+
+
+class SqliteSettingsStore(SettingsStore):
+    """
+    A settings store in a local SQLite file.
+
+    The store can be used on its own (Ex. to run the app without the SQL Server database) or as a read-through replica
+    of a source store. A replica reads every profile from the local file. A profile that was never synced is read from
+    the source the first time it's needed, and a background thread syncs the profiles that changed every SYNC_INTERVAL
+    seconds. Writes go to the source first and then to the local file. If the source can't be reached, the replica
+    keeps serving the last synced values.
+
+    Versions are stored as text. A replica keeps the version of the source store, and a store on its own uses the
+    SHA-256 hash of the row, the same way the SQL Server store does.
+
+      Attributes:
+        - setting_columns (dict): Dictionary where the keys are the table names and the values are the list of
+            columns of that table.
+        - file_path (str): Path of the SQLite file.
+        - source (SettingsStore): Store that is replicated. (None if the store is not a replica)
+        - last_sync_error (Exception): Error of the last background sync. (None if the last sync worked)
+      Methods:
+        - read_tables: Read the versions of a profile in several tables and the values of the tables that changed.
+        - write_table: Write the values of a profile in a table.
+        - read_profile_names: Read the names of every profile in a table.
+        - sync: Copy the profiles that changed from the source store.
+        - start_sync: Start syncing from the source store in the background.
+        - stop_sync: Stop syncing in the background.
+    """
+
+    # Table that holds the version of every profile of every settings table.
+    VERSION_TABLE_NAME = "SettingProfileVersions"
+
+    # Profile given to the row of a settings table that was created before there were profiles.
+    MIGRATED_PROFILE = "Default"
+
+    # Number of seconds between background syncs from the source store.
+    SYNC_INTERVAL = 30
+
+    def __init__(self, setting_columns: dict, file_path: str, source: SettingsStore = None):
+        """
+        Initializes a SqliteSettingsStore Object. The tables are created in the SQLite file if they don't exist,
+        tables without a ProfileName column get one and a version table with a numeric Version column is moved to a
+        text Version column.
+
+        :param setting_columns: Dictionary where the keys are the table names and the values are the list of columns
+            of that table.
+        :param file_path: Path of the SQLite file.
+        :param source: Store to replicate. (Default: None [Not a replica])
+        """
+        super().__init__(setting_columns)
+        self.file_path = file_path
+        self.source = source
+        self.last_sync_error = None
+        self._sync_stop = threading.Event()
+        self._sync_thread = None
+
+        with closing(self._connect()) as connection, connection:
+            SqliteSettingsStore._create_version_table(connection)
+            for table_name, column_names in self.setting_columns.items():
+                connection.execute(f"CREATE TABLE IF NOT EXISTS {table_name} "
+                                   f"({', '.join((SettingsStore.PROFILE_COLUMN, *column_names))})")
+
+                existing_columns = [row[1] for row in connection.execute(f"PRAGMA table_info({table_name})")]
+                if SettingsStore.PROFILE_COLUMN not in existing_columns:
+                    connection.execute(f"ALTER TABLE {table_name} ADD COLUMN {SettingsStore.PROFILE_COLUMN}")
+                    connection.execute(f"UPDATE {table_name} SET {SettingsStore.PROFILE_COLUMN} = ?",
+                                       (SqliteSettingsStore.MIGRATED_PROFILE,))
+
+                connection.execute(f"CREATE UNIQUE INDEX IF NOT EXISTS IX_{table_name}_{SettingsStore.PROFILE_COLUMN} "
+                                   f"ON {table_name} ({SettingsStore.PROFILE_COLUMN})")
+
+    def read_tables(self, cached_versions: dict, profile_name: str) -> tuple[dict, dict]:
+        """
+        Read the versions of a profile in several tables and the values of the tables that changed.
+
+        A replica first syncs the tables where the profile was never synced from the source store.
+        :param cached_versions: Dictionary where the keys are the table names and the values are the cached versions
+            of the profile in those tables. (None if the profile is not cached)
+        :param profile_name: Name of the profile.
+        :return: Returns a tuple of a dictionary of the versions and a dictionary of the values of every table whose
+            version is not the cached version. The values are None if the table has no row for the profile.
+        """
+        with closing(self._connect()) as connection:
+            versions = self._get_table_versions(connection, list(cached_versions.keys()), profile_name)
+
+        missing_tables = [table_name for table_name, version in versions.items() if version is None]
+        if missing_tables and self.source is not None:
+            self.sync(table_names=missing_tables, profile_names=[profile_name])
+            with closing(self._connect()) as connection:
+                versions = self._get_table_versions(connection, list(cached_versions.keys()), profile_name)
+
+        with closing(self._connect()) as connection:
+            fetched_tables = {table_name: self._fetch_table(connection, table_name, profile_name)
+                              for table_name, cached_version in cached_versions.items()
+                              if cached_version is None or cached_version != versions[table_name]}
+
+        return versions, fetched_tables
+
+    def write_table(self, table_name: str, values: dict, profile_name: str) -> str:
+        """
+        Write the values of a profile in a table. The row of the profile is added if it doesn't exist. A replica
+        writes to the source store first and keeps the source version. A store on its own uses the SHA-256 hash of
+        the new row as the version.
+        :param table_name: The name of the table.
+        :param values: Dictionary of the columns and values to write.
+        :param profile_name: Name of the profile.
+        :return: Returns the new version of the profile.
+        """
+        version = None
+        if self.source is not None:
+            version = self.source.write_table(table_name, values, profile_name)
+
+        with closing(self._connect()) as connection, connection:
+            new_values = {**(self._fetch_table(connection, table_name, profile_name) or {}), **values}
+            if version is None:
+                version = SqliteSettingsStore._get_row_version(new_values)
+
+            self._replace_row(connection, table_name, profile_name, new_values, version)
+
+        return version
+
+    def read_profile_names(self, table_name: str) -> list:
+        """
+        Read the names of every profile in a table. A replica reads the names from the source store, since profiles
+        are only synced once they are used.
+        :param table_name: The name of the table.
+        :return: Returns a sorted list of the profile names.
+        """
+        if self.source is not None:
+            return self.source.read_profile_names(table_name)
+
+        with closing(self._connect()) as connection:
+            rows = connection.execute(f"SELECT {SettingsStore.PROFILE_COLUMN} FROM {table_name} "
+                                      f"ORDER BY {SettingsStore.PROFILE_COLUMN}").fetchall()
+
+        return [row[0] for row in rows]
+
+    def sync(self, table_names: list = None, profile_names: list = None) -> None:
+        """
+        Copy the profiles that changed from the source store. A profile that was removed from the source is removed
+        from the local file. Nothing is copied if the store is not a replica.
+        :param table_names: The names of the tables to sync. (Default: None [Every table])
+        :param profile_names: The names of the profiles to sync. (Default: None [Every profile in the local file])
+        """
+        if self.source is None:
+            return
+
+        table_names = table_names if table_names is not None else list(self.setting_columns.keys())
+        if profile_names is None:
+            with closing(self._connect()) as connection:
+                profile_names = [row[0] for row in connection.execute(
+                    f"SELECT DISTINCT ProfileName FROM {SqliteSettingsStore.VERSION_TABLE_NAME}").fetchall()]
+
+        for profile_name in profile_names:
+            with closing(self._connect()) as connection:
+                local_versions = self._get_table_versions(connection, table_names, profile_name)
+
+            versions, fetched_tables = self.source.read_tables(local_versions, profile_name)
+
+            with closing(self._connect()) as connection, connection:
+                for table_name, values in fetched_tables.items():
+                    self._replace_row(connection, table_name, profile_name, values, versions[table_name])
+
+    def start_sync(self) -> None:
+        """
+        Start syncing from the source store every SYNC_INTERVAL seconds on a background thread. Nothing is started if
+        the store is not a replica or if the sync is already running.
+        """
+        if self.source is None or (self._sync_thread is not None and self._sync_thread.is_alive()):
+            return
+
+        self._sync_stop.clear()
+        self._sync_thread = threading.Thread(target=self._sync_loop, name="settings-sync", daemon=True)
+        self._sync_thread.start()
+
+    def stop_sync(self) -> None:
+        """
+        Stop syncing in the background.
+        """
+        self._sync_stop.set()
+
+    def _sync_loop(self) -> None:
+        """
+        Sync from the source store until stop_sync is called. A failed sync is tried again on the next interval, and
+        the last synced values are used until then.
+        """
+        while not self._sync_stop.wait(SqliteSettingsStore.SYNC_INTERVAL):
+            try:
+                self.sync()
+            except Exception as exception:
+                self.last_sync_error = exception
+            else:
+                self.last_sync_error = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Open a connection to the SQLite file. Every call gets its own connection, so the store can be used from
+        several threads.
+        :return: Returns the connection.
+        """
+        return sqlite3.connect(self.file_path, timeout=10)
+
+    @staticmethod
+    def _create_version_table(connection: sqlite3.Connection) -> None:
+        """
+        Creates the version table if it doesn't exist. A version table from before the versions were text (Version
+        INTEGER) is copied into a new table with a text Version column, since SQLite can't change the type of a
+        column.
+        :param connection: Connection to the SQLite file.
+        """
+        version_table = SqliteSettingsStore.VERSION_TABLE_NAME
+        column_types = {row[1]: row[2] for row in connection.execute(f"PRAGMA table_info({version_table})")}
+        numeric_versions = column_types.get("Version", "TEXT").upper() != "TEXT"
+        if numeric_versions:
+            connection.execute(f"ALTER TABLE {version_table} RENAME TO {version_table}Old")
+
+        connection.execute(f"CREATE TABLE IF NOT EXISTS {version_table} "
+                           "(TableName TEXT, ProfileName TEXT, Version TEXT, PRIMARY KEY (TableName, ProfileName))")
+
+        if numeric_versions:
+            connection.execute(f"INSERT INTO {version_table} (TableName, ProfileName, Version) "
+                               f"SELECT TableName, ProfileName, CAST(Version AS TEXT) FROM {version_table}Old")
+            connection.execute(f"DROP TABLE {version_table}Old")
+
+    @staticmethod
+    def _get_row_version(values: dict) -> str:
+        """
+        Gets the version of a row. The version changes whenever a value in the row changes.
+        :param values: Dictionary of the columns and values of the row.
+        :return: Returns the hex SHA-256 hash of the row.
+        """
+        row_json = json.dumps(values, sort_keys=True, default=str)
+        return hashlib.sha256(row_json.encode("utf-8")).hexdigest().upper()
+
+    @staticmethod
+    def _get_table_versions(connection: sqlite3.Connection, table_names: list, profile_name: str) -> dict:
+        """
+        Gets the versions of a profile in several tables.
+        :param connection: Connection to the SQLite file.
+        :param table_names: The names of the tables.
+        :param profile_name: Name of the profile.
+        :return: Returns a dictionary where the keys are the table names and the values are the versions of the
+            profile in those tables. (None if the profile was never written)
+        """
+        placeholders = ", ".join("?" for _ in table_names)
+        rows = connection.execute(f"SELECT TableName, Version FROM {SqliteSettingsStore.VERSION_TABLE_NAME} "
+                                  f"WHERE ProfileName = ? AND TableName IN ({placeholders})",
+                                  (profile_name, *table_names)).fetchall()
+
+        versions = dict.fromkeys(table_names)
+        versions.update(rows)
+        return versions
+
+    def _fetch_table(self, connection: sqlite3.Connection, table_name: str, profile_name: str):
+        """
+        Reads the row of a profile in a table.
+        :param connection: Connection to the SQLite file.
+        :param table_name: The name of the table.
+        :param profile_name: Name of the profile.
+        :return: Returns a dictionary of the values of the profile. Returns None if the table has no row for the
+            profile.
+        """
+        column_names = self.setting_columns[table_name]
+        row = connection.execute(f"SELECT {', '.join(column_names)} FROM {table_name} "
+                                 f"WHERE {SettingsStore.PROFILE_COLUMN} = ?", (profile_name,)).fetchone()
+        return dict(zip(column_names, row)) if row is not None else None
+
+    def _replace_row(self, connection: sqlite3.Connection, table_name: str, profile_name: str, values, version) -> None:
+        """
+        Replaces the row of a profile in a table and its version. The row is removed if values is None.
+        :param connection: Connection to the SQLite file.
+        :param table_name: The name of the table.
+        :param profile_name: Name of the profile.
+        :param values: Dictionary of the columns and values of the profile. (None to remove the profile)
+        :param version: Version of the profile.
+        """
+        if values is None:
+            connection.execute(f"DELETE FROM {table_name} WHERE {SettingsStore.PROFILE_COLUMN} = ?", (profile_name,))
+            connection.execute(f"DELETE FROM {SqliteSettingsStore.VERSION_TABLE_NAME} "
+                               "WHERE TableName = ? AND ProfileName = ?", (table_name, profile_name))
+            return
+
+        column_names = [SettingsStore.PROFILE_COLUMN, *self.setting_columns[table_name]]
+        connection.execute(f"INSERT OR REPLACE INTO {table_name} ({', '.join(column_names)}) "
+                           f"VALUES ({', '.join('?' for _ in column_names)})",
+                           [profile_name, *(values.get(column_name) for column_name in column_names[1:])])
+        connection.execute(f"INSERT OR REPLACE INTO {SqliteSettingsStore.VERSION_TABLE_NAME} "
+                           "(TableName, ProfileName, Version) VALUES (?, ?, ?)", (table_name, profile_name, version))
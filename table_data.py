@@ -1,5 +1,7 @@
+import numpy as np
 import pandas as pd
-from datetime import date
+from datetime import date, timedelta
+from awb_batch import AWBBatch
 
 
 class TableData:
@@ -9,11 +11,19 @@ class TableData:
 
       Attributes:
         - sla_data (dict) - SLA Data Dictionary
+        - sla_frame (Dataframe): Row level SLA Dataframe with the day bucket and SLA state of every AWB.
+        - sla_cube (Dataframe): Weight, Pieces and AWB Count aggregated by Destination, Route, Day Bucket and SLA
+            State.
         - day_sorter (int): Day value that was used to filter the "Days" column.
         - highest_day (int): Highest value in the "Day" Column
-        - home_delivery_awb_list (list): A list of AWB's.
+        - home_delivery_awb_batch (AWBBatch): A batch of Home Delivery AWB's.
         - shipped_awb_df (Dataframe): Shipped AWB's Dataframe
         - non_shipped_awb_df (Dataframe): Non-Shipped AWB's Dataframe
+        - history_store (HistoryStore): History store used to create the Trend Report Data
+        - weeks_back (int): Number of weeks of report history used in the Trend Report Data
+        - sla_trend_df (Dataframe): Average days AWB's stay past SLA by destination and week
+        - home_delivery_trend_df (Dataframe): Average days Home Delivery AWB's take to be allocated by community and
+            week
       Methods:
         - rename_columns: Rename columns in a Dataframe.
         - drop_columns: Drop columns in a Dataframe
@@ -24,19 +34,43 @@ class TableData:
         - sort_columns: Sort columns in a Dataframe
         - drop_empty_values: Drop empty values in a Dataframe
         - create_report_data: Creates SLA/Bot or Home Delivery Report Data
-        - get_sla_bot_data: Gets SLA Data Dictionary, Bot Data Dataframe and Highest Day Value
-        - get_awb_list: Gets a list of AWB's and AWB information
+        - get_sla_bot_data: Gets SLA Data Dictionary, Bot Data Dataframe, Highest Day Value and SLA Cube
+        - get_day_values: Gets the number of days since a date for every row in a column
+        - get_awb_batch: Gets a batch of AWB's and AWB information
         - get_home_delivery_data: Gets shipped AWB Dataframe and Non Shipped AWB Dataframe
+        - get_history_tables: Gets the tables to store in the report history
+        - get_trend_data: Gets SLA Trend Dataframe and Home Delivery Trend Dataframe
+        - get_week_labels: Gets the week label of every date in a column
     """
 
     # Valid Report constant which contains the report name and a tuple of the method name to be called along with the
     # instance attributes to be created at runtime.
     VALID_REPORTS = {
-        "SLA/Bot Report": ("_create_bot_sla_table_data", ("sla_data", "day_sorter", "highest_day")),
-        "Home Delivery Report": ("_create_home_delivery_data", ("home_delivery_awb_list", "shipped_awb_df",
-                                                                "non_shipped_awb_df"))
+        "SLA/Bot Report": ("_create_bot_sla_table_data", ("sla_data", "day_sorter", "highest_day", "sla_frame",
+                                                          "sla_cube")),
+        "Home Delivery Report": ("_create_home_delivery_data", ("home_delivery_awb_batch", "shipped_awb_df",
+                                                                "non_shipped_awb_df")),
+        "Trend Report": ("_create_trend_data", ("history_store", "weeks_back", "sla_trend_df",
+                                                "home_delivery_trend_df"))
     }
 
+    # History Tables constant which contains the report name and a dictionary of the table names stored in the
+    # report history along with the instance attribute that holds that table.
+    HISTORY_TABLES = {
+        "SLA/Bot Report": {"sla_frame": "sla_frame", "bot_df": "table_df"},
+        "Home Delivery Report": {"shipped_awb_df": "shipped_awb_df", "non_shipped_awb_df": "non_shipped_awb_df"},
+    }
+
+    # Destinations that are combined into 1 main destination in the SLA Table and SLA Cube.
+    COMMON_DESTINATIONS = {
+        "YTH Locations": ["ZAC", "XLB", "YTH", "XTL", "YBT", "XSI"],
+        "YST/WGK Locations": ["YST", "WGK"],
+    }
+
+    # Day buckets used by the SLA Cube. The bins are the edges of each bucket (Ex. 1-3 Days is (0, 3]).
+    DAY_BUCKET_BINS = [0, 3, 7, 14, 30, np.inf]
+    DAY_BUCKET_LABELS = ["1-3 Days", "4-7 Days", "8-14 Days", "15-30 Days", "31+ Days"]
+
     def __init__(self, table_data: str, report_name: str):
         """
         Initializes a TableData object with the specified table data and report name.
@@ -49,13 +83,16 @@ class TableData:
         created and initialized to `None` using the `setattr` method.
 
 
-        :param table_data: a string containing the HTML table data to be parsed
+        :param table_data: a string containing the HTML table data to be parsed. Pass in None for reports that are
+            created from the report history (Ex. Trend Report).
         :param report_name: The name of the report to be created. Must be one of the valid report names defined
             in VALID_REPORT.
         :raises KeyError: If the specified report name is not one of the valid report names defined in
             VALID_REPORT.
         """
-        self.table_df = pd.read_html(table_data)[0]
+        self.table_df = None
+        if table_data is not None:
+            self.table_df = pd.read_html(table_data)[0]
 
         if report_name not in TableData.VALID_REPORTS.keys():
             raise KeyError(f"{report_name} is not a valid report. Valid reports are "
@@ -238,9 +275,9 @@ class TableData:
     def get_sla_bot_data(self) -> tuple:
         """
         Get SLA/Bot Report Data.
-        :return: Returns a tuple of SLA Data Dictionary, Bot Data Dataframe and Highest Day Value
+        :return: Returns a tuple of SLA Data Dictionary, Bot Data Dataframe, Highest Day Value and SLA Cube
         """
-        return self.sla_data, self.table_df, self.highest_day
+        return self.sla_data, self.table_df, self.highest_day, self.sla_cube
 
     def _create_bot_sla_table_data(self) -> None:
         """
@@ -248,6 +285,7 @@ class TableData:
         """
         self._sla_bot_starting_table_data()
         self._create_sla_data()
+        self._create_sla_cube()
         self._create_bot_data()
 
     def _create_bot_data(self) -> None:
@@ -303,14 +341,22 @@ class TableData:
         TableData.convert_column_to_datatype(dataframe=self.table_df, column_name="Recvd Date",
                                              data_type="datetime64[ns]")
 
-        today_date = pd.Timestamp(date.today())
-
-        for i in range(len(self.table_df["Recvd Date"])):
-            delta = self.table_df.at[i, "Recvd Date"] - today_date
-            # Added +1 to include today's date.
-            self.table_df.at[i, "Days"] = abs(delta.days) + 1
+        self.table_df["Days"] = TableData.get_day_values(self.table_df["Recvd Date"])
         TableData.drop_columns(dataframe=self.table_df, column_names=["Recvd Date"])
 
+    @staticmethod
+    def get_day_values(date_column: pd.Series) -> pd.Series:
+        """
+        Get the number of days between every date in a column and today's date.
+
+        The difference is calculated on the whole column at once. The value is made positive and +1 is added to
+        include today's date.
+        :param date_column: Column of dates. (Must be of type datetime64[ns])
+        :return: Returns a column of the number of days.
+        """
+        today_date = pd.Timestamp(date.today())
+        return (date_column - today_date).dt.days.abs() + 1
+
     def _set_highest_day(self) -> None:
         """
         Set the highest value in the "Days" column. If empty, set to "N/A".
@@ -336,6 +382,50 @@ class TableData:
         self._remove_common_destinations()
         self._sort_sla_dictionary()
 
+    def _create_sla_cube(self) -> None:
+        """
+        Creates the SLA Cube.
+
+        The SLA Cube holds the total Weight, Pieces and AWB Count for every Destination, Route, Day Bucket and SLA
+        State. It is created in one pass over the SLA Frame, so any breakdown of the SLA data can be taken from the
+        cube without scraping the webpage again. Every Route is kept under its Destination, so a breakdown by Route
+        rolls up to the Destination. Rows without a "Recvd Date" are kept with an empty Day Bucket.
+        """
+        self._create_sla_frame()
+        self.sla_cube = self.sla_frame.groupby(["Destination", "Route", "Day Bucket", "SLA State"], observed=True,
+                                               dropna=False).agg(
+            **{"Weight": ("Weight", "sum"), "Pieces": ("Piece Count", "sum"), "AWB Count": ("AWB", "nunique")})
+
+    def _create_sla_frame(self) -> None:
+        """
+        Creates the SLA Frame.
+
+        The SLA Frame is a copy of the starting table with the header row dropped. Every row gets the number of days
+        it has been in the warehouse, the day bucket for those days, the SLA state ("Past SLA" or "Within SLA") and
+        the destination name used in the SLA Table. Rows without a "Recvd Date" are kept, since the SLA Table counts
+        them too. Their number of days and day bucket are empty (NaN).
+        """
+        sla_frame = self.table_df.drop(self.table_df.index[0]).reset_index(drop=True)
+        sla_frame = sla_frame[["Route", "AWB", "Goods Desc.", "Piece Count", "Weight", "Hours Remaining",
+                               "Recvd Date"]].copy()
+
+        sla_frame["Piece Count"] = sla_frame["Piece Count"].astype("int")
+        sla_frame["Weight"] = sla_frame["Weight"].astype("float").round().astype("int")
+        sla_frame["Recvd Date"] = sla_frame["Recvd Date"].astype("datetime64[ns]")
+        sla_frame["Days"] = TableData.get_day_values(sla_frame["Recvd Date"])
+
+        sla_frame["Day Bucket"] = pd.cut(sla_frame["Days"], bins=TableData.DAY_BUCKET_BINS,
+                                         labels=TableData.DAY_BUCKET_LABELS)
+        sla_frame["SLA State"] = np.where(sla_frame["Hours Remaining"].astype(str).str.contains("-"),
+                                          "Past SLA", "Within SLA")
+
+        # Map every common destination to the main destination name. (Ex. ZAC -> YTH Locations)
+        common_destinations = {destination: main_destination for main_destination, destinations
+                               in TableData.COMMON_DESTINATIONS.items() for destination in destinations}
+        sla_frame["Destination"] = sla_frame["Route"].replace(common_destinations)
+
+        self.sla_frame = sla_frame
+
     def _show_only_past_sla_rows(self) -> None:
         """
         Drop all rows in the "Hours Remaining" column that do NOT contain "-".
@@ -367,35 +457,19 @@ class TableData:
         up.
         """
 
-        st_theresa_common_destinations = ["YST", "WGK"]
-        thompson_common_destinations = ["ZAC", "XLB", "YTH", "XTL", "YBT", "XSI"]
+        for main_destination, common_destinations in TableData.COMMON_DESTINATIONS.items():
+            if any(destination in self.sla_data for destination in common_destinations):
+                location_sum = sum(self.sla_data[destination] and self.sla_data.pop(destination)
+                                   for destination in common_destinations if destination in self.sla_data)
+                self.sla_data[main_destination] = location_sum
 
-        if any(destination in self.sla_data for destination in thompson_common_destinations):
-            yth_location_sum = sum(self.sla_data[destination] and self.sla_data.pop(destination) for
-                                   destination in thompson_common_destinations if destination in self.sla_data)
-            self.sla_data["YTH Locations"] = yth_location_sum
-
-        if any(destination in self.sla_data for destination in st_theresa_common_destinations):
-            st_theresa_location_sum = sum(self.sla_data[destination] and self.sla_data.pop(destination)
-                                          for destination in st_theresa_common_destinations if
-                                          destination in self.sla_data)
-            self.sla_data["YST/WGK Locations"] = st_theresa_location_sum
-
-    def get_awb_list(self) -> list:
+    def get_awb_batch(self) -> AWBBatch:
         """
-        Gets a list of AWB's and AWB information and stores them in a list of dictionary's.
+        Gets a batch of AWB's and AWB information stored by column.
 
-        :return: Returns a list of AWB Dictionary's.
+        :return: Returns an AWB Batch.
         """
-        self.table_df = TableData.replace_column_str_values(dataframe=self.table_df, column_name="Consignment #",
-                                                            string_value="632-",
-                                                            replace_string_value="")
-
-        records = self.table_df.to_dict(orient="records")
-
-        awb_list = [{"AWB No.": record["Consignment #"], "Consignee": record["Consignee Name"].title(),
-                     "Community": record["To"], "No. of Pieces": record["Pieces"]} for record in records]
-        return awb_list
+        return AWBBatch.from_search_table(self.table_df)
 
     def _sort_home_delivery_awbs(self) -> None:
         """
@@ -437,7 +511,7 @@ class TableData:
         """
         Creates the Home Delivery Data.
         """
-        self.table_df = pd.DataFrame(self.home_delivery_awb_list)
+        self.table_df = self.home_delivery_awb_batch.to_dataframe()
         self._format_home_delivery_dataframe()
 
     def get_home_delivery_data(self) -> tuple:
@@ -446,3 +520,117 @@ class TableData:
         :return: Returns a tuple of Shipped AWB Dataframe and Non Shipped AWB Dataframe
         """
         return self.shipped_awb_df, self.non_shipped_awb_df
+
+    def get_history_tables(self, report_name: str) -> dict:
+        """
+        Get the tables of a report to store in the report history.
+        :param report_name: Name of the report.
+        :return: Returns a dictionary where the keys are the table names and the values are the Dataframes.
+        :raise KeyError: If the specified report name is not one of the valid report names defined in
+            HISTORY_TABLES.
+        """
+        if report_name not in TableData.HISTORY_TABLES.keys():
+            raise KeyError(f"{report_name} is not a valid report. Valid reports are "
+                           f"{' or '.join(TableData.HISTORY_TABLES.keys())}")
+
+        return {table_name: getattr(self, attribute_name)
+                for table_name, attribute_name in TableData.HISTORY_TABLES[report_name].items()}
+
+    @staticmethod
+    def get_week_labels(date_column: pd.Series) -> pd.Series:
+        """
+        Get the week label of every date in a column. The week starts on Monday. (Ex. 'Week of 2023-03-20')
+        :param date_column: Column of dates. (Must be of type datetime64[ns])
+        :return: Returns a column of week labels.
+        """
+        week_start = date_column - pd.to_timedelta(date_column.dt.weekday, unit="D")
+        return "Week of " + week_start.dt.strftime("%Y-%m-%d")
+
+    def _create_trend_data(self) -> None:
+        """
+        Creates the Trend Report Data from the report history.
+        """
+        start_date = date.today() - timedelta(weeks=self.weeks_back)
+        self._create_sla_trend_data(start_date)
+        self._create_home_delivery_trend_data(start_date)
+
+    def _create_sla_trend_data(self, start_date: date) -> None:
+        """
+        Creates the SLA Trend Data.
+
+        Loads every past SLA row since the start date indexed by AWB and run date. The number of days an AWB stayed
+        past SLA is the number of days between the first and last run it was past SLA (+1 to include the first day).
+        The AWB is counted in the week of the last run it was past SLA.
+        :param start_date: First run date to use.
+        """
+        sla_history = self.history_store.load_indexed_table(table_name="sla_frame", index_columns=["AWB", "Run Date"],
+                                                            start_date=start_date,
+                                                            columns=["AWB", "Destination", "SLA State"])
+        sla_history = sla_history[sla_history["SLA State"] == "Past SLA"]
+
+        run_dates = sla_history.index.get_level_values("Run Date")
+        awb_history = sla_history.assign(**{"First Run": run_dates, "Last Run": run_dates}).groupby(level="AWB").agg(
+            **{"Destination": ("Destination", "last"), "First Run": ("First Run", "min"),
+               "Last Run": ("Last Run", "max")})
+
+        awb_history["Days Past SLA"] = (awb_history["Last Run"] - awb_history["First Run"]).dt.days + 1
+        awb_history["Week"] = TableData.get_week_labels(awb_history["Last Run"])
+
+        self.sla_trend_df = TableData._create_weekly_pivot(dataframe=awb_history, index="Destination",
+                                                           values="Days Past SLA")
+
+    def _create_home_delivery_trend_data(self, start_date: date) -> None:
+        """
+        Creates the Home Delivery Trend Data.
+
+        Loads every shipped and non-shipped AWB row since the start date indexed by AWB and run date. The number of
+        days an AWB took to be allocated is the number of days between the first run it was listed and the first run it
+        was shipped. The AWB is counted in the week it was shipped. AWB's that are not shipped yet are not counted.
+        :param start_date: First run date to use.
+        """
+        columns = ["AWB No.", "Community"]
+        shipped_history = self.history_store.load_indexed_table(table_name="shipped_awb_df",
+                                                                index_columns=["AWB No.", "Run Date"],
+                                                                start_date=start_date, columns=columns)
+        non_shipped_history = self.history_store.load_indexed_table(table_name="non_shipped_awb_df",
+                                                                    index_columns=["AWB No.", "Run Date"],
+                                                                    start_date=start_date, columns=columns)
+
+        first_listed = pd.concat([shipped_history, non_shipped_history]).reset_index(level="Run Date").groupby(
+            level="AWB No.")["Run Date"].min()
+        first_allocated = shipped_history.reset_index(level="Run Date").groupby(level="AWB No.").agg(
+            **{"Community": ("Community", "last"), "Allocated Run": ("Run Date", "min")})
+
+        # Only the shipped AWB's are in first_allocated, so join on its index.
+        awb_history = first_allocated.join(first_listed.rename("Listed Run"))
+        awb_history["Days To Allocated"] = (awb_history["Allocated Run"] - awb_history["Listed Run"]).dt.days
+        awb_history["Week"] = TableData.get_week_labels(awb_history["Allocated Run"])
+
+        self.home_delivery_trend_df = TableData._create_weekly_pivot(dataframe=awb_history, index="Community",
+                                                                     values="Days To Allocated")
+
+    @staticmethod
+    def _create_weekly_pivot(dataframe: pd.DataFrame, index: str, values: str) -> pd.DataFrame:
+        """
+        Create a pivot table of the average value by week.
+
+        :param dataframe: Dataframe with a "Week" column.
+        :param index: Column to use as the rows. (Ex. 'Destination')
+        :param values: Column to average. (Ex. 'Days Past SLA')
+        :return: Returns the pivot table with a column for every week and an "All Weeks" column.
+        """
+        if dataframe.empty:
+            return pd.DataFrame(index=pd.Index([], name=index))
+
+        pivot_df = dataframe.pivot_table(index=index, columns="Week", values=values, aggfunc="mean")
+        pivot_df["All Weeks"] = dataframe.groupby(index)[values].mean()
+        pivot_df.columns.name = None
+
+        return pivot_df.round(1).sort_values(by="All Weeks", ascending=False)
+
+    def get_trend_data(self) -> tuple:
+        """
+        Get Trend Report Data.
+        :return: Returns a tuple of SLA Trend Dataframe and Home Delivery Trend Dataframe
+        """
+        return self.sla_trend_df, self.home_delivery_trend_df
@@ -98,28 +98,30 @@ class WebpageData:
         return new_date_string
 
     @staticmethod
-    def get_setting_values(setting_group: str) -> dict:
+    def get_setting_values(setting_group: str, profile_name: str = None) -> dict:
         """
         Get the settings values for a specific setting group.
 
         This method will get the setting values which are stored in a database. It will obtain the values based on
-        the setting group of "SLA" or "Home" It will also update the dictionary to add a
+        the setting group of "SLA" or "Home" and the settings profile. It will also update the dictionary to add a
         new item of 'Date' to the dictionary to be used to fill in dates on the Cargo Webpage.
 
         :param setting_group: Setting group you want to get. (Valid Options: "SLA/Bot" or "Home").
+        :param profile_name: Name of the settings profile. (Default: None [SettingsData.DEFAULT_PROFILE])
         :return: Returns a dictionary of the settings.
         :raise ValueError: Will raise error if the correct setting group is not passed in. Valid Settings Groups:
             'SLA' or 'Home'.
+        :raise KeyError: Will raise error if the setting group has no settings profile with that name.
         """
 
         settings = SettingsData()
 
         if setting_group.upper() == "SLA":
-            sla_dict = settings.get_bot_sla_data()
+            sla_dict = settings.get_bot_sla_data(profile_name=profile_name)
             WebpageData._update_setting_dictionary(sla_dict)
             return sla_dict
         elif setting_group.upper() == "HOME":
-            home_dict = settings.get_home_delivery_data()
+            home_dict = settings.get_home_delivery_data(profile_name=profile_name)
             WebpageData._update_setting_dictionary(home_dict)
             return home_dict
         else:
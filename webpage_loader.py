@@ -5,7 +5,10 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import Select
+from concurrent.futures import CancelledError
+import threading
 import time
+from awb_batch import AWBBatch
 from utils import type_check
 from webpage_data import WebpageData
 from typing import Union
@@ -18,6 +21,7 @@ class CargoWebpage:
       Attributes:
         - driver (WebDriver): The Selenium WebDriver instance used to interact with the webpage.
         - webpage_data (WebpageData) - Instantiate the WebpageData class.
+        - form_settings (dict): Setting values used to fill in the last form.
 
       Methods:
         - load_url: Load the given URL in the web driver.
@@ -43,6 +47,7 @@ class CargoWebpage:
         self.driver = None
         self.webpage_data = WebpageData()
         self.script_running = False
+        self.form_settings = None
 
     def load_url(self, url: str) -> None:
         """
@@ -138,12 +143,15 @@ class CargoWebpage:
             return True
         return False
 
-    def fill_in_waybills_form(self) -> tuple:
+    def fill_in_waybills_form(self, profile_name: str = None, quit_driver: bool = True) -> tuple:
         """
         Fills in the Waybills To Ship form on the Cargo Webpage.
 
         The method will fill in the Waybills to Ship form on the Cargo Webpage. It will pull data from the setting
         database and use any of the values necessary to fill in the form.
+        :param profile_name: Name of the settings profile to fill in the form with. (Default: None [Default profile])
+        :param quit_driver: Quit Selenium once the table is extracted. Set to False to fill in the form again in the
+            same browser session. (Default: True)
         :return: Returns a tuple of the HTML table generated from the form as well as the "DayAmount" setting value
         from the Database.
         """
@@ -156,7 +164,8 @@ class CargoWebpage:
         search_button = self.driver.find_element(By.XPATH, "//button[@id='btn_search75']")
 
         # Get Setting Values for SLA/Bot Settings to fill in form with appropriate settings.
-        sla_bot_data = WebpageData.get_setting_values("SLA")
+        sla_bot_data = WebpageData.get_setting_values("SLA", profile_name=profile_name)
+        self.form_settings = sla_bot_data
 
         # Clear the date field, or it will cause issues inputting the date.
         from_date_field.clear()
@@ -181,7 +190,8 @@ class CargoWebpage:
         # Get Entire HTML Code for table element.
         waybill_html = waybill_table.get_attribute('outerHTML')
 
-        self.quit_selenium()
+        if quit_driver:
+            self.quit_selenium()
 
         return waybill_html, sla_bot_data["DayAmount"]
 
@@ -196,12 +206,13 @@ class CargoWebpage:
             return True
         return False
 
-    def fill_in_search_form(self) -> Union[str, int]:
+    def fill_in_search_form(self, profile_name: str = None) -> Union[str, int]:
         """
         Fills in the Search AWB form on the Cargo Webpage.
 
         This method will fill in the Search AWB form. It will pull data from the setting
         database and use any of the values necessary to fill in the form.
+        :param profile_name: Name of the settings profile to fill in the form with. (Default: None [Default profile])
         :return: Returns a string of the HTML table if AWB's can be found. Otherwise, False.
         """
         from_date_field = self.driver.find_element(By.XPATH, "//input[@id='txt_date_range_from']")
@@ -214,7 +225,8 @@ class CargoWebpage:
         search_button = self.driver.find_element(By.XPATH, "//button[@id='btn_search']")
 
         # Get Setting Values for Home Delivery Settings to fill in form with appropriate settings.
-        home_delivery_data = WebpageData.get_setting_values("Home")
+        home_delivery_data = WebpageData.get_setting_values("Home", profile_name=profile_name)
+        self.form_settings = home_delivery_data
 
         from_date_field.send_keys(home_delivery_data["Date"])
         Select(from_airport_field).select_by_value(home_delivery_data["FromAirport"])
@@ -247,17 +259,21 @@ class CargoWebpage:
             self.quit_selenium()
             raise TimeoutException("Could not locate the element: /html/body/div[7]/div[5]/div[2]/div/table")
 
-    def search_awb(self, awb_list: list) -> list:
+    def search_awb(self, awb_batch: AWBBatch, quit_driver: bool = True,
+                   cancel_event: threading.Event = None) -> AWBBatch:
         """
-        Method will search every AWB in the list passed in on the Search AWB form.
-
-        Method will load the search AWB page. It will loop through the list of AWB's passed in as an argument (List of
-        dictionarys of AWB's). It will then check if it finds certain text on the AWB Pop Up Modal Page.
-        If it does it will add the Flight information to that specific dictionary in the awb_info list. If it doesn't
-        it will remove that dictionary of that awb from awb_info list. Returns the list of home delivery AWB's.
-
-        :param awb_list: List of dictionarys that contain AWB's.
-        :return: List of dictionarys that are the Home Delivery AWB's.
+        Method will search every AWB in the batch passed in on the Search AWB form.
+
+        Method will load the search AWB page. It will loop through the batch of AWB's passed in as an argument. It
+        will then check if it finds certain text on the AWB Pop Up Modal Page. If it does it will set the Flight
+        information of that AWB in the batch and keep its position. Returns a batch of only the home delivery AWB's.
+
+        :param awb_batch: Batch of AWB's.
+        :param quit_driver: Quit Selenium once every AWB is searched. Set to False to keep using the same browser
+            session. (Default: True)
+        :param cancel_event: Event that stops the search before the next AWB once it is set. (Default: None)
+        :return: Batch of the Home Delivery AWB's.
+        :raise CancelledError: Will raise error if the cancel event is set during the search.
         """
         self.load_url(self.webpage_data.get_search_awb_url())
         awb_field = self.driver.find_element(By.XPATH, "/html/body/div[7]/form/div/div[1]"
@@ -265,23 +281,25 @@ class CargoWebpage:
         close_awb_modal = self.driver.find_element(By.XPATH, "/html/body/div[7]/div[6]/div/div/div[1]/button")
         search_button = self.driver.find_element(By.XPATH, "//button[@id='btn_search']")
 
-        awb_info = awb_list.copy()
+        home_delivery_positions = []
 
-        for i in reversed(range(len(awb_list))):
-            awb = awb_list[i].get("AWB No.")
+        for position, awb in enumerate(awb_batch.awb_numbers):
+            if cancel_event is not None and cancel_event.is_set():
+                raise CancelledError(f"The AWB search was cancelled after {position} of "
+                                     f"{len(awb_batch.awb_numbers)} AWB's.")
 
             awb_field.send_keys(awb)
             search_button.click()
             if self._check_home_delivery_text():
-                awb_info[i].update(self._get_status_of_awb())
-            else:
-                awb_info.pop(i)
+                awb_batch.set_status(position, self._get_status_of_awb())
+                home_delivery_positions.append(position)
             close_awb_modal.click()
             awb_field.clear()
 
-        self.quit_selenium()
+        if quit_driver:
+            self.quit_selenium()
 
-        return awb_info
+        return awb_batch.select(home_delivery_positions)
 
     def _check_home_delivery_text(self) -> bool:
         """
@@ -302,7 +320,7 @@ class CargoWebpage:
 
         Method wll check if an AWB has been shipped. There are cases where an AWB may not have been created properly,
         if it finds an AWB has been correct incorreclty, it will get the status message of that AWB return it back to
-        specific awb dictionary. If there is no error, it will obtain the shipped flight
+        specific awb in the batch. If there is no error, it will obtain the shipped flight
         information about that AWB and return it back to that AWB.
 
         :return: Returns a dictionary of flight information or status information (if AWB isn't created properly).